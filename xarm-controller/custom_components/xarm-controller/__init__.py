@@ -1,14 +1,19 @@
+from importlib import import_module
+from time import monotonic
+
 from homeassistant import core
 from homeassistant.config_entries import ConfigType, ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.const import Platform
 
-from .const import DOMAIN, LOGGER, MOVE_ARM_EVENT
-
-from .coordinator import XArmControllerUpdateCoordinator
+from .const import DATA_CONNECTION_MANAGER, DOMAIN, LOGGER, MOVE_ARM_EVENT
 
-from xarm.wrapper import XArmAPI
+from .codes import CODE_TABLES
+from .coordinator import XArmControllerUpdateCoordinator, reload_settings
+from .manager import async_get_manager
+from .metrics import XArmMetricsView
+from .services import async_setup_services
 
 type XArmConfigEntry = ConfigEntry[XArmControllerUpdateCoordinator]
 
@@ -27,7 +32,14 @@ async def async_setup_entry(
 ) -> bool:
     """Set up the xarm-controller-platform component."""
 
-    coordinator = XArmControllerUpdateCoordinator(hass=hass, entry=entry)
+    started = monotonic()
+    # The SDK is only loaded once an arm is configured, and off the event loop.
+    await hass.async_add_import_executor_job(_load_sdk)
+    sdk_loaded = monotonic()
+
+    coordinator = XArmControllerUpdateCoordinator(
+        hass=hass, entry=entry, manager=async_get_manager(hass)
+    )
 
     # await coordinator.async_config_entry_first_refresh()
 
@@ -58,6 +70,14 @@ async def async_setup_entry(
         return True
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.startup_timings.update(
+        sdk_import=sdk_loaded - started, platforms=monotonic() - sdk_loaded
+    )
+    # Entities start unavailable and go live once the arm is connected, the
+    # setup (and Home Assistant's startup) doesn't wait for the controller.
+    entry.async_create_background_task(
+        hass, coordinator.async_start(), f"{DOMAIN} connect {entry.title}"
+    )
 
     # async def move_xarm(call: core.ServiceCall):
     #     """Handle the service call."""
@@ -77,16 +97,42 @@ async def async_setup_entry(
 
 async def async_unload_entry(hass: core.HomeAssistant, entry: XArmConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await async_release_coordinator(hass, entry)
+    return unload_ok
+
+
+def _load_sdk() -> None:
+    """Import the xArm SDK and decode its code tables, in the import executor."""
+    import_module("xarm.wrapper")
+    for table in CODE_TABLES:
+        table.load()
+
+
+async def async_release_coordinator(hass: core.HomeAssistant, entry: XArmConfigEntry) -> None:
+    """Shut down the entry's coordinator, and the shared worker pool with the last arm."""
+    coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    await coordinator.async_shutdown()
+    if not coordinator.manager.coordinators:
+        # Last arm gone, release the shared worker pool.
+        hass.data[DOMAIN].pop(DATA_CONNECTION_MANAGER).shutdown()
 
 
 async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
     """Set up the XARM controller component from yaml configuration."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
+    if "http" in hass.config.components:
+        hass.http.register_view(XArmMetricsView())
     return True
 
 
 async def async_reload_entry(hass: core.HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when it changed."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is not None and coordinator.settings == reload_settings(entry):
+        # Only the capability profile was stored, the coordinator reloads itself if it changed.
+        return
     LOGGER.debug("Async Setup Reload")
     await hass.config_entries.async_reload(entry.entry_id)
@@ -7,12 +7,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
     BinarySensorEntity,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ERROR_CODE, WARN_CODE, GRIPPER_ERROR_CODE, LOGGER
-from .coordinator import XArmControllerUpdateCoordinator
+from .coordinator import XArmControllerUpdateCoordinator, listener_groups
+from .models import Capabilities
 # from .entity import XArmControllerEntity
 
 
@@ -32,6 +34,8 @@ class XArmControllerBinarySensorEntityDescription(
     available_fn: Callable[..., bool] = lambda _: True
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
+    # Qualified model fields ("state.error_code") the state depends on, used to skip unchanged writes.
+    fields: tuple[str, ...] = ()
 
 
 BINARY_SENSORS: tuple[XArmControllerBinarySensorEntityDescription] = (
@@ -41,9 +45,11 @@ BINARY_SENSORS: tuple[XArmControllerBinarySensorEntityDescription] = (
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
         is_on_fn=lambda device: device.state.error_code != 0,
+        fields=("state.error_code", "state.error_msg"),
         extra_attributes=lambda device: {
             "error_msg": device.state.error_msg,
             "error_code": device.state.error_code,
+            "error_action": device.state.error.action,
         },
     ),
     XArmControllerBinarySensorEntityDescription(
@@ -52,9 +58,11 @@ BINARY_SENSORS: tuple[XArmControllerBinarySensorEntityDescription] = (
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
         is_on_fn=lambda device: device.state.warn_code != 0,
+        fields=("state.warn_code", "state.warn_msg"),
         extra_attributes=lambda device: {
             "warn_msg": device.state.warn_msg,
             "warn_code": device.state.warn_code,
+            "warn_action": device.state.warn.action,
         },
     ),
     XArmControllerBinarySensorEntityDescription(
@@ -63,9 +71,12 @@ BINARY_SENSORS: tuple[XArmControllerBinarySensorEntityDescription] = (
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
         is_on_fn=lambda device: device.gripper.error_code != 0,
+        fields=("gripper.error_code", "gripper.error_msg"),
+        exists_fn=lambda coordinator: coordinator.capabilities.gripper,
         extra_attributes=lambda device: {
             "gripper_error_msg": device.gripper.error_msg,
             "gripper_error_code": device.gripper.error_code,
+            "gripper_error_action": device.gripper.error.action,
         },
     ),
 )
@@ -79,12 +90,18 @@ async def async_setup_entry(
     """Set up XArm Controller binary sensor based on a config entry."""
     coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for sensor in BINARY_SENSORS:
-        if sensor.exists_fn(coordinator):
-            async_add_entities([XArmControllerBinarySensor(coordinator, sensor, entry)])
+    @callback
+    def async_add_binary_sensors(capabilities: Capabilities) -> None:
+        async_add_entities(
+            XArmControllerBinarySensor(coordinator, sensor, entry)
+            for sensor in BINARY_SENSORS
+            if sensor.exists_fn(coordinator)
+        )
+
+    coordinator.async_on_capabilities(async_add_binary_sensors)
 
 
-class XArmControllerBinarySensor(BinarySensorEntity):
+class XArmControllerBinarySensor(CoordinatorEntity[XArmControllerUpdateCoordinator], BinarySensorEntity):
     """Representation of a XArm Controller binary sensor that is updated via the XArmAPI."""
 
     def __init__(
@@ -94,12 +111,17 @@ class XArmControllerBinarySensor(BinarySensorEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        # super().__init__(coordinator=coordinator)
-        self.coordinator = coordinator
+        super().__init__(coordinator, listener_groups(description.fields))
         self.entity_description = description
         xarm_info = self.coordinator.get_xarm_model().info
         self._attr_unique_id = f"{xarm_info.serial}_{description.key}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the fields backing this sensor changed."""
+        if self.coordinator.fields_changed(self.entity_description.fields):
+            self.async_write_ha_state()
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -3,16 +3,26 @@ from collections.abc import Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
     ButtonDeviceClass,
 )
-from .const import DOMAIN, LOGGER
-from .coordinator import XArmControllerUpdateCoordinator
+from .const import (
+    DOMAIN,
+    GRIPPER_CLOSED_POSITION,
+    GRIPPER_OPEN_POSITION,
+    GROUP_GRIPPER,
+    GROUP_POSITION,
+    GROUP_STATE,
+    LOGGER,
+)
+from .coordinator import AVAILABILITY_FIELD, XArmControllerUpdateCoordinator, listener_groups
+from .models import Capabilities
 
 
 @dataclass
@@ -29,6 +39,15 @@ class XArmControllerButtonEntityDescription(
     """Button entity description for XArm Controller."""
 
     available_fn: Callable[..., bool] = lambda _: True
+    exists_fn: Callable[..., bool] = lambda _: True
+    # Qualified model fields available_fn reads, the button is only woken for them.
+    fields: tuple[str, ...] = (AVAILABILITY_FIELD,)
+    # Model groups to poll once the action has been sent to the arm.
+    refresh_groups: tuple[str, ...] = (GROUP_STATE, GROUP_POSITION)
+    # Stop commands skip the arm's command queue and flush it.
+    priority: bool = False
+    # Gripper position the action moves to, the gripper is followed until it gets there.
+    gripper_target: int | None = None
 
 
 BUTTONS: tuple[XArmControllerButtonEntityDescription, ...] = (
@@ -38,6 +57,7 @@ BUTTONS: tuple[XArmControllerButtonEntityDescription, ...] = (
         icon="mdi:alert-octagon",
         action_fn=lambda device: device.emergency_stop(),
         available_fn=lambda device: device.state.connected,
+        priority=True,
         entity_category=EntityCategory.CONFIG,
     ),
     XArmControllerButtonEntityDescription(
@@ -61,7 +81,10 @@ BUTTONS: tuple[XArmControllerButtonEntityDescription, ...] = (
         name="Open Gripper",
         icon="mdi:lock-open-variant-outline",
         action_fn=lambda device: device.open_gripper(),
+        refresh_groups=(GROUP_GRIPPER,),
+        gripper_target=GRIPPER_OPEN_POSITION,
         available_fn=lambda device: device.state.connected,
+        exists_fn=lambda coordinator: coordinator.capabilities.can_grip,
         entity_category=EntityCategory.CONFIG,
     ),
     XArmControllerButtonEntityDescription(
@@ -70,14 +93,21 @@ BUTTONS: tuple[XArmControllerButtonEntityDescription, ...] = (
         icon="mdi:lock-outline",
         action_fn=lambda device: device.close_gripper(),
         available_fn=lambda device: device.state.connected,
+        exists_fn=lambda coordinator: coordinator.capabilities.can_grip,
+        refresh_groups=(GROUP_GRIPPER,),
+        gripper_target=GRIPPER_CLOSED_POSITION,
         entity_category=EntityCategory.CONFIG,
     ),
     XArmControllerButtonEntityDescription(
         key="stop_gripper_button",
         name="Stop Gripper",
         icon="mdi:alert-octagon",
-        available_fn=lambda device: device.info.is_lite6,
-        action_fn=lambda device: device.close_gripper(),
+        available_fn=lambda device: device.state.connected,
+        # Only the Lite 6 gripper can be stopped.
+        exists_fn=lambda coordinator: coordinator.capabilities.is_lite6,
+        action_fn=lambda device: device.stop_gripper(),
+        refresh_groups=(GROUP_GRIPPER,),
+        priority=True,
         entity_category=EntityCategory.CONFIG,
     ),
     XArmControllerButtonEntityDescription(
@@ -97,17 +127,27 @@ async def async_setup_entry(
     LOGGER.debug("BUTTON::async_setup_entry")
     coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for description in BUTTONS:
-        async_add_entities([XArmControllerButton(coordinator, description, entry)])
+    @callback
+    def async_add_buttons(capabilities: Capabilities) -> None:
+        async_add_entities(
+            XArmControllerButton(coordinator, description, entry)
+            for description in BUTTONS
+            if description.exists_fn(coordinator)
+        )
+
+    coordinator.async_on_capabilities(async_add_buttons)
 
     LOGGER.debug("BUTTON::async_setup_entry DONE")
 
 
-class XArmControllerButton(ButtonEntity):
-    """Define the Button."""
+class XArmControllerButton(CoordinatorEntity[XArmControllerUpdateCoordinator], ButtonEntity):
+    """Define the Button.
+
+    A coordinator entity so its availability follows the connection, which
+    comes up in the background after the entity was added.
+    """
 
     entity_description: XArmControllerButtonEntityDescription
-    coordinator: XArmControllerUpdateCoordinator
 
     def __init__(
         self,
@@ -115,11 +155,17 @@ class XArmControllerButton(ButtonEntity):
         description: XArmControllerButtonEntityDescription,
         entry: ConfigEntry,
     ) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator, listener_groups(description.fields))
         self.entity_description = description
         xarm_info = self.coordinator.get_xarm_model().info
         self._attr_unique_id = f"{xarm_info.serial}_{description.key}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a field the availability depends on changed."""
+        if self.coordinator.fields_changed(self.entity_description.fields):
+            self.async_write_ha_state()
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -141,5 +187,21 @@ class XArmControllerButton(ButtonEntity):
     async def async_press(self) -> None:
         """Pause the Print on button press"""
         LOGGER.debug(f"Button Pressed: {self.entity_description.key}")
-        self.entity_description.action_fn(self.coordinator.get_xarm_model())
-        # await self.coordinator.async_request_refresh()
+        if self.entity_description.priority:
+            run_command = self.coordinator.async_run_priority_command
+        else:
+            run_command = self.coordinator.async_run_command
+        await run_command(
+            self.entity_description.key,
+            self.entity_description.action_fn,
+            self.coordinator.get_xarm_model(),
+        )
+        self.coordinator.async_request_poll(*self.entity_description.refresh_groups)
+        if (
+            self.entity_description.gripper_target is not None
+            and self.coordinator.get_xarm_model().gripper.present
+        ):
+            # The command returns at once, the gripper entities catch up as it moves.
+            # The Lite 6 gripper has no position to follow.
+            self.coordinator.motion.async_gripper_motion(self.entity_description.gripper_target)
+            self.coordinator.motion.async_gripper_motion_sent()
@@ -0,0 +1,100 @@
+"""Coalescing of high-rate xArm reports before they reach the entities."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from threading import Lock
+from time import monotonic, perf_counter
+
+from homeassistant.core import callback
+
+# Reports that arrive continuously while the arm moves. Anything else (state,
+# error/warn, mode...) is flushed straight away so it is never held back.
+COALESCED_KEYS = ("cartesian", "joints")
+
+
+class ReportCoalescer:
+    """Merge bursts of SDK reports into one latest-value snapshot per flush.
+
+    push() is called on the SDK report thread. Reports are merged key by key
+    into a pending snapshot, and the snapshot is handed to flush_fn on the
+    event loop at most max_rate times per second.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        flush_fn: Callable[[dict], None],
+        max_rate: float,
+        coalesced_keys: Iterable[str] = COALESCED_KEYS,
+    ) -> None:
+        self._loop = loop
+        self._flush_fn = flush_fn
+        self._interval = 1 / max_rate
+        self._coalesced_keys = frozenset(coalesced_keys)
+        self._lock = Lock()
+        self._pending: dict = {}
+        self._scheduled = False
+        self._scheduled_urgent = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._last_flush = 0.0
+        self.received = 0
+        self.flushed = 0
+        # Seconds spent in flush_fn on the event loop.
+        self.flush_time = 0.0
+
+    @property
+    def max_rate(self) -> float:
+        """Return the maximum number of flushes per second."""
+        return 1 / self._interval
+
+    @property
+    def reduction(self) -> float:
+        """Return how many received reports were folded into each flush."""
+        return self.received / self.flushed if self.flushed else 0.0
+
+    def push(self, event: dict) -> None:
+        """Merge a report into the pending snapshot. Safe to call from any thread."""
+        urgent = not self._coalesced_keys.issuperset(event)
+        with self._lock:
+            self.received += 1
+            self._pending.update(event)
+            if self._scheduled and (self._scheduled_urgent or not urgent):
+                return
+            self._scheduled = True
+            self._scheduled_urgent = urgent
+        self._loop.call_soon_threadsafe(self._async_schedule_flush, urgent)
+
+    @callback
+    def _async_schedule_flush(self, urgent: bool) -> None:
+        if self._timer is not None:
+            if not urgent:
+                return
+            # A state or error report shouldn't wait for the position rate limit.
+            self._timer.cancel()
+        delay = 0.0 if urgent else max(0.0, self._last_flush + self._interval - monotonic())
+        self._timer = self._loop.call_later(delay, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        self._timer = None
+        with self._lock:
+            event, self._pending = self._pending, {}
+            self._scheduled = self._scheduled_urgent = False
+        self._last_flush = monotonic()
+        if event:
+            self.flushed += 1
+            started = perf_counter()
+            self._flush_fn(event)
+            self.flush_time += perf_counter() - started
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any pending snapshot."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        with self._lock:
+            self._pending = {}
+            self._scheduled = self._scheduled_urgent = False
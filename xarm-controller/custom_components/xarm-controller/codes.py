@@ -0,0 +1,102 @@
+"""Decoding of the error and warning codes reported by the xArm controller."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib import import_module
+
+from .const import GRIPPER_ERROR_CODES, WARN_CODES
+
+SEVERITY_OK = "ok"
+SEVERITY_WARNING = "warning"
+SEVERITY_ERROR = "error"
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedCode:
+    """A controller code with what it means and what to do about it."""
+
+    code: int
+    severity: str
+    message: str
+    # Empty when the SDK gives no advice for the code.
+    action: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.severity == SEVERITY_OK
+
+
+class CodeTable:
+    """Decoded codes of one kind, built once so a lookup is a single dict hit.
+
+    Messages come from the integration's own tables where it has one and
+    from the SDK code map otherwise, recommended actions always come from
+    the SDK. The SDK map is only imported when the table is first used, see
+    load(). Codes missing from both are decoded on first sight and kept as
+    well.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        severity: str,
+        sdk_map: str | None,
+        messages: dict[int, str] | None = None,
+    ) -> None:
+        self.kind = kind
+        self.severity = severity
+        # Name of the code map in xarm.core.config.x_code.
+        self._sdk_map = sdk_map
+        self._messages = messages or {}
+        self._other_action = ""
+        self._decoded: dict[int, DecodedCode] = {}
+        self._loaded = False
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._decoded)
+
+    def load(self) -> None:
+        """Decode every known code, importing the SDK code map (slow, not on the event loop)."""
+        if self._loaded:
+            return
+        sdk_map = (
+            getattr(import_module("xarm.core.config.x_code"), self._sdk_map)
+            if self._sdk_map
+            else {}
+        )
+        messages = self._messages
+        self._other_action = sdk_map.get("other", {}).get("en", {}).get("desc", "")
+        decoded = {
+            code: DecodedCode(
+                code,
+                self.severity,
+                messages.get(code) or sdk_map.get(code, {}).get("en", {}).get("title", ""),
+                sdk_map.get(code, {}).get("en", {}).get("desc", ""),
+            )
+            for code in {*messages, *(key for key in sdk_map if isinstance(key, int))}
+        }
+        decoded[0] = DecodedCode(0, SEVERITY_OK, messages.get(0, "Normal"))
+        self._decoded = decoded
+        self._loaded = True
+
+    def decode(self, code: int) -> DecodedCode:
+        decoded = self._decoded.get(code)
+        if decoded is None:
+            if not self._loaded:
+                self.load()
+                return self.decode(code)
+            decoded = self._decoded[code] = DecodedCode(
+                code, self.severity, f"Unknown {self.kind} {code}", self._other_action
+            )
+        return decoded
+
+
+CONTROLLER_ERRORS = CodeTable("controller error", SEVERITY_ERROR, "ControllerErrorCodeMap")
+CONTROLLER_WARNINGS = CodeTable(
+    "controller warning", SEVERITY_WARNING, "ControllerWarnCodeMap", WARN_CODES
+)
+GRIPPER_ERRORS = CodeTable("gripper error", SEVERITY_ERROR, "GripperErrorCodeMap", GRIPPER_ERROR_CODES)
+SERVO_ERRORS = CodeTable("servo error", SEVERITY_ERROR, "ServoCodeMap")
+CODE_TABLES = (CONTROLLER_ERRORS, CONTROLLER_WARNINGS, GRIPPER_ERRORS, SERVO_ERRORS)
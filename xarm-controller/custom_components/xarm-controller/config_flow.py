@@ -1,9 +1,14 @@
+import asyncio
+from dataclasses import asdict, dataclass
 from enum import StrEnum
+from ipaddress import IPv4Network, IPv6Network, ip_network
 import logging
+from time import monotonic
 import voluptuous as vol
 from typing import Any, Dict, Optional
 from homeassistant import config_entries, core
 from homeassistant import data_entry_flow
+from homeassistant.core import callback
 from homeassistant.const import CONF_HOST, CONF_MODEL, ATTR_SERIAL_NUMBER, CONF_NAME
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.selector import (
@@ -12,11 +17,44 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
     SelectSelectorMode,
 )
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from ping3 import ping
-from xarm.wrapper import XArmAPI
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
+from homeassistant.components import network
+from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .const import (
+    CONF_ANGLE_DEADBAND,
+    CONF_ANGLE_RELATIVE_DEADBAND,
+    CONF_CAPABILITIES,
+    CONF_CURRENT_DEADBAND,
+    CONF_CURRENT_RELATIVE_DEADBAND,
+    CONF_MAX_UPDATE_RATE,
+    CONF_METRICS,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_POSITION_DEADBAND,
+    CONF_POSITION_RELATIVE_DEADBAND,
+    CONF_SUBNET,
+    DATA_PROBE_CACHE,
+    DEFAULT_ANGLE_DEADBAND,
+    DEFAULT_ANGLE_RELATIVE_DEADBAND,
+    DEFAULT_CURRENT_DEADBAND,
+    DEFAULT_CURRENT_RELATIVE_DEADBAND,
+    DEFAULT_DISCOVERY_SUBNET,
+    DEFAULT_MAX_UPDATE_RATE,
+    DEFAULT_METRICS,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_POSITION_DEADBAND,
+    DEFAULT_POSITION_RELATIVE_DEADBAND,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    MODEL_NAMES,
+    PROBE_CACHE_TTL,
+    PROBE_TIMEOUT,
+    XARM_PORT,
+)
+from .models import Capabilities, is_lite6
+from .simulator import SIMULATOR_HOST, SimulatedXArmAPI
 
 
 class XArmModels(StrEnum):
@@ -44,18 +82,123 @@ HOST_SCHEMA = vol.Schema(
     }
 )
 
+# Relative deadbands are entered in percent of the last written value.
+_PERCENT = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Identity of a controller read during the config flow."""
+
+    host: str
+    serial: str
+    device_type: int
+    axis: int
+    version: str
+    is_lite6: bool = False
+    gripper: bool = False
+
+    @property
+    def model(self) -> str:
+        return MODEL_NAMES.get(self.device_type, f"xArm ({self.device_type})")
+
+    @property
+    def capabilities(self) -> Capabilities:
+        return Capabilities(self.axis, self.is_lite6, self.gripper)
+
+
+class CannotConnect(HomeAssistantError):
+    """The controller did not complete the handshake."""
+
+
+def _probe_controller(host: str) -> ProbeResult:
+    """Connect, read the controller's identity and disconnect. Runs in the executor."""
+    if host == SIMULATOR_HOST:
+        api = SimulatedXArmAPI
+    else:
+        # Imported here, in the executor, so loading the flow doesn't load the SDK.
+        from xarm.wrapper import XArmAPI as api
+    try:
+        client = api(host)
+    except Exception as error:
+        # The SDK raises plain Exceptions when the socket can't be opened.
+        raise CannotConnect(str(error)) from error
+    try:
+        if not client.connected:
+            raise CannotConnect(f"{host} refused the connection")
+        lite6 = is_lite6(client)
+        # The Lite 6 gripper has no version to read.
+        gripper = not lite6 and client.get_gripper_version()[0] == 0
+        return ProbeResult(
+            host, client.sn, client.device_type, client.axis, client.version, lite6, gripper
+        )
+    finally:
+        client.disconnect()
+
+
+async def async_probe(hass: core.HomeAssistant, host: str) -> ProbeResult:
+    """Probe a controller within PROBE_TIMEOUT, reusing a recent result for the same host.
 
-async def validate_host(ip: str) -> None:
-    """Validates a GitHub repo path.
+    A plain TCP connect goes first, so an unreachable host fails fast
+    instead of waiting for the SDK's own, much longer, timeouts.
+    """
+    cache = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PROBE_CACHE, {})
+    cached = cache.get(host)
+    if cached is not None and monotonic() - cached[0] < PROBE_CACHE_TTL:
+        return cached[1]
+    async with asyncio.timeout(PROBE_TIMEOUT):
+        if host != SIMULATOR_HOST:
+            try:
+                _, writer = await asyncio.open_connection(host, XARM_PORT)
+            except OSError as error:
+                raise CannotConnect(str(error)) from error
+            writer.close()
+            await writer.wait_closed()
+        result = await hass.async_add_executor_job(_probe_controller, host)
+    cache[host] = (monotonic(), result)
+    return result
+
+
+async def _async_port_open(host: str, semaphore: asyncio.Semaphore) -> bool:
+    """Return True if host accepts a connection on the controller port."""
+    async with semaphore:
+        try:
+            async with asyncio.timeout(DISCOVERY_CONNECT_TIMEOUT):
+                _, writer = await asyncio.open_connection(host, XARM_PORT)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        await writer.wait_closed()
+        return True
 
-    Raises a ValueError if the host name is invalid.
+
+async def async_discover(
+    hass: core.HomeAssistant, subnet: IPv4Network | IPv6Network
+) -> list[ProbeResult]:
+    """Sweep subnet for controllers and fingerprint every one that answers.
+
+    Connects run DISCOVERY_CONCURRENCY at a time with a short timeout, so a
+    /24 takes a couple of seconds. Only hosts with the port open get the
+    SDK handshake.
     """
-    if len(ip.split(".")) != 4:
-        raise ValueError("Bad host name.")
+    hosts = [str(address) for address in subnet.hosts()]
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    open_ports = await asyncio.gather(*(_async_port_open(host, semaphore) for host in hosts))
+    responders = [host for host, is_open in zip(hosts, open_ports) if is_open]
+    _LOGGER.debug(f"{len(responders)} of {len(hosts)} hosts in {subnet} answered")
+    probes = await asyncio.gather(
+        *(async_probe(hass, host) for host in responders), return_exceptions=True
+    )
+    return [probe for probe in probes if isinstance(probe, ProbeResult)]
+
+
+async def _async_default_subnet(hass: core.HomeAssistant) -> str:
+    """Return the /24 Home Assistant itself lives in."""
     try:
-        ping(ip)
-    except Exception as exc:
-        raise exc("Something went wrong with the ping.")
+        source_ip = await network.async_get_source_ip(hass)
+    except HomeAssistantError:
+        return DEFAULT_DISCOVERY_SUBNET
+    return str(ip_network(f"{source_ip}/24", strict=False))
 
 
 class XArmControllerConfigFlow(
@@ -68,37 +211,196 @@ class XArmControllerConfigFlow(
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
 
-    data: Optional[dict[str, Any]]
+    def __init__(self) -> None:
+        self._name: str | None = None
+        self._probe: ProbeResult | None = None
+        self._discovered: dict[str, ProbeResult] = {}
 
     async def async_step_user(
         self, user_input: Optional[dict[str, Any]] = None
     ) -> ConfigFlowResult:
         """Invoke when a user initiates a flow via the user interface."""
+        return self.async_show_menu(step_id="user", menu_options=["host", "discover"])
 
-        # discovered_host: str
-        # discovered_device: str
+    async def async_step_discover(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Sweep a subnet for arms that aren't configured yet."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
-                xarm = XArmAPI(
-                    user_input[CONF_HOST],
-                    do_not_open=True,
-                )
-            except Exception as exc:
-                errors["base"] = "connection_error"
-                errors["specific_error"] = str(exc)
-                self.async_abort(reason="connection_error")
+                subnet = ip_network(user_input[CONF_SUBNET], strict=False)
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                if subnet.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_SUBNET] = "subnet_too_large"
             if not errors:
-                # Input is valid, set data.
-                self.data = user_input
-                # User is done adding host name, create the config entry.
-                self.data[ATTR_SERIAL_NUMBER] = xarm.sn
-                self.data["device_type"] = xarm.device_type
-                return self.async_create_entry(
-                    title=f"XArm Controller {user_input[CONF_NAME]}", data=self.data
-                )
+                configured = self._async_current_ids(include_ignore=True)
+                self._discovered = {
+                    probe.host: probe
+                    for probe in await async_discover(self.hass, subnet)
+                    if str(probe.serial) not in configured
+                }
+                if not self._discovered:
+                    return self.async_abort(reason="no_devices_found")
+                return await self.async_step_pick()
+
+        default = user_input[CONF_SUBNET] if user_input else await _async_default_subnet(self.hass)
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema({vol.Required(CONF_SUBNET, default=default): cv.string}),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Choose one of the discovered arms."""
+        if user_input is not None:
+            self._probe = self._discovered[user_input[CONF_HOST]]
+            await self.async_set_unique_id(str(self._probe.serial))
+            self._abort_if_unique_id_configured()
+            self._name = user_input[CONF_NAME]
+            return await self.async_step_confirm()
+
+        options = [
+            SelectOptionDict(value=host, label=f"{probe.model} {probe.serial} ({host})")
+            for host, probe in self._discovered.items()
+        ]
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): SelectSelector(
+                        SelectSelectorConfig(options=options, mode=SelectSelectorMode.LIST)
+                    ),
+                    vol.Required(CONF_NAME): cv.string,
+                }
+            ),
+            description_placeholders={"count": str(len(options))},
+        )
+
+    async def async_step_host(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Add an arm by its host."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            host = user_input[CONF_HOST].strip()
+            try:
+                self._probe = await async_probe(self.hass, host)
+            except TimeoutError:
+                errors["base"] = "timeout"
+            except CannotConnect as error:
+                _LOGGER.debug(f"Probing {host} failed: {error}")
+                errors["base"] = "cannot_connect"
+            else:
+                await self.async_set_unique_id(str(self._probe.serial))
+                self._abort_if_unique_id_configured(updates={CONF_HOST: host})
+                self._name = user_input[CONF_NAME]
+                return await self.async_step_confirm()
+
+        return self.async_show_form(
+            step_id="host",
+            data_schema=self.add_suggested_values_to_schema(HOST_SCHEMA, user_input),
+            errors=errors,
+        )
+
+    async def async_step_confirm(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Show what the probe found before adding the arm."""
+        probe = self._probe
+        if user_input is not None:
+            return self.async_create_entry(
+                title=f"XArm Controller {self._name}",
+                data={
+                    CONF_HOST: probe.host,
+                    CONF_NAME: self._name,
+                    ATTR_SERIAL_NUMBER: probe.serial,
+                    "device_type": probe.device_type,
+                    # Lets the entities be created at startup, before the arm answers.
+                    CONF_CAPABILITIES: asdict(probe.capabilities),
+                },
+            )
+
+        return self.async_show_form(
+            step_id="confirm",
+            description_placeholders={
+                "host": probe.host,
+                "model": probe.model,
+                "serial": str(probe.serial),
+                "axis": str(probe.axis),
+                "version": str(probe.version),
+            },
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return XArmControllerOptionsFlow()
+
+
+class XArmControllerOptionsFlow(OptionsFlow):
+    """Handle XArm Controller options."""
+
+    async def async_step_init(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
 
+        options = self.config_entry.options
         return self.async_show_form(
-            step_id="user", data_schema=HOST_SCHEMA, errors=errors
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MAX_UPDATE_RATE,
+                        default=options.get(CONF_MAX_UPDATE_RATE, DEFAULT_MAX_UPDATE_RATE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=100)),
+                    vol.Optional(
+                        CONF_METRICS, default=options.get(CONF_METRICS, DEFAULT_METRICS)
+                    ): bool,
+                    vol.Optional(
+                        CONF_POSITION_DEADBAND,
+                        default=options.get(CONF_POSITION_DEADBAND, DEFAULT_POSITION_DEADBAND),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_POSITION_RELATIVE_DEADBAND,
+                        default=options.get(
+                            CONF_POSITION_RELATIVE_DEADBAND, DEFAULT_POSITION_RELATIVE_DEADBAND
+                        ),
+                    ): _PERCENT,
+                    vol.Optional(
+                        CONF_ANGLE_DEADBAND,
+                        default=options.get(CONF_ANGLE_DEADBAND, DEFAULT_ANGLE_DEADBAND),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=45)),
+                    vol.Optional(
+                        CONF_ANGLE_RELATIVE_DEADBAND,
+                        default=options.get(
+                            CONF_ANGLE_RELATIVE_DEADBAND, DEFAULT_ANGLE_RELATIVE_DEADBAND
+                        ),
+                    ): _PERCENT,
+                    vol.Optional(
+                        CONF_CURRENT_DEADBAND,
+                        default=options.get(CONF_CURRENT_DEADBAND, DEFAULT_CURRENT_DEADBAND),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                    vol.Optional(
+                        CONF_CURRENT_RELATIVE_DEADBAND,
+                        default=options.get(
+                            CONF_CURRENT_RELATIVE_DEADBAND, DEFAULT_CURRENT_RELATIVE_DEADBAND
+                        ),
+                    ): _PERCENT,
+                    vol.Optional(
+                        CONF_MIN_PUBLISH_INTERVAL,
+                        default=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+                }
+            ),
         )
@@ -0,0 +1,191 @@
+"""Connection lifecycle of an xArm: connect, watch the link and reconnect."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from enum import StrEnum
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONNECT_TIMEOUT,
+    DEGRADED_AFTER,
+    LOGGER,
+    RECONNECT_BACKOFF,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+    RECONNECT_OFFLINE_AFTER,
+)
+from .dispatcher import XArmCommandDispatcher
+
+
+class ConnectionState(StrEnum):
+    """Health of the link to the controller."""
+
+    CONNECTING = "connecting"
+    READY = "ready"
+    # Connected, but requests keep failing.
+    DEGRADED = "degraded"
+    RECONNECTING = "reconnecting"
+    # Reconnecting for a while without success, retries continue at the longest delay.
+    OFFLINE = "offline"
+
+
+class XArmConnection:
+    """Connection state machine of one arm.
+
+    connecting -> ready after the first connect. A dropped link moves to
+    reconnecting and is retried at once, then with exponential backoff;
+    after RECONNECT_OFFLINE_AFTER failed attempts the arm is reported
+    offline. A successful reconnect re-initializes the arm before it is
+    ready again. Polls failing while the link is up move ready to degraded
+    and the next successful poll moves it back.
+
+    Connects run on the arm's dispatcher, so the event loop only waits on
+    them and gives up after CONNECT_TIMEOUT.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        dispatcher: XArmCommandDispatcher,
+        client: Any,
+        initialize_fn: Callable[[], None],
+        on_change: Callable[[ConnectionState, bool], None],
+    ) -> None:
+        self.hass = hass
+        self._dispatcher = dispatcher
+        self._client = client
+        self._initialize_fn = initialize_fn
+        # Called with the new state, and whether it completes a reconnect.
+        self._on_change = on_change
+        self.state = ConnectionState.CONNECTING
+        # Failed attempts since the link went down.
+        self.attempts = 0
+        self.reconnects = 0
+        # Seconds from losing the link to being ready again, for the latest reconnect.
+        self.reconnect_time: float | None = None
+        self.last_error: str | None = None
+        self._lost_at: float | None = None
+        self._poll_failures = 0
+        self._unsub_retry: Callable[[], None] | None = None
+        self._closed = False
+
+    @property
+    def is_up(self) -> bool:
+        """Return True while requests can be sent to the controller."""
+        return self.state in (ConnectionState.READY, ConnectionState.DEGRADED)
+
+    @callback
+    def _async_set_state(self, state: ConnectionState, reconnected: bool = False) -> None:
+        if state == self.state and not reconnected:
+            return
+        LOGGER.debug(f"{self._dispatcher.name}: connection {self.state} -> {state}")
+        self.state = state
+        self._on_change(state, reconnected)
+
+    async def async_connect(self) -> bool:
+        """Connect, re-initializing the arm after a lost link, and return True once ready."""
+        reconnect = self._lost_at is not None
+        try:
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                await self._dispatcher.async_call("connect", self._client.connect)
+                if not self._client.connected:
+                    raise ConnectionError("the controller did not accept the connection")
+                if reconnect:
+                    await self._dispatcher.async_call("initialize", self._initialize_fn)
+        except TimeoutError:
+            self.last_error = f"no answer within {CONNECT_TIMEOUT} seconds"
+        except Exception as error:  # noqa: BLE001
+            # The SDK raises plain Exceptions for socket errors.
+            self.last_error = str(error) or type(error).__name__
+        else:
+            if self._closed:
+                return False
+            self.attempts = 0
+            self._poll_failures = 0
+            if reconnect:
+                self.reconnect_time = monotonic() - self._lost_at
+                self.reconnects += 1
+                self._lost_at = None
+                LOGGER.info(
+                    f"Reconnected to {self._dispatcher.name} in {self.reconnect_time:.1f} s"
+                )
+            self._async_set_state(ConnectionState.READY, reconnected=reconnect)
+            return True
+        LOGGER.debug(f"Connecting to {self._dispatcher.name} failed: {self.last_error}")
+        return False
+
+    @callback
+    def async_retry_later(self) -> None:
+        """Keep retrying a first connect that failed, with the same backoff as a reconnect."""
+        if self._closed:
+            return
+        self.attempts += 1
+        self._async_set_state(ConnectionState.RECONNECTING)
+        self._async_schedule_retry(self.retry_delay())
+
+    @callback
+    def async_link_lost(self) -> None:
+        """Start reconnecting after the SDK reported the link down."""
+        if self._closed or self.state in (ConnectionState.RECONNECTING, ConnectionState.OFFLINE):
+            return
+        LOGGER.warning(f"Lost the connection to {self._dispatcher.name}, reconnecting")
+        self._lost_at = monotonic()
+        self.attempts = 0
+        self._async_set_state(ConnectionState.RECONNECTING)
+        self._async_schedule_retry(0)
+
+    @callback
+    def async_poll_failed(self) -> None:
+        self._poll_failures += 1
+        if self._poll_failures >= DEGRADED_AFTER and self.state == ConnectionState.READY:
+            self._async_set_state(ConnectionState.DEGRADED)
+
+    @callback
+    def async_poll_succeeded(self) -> None:
+        self._poll_failures = 0
+        if self.state == ConnectionState.DEGRADED:
+            self._async_set_state(ConnectionState.READY)
+
+    def retry_delay(self) -> float:
+        """Return the seconds to wait after the latest failed attempt."""
+        return min(
+            RECONNECT_MIN_DELAY * RECONNECT_BACKOFF ** (self.attempts - 1), RECONNECT_MAX_DELAY
+        )
+
+    @callback
+    def _async_schedule_retry(self, delay: float) -> None:
+        self._unsub_retry = async_call_later(self.hass, delay, self._async_retry)
+
+    async def _async_retry(self, _now: datetime | None = None) -> None:
+        self._unsub_retry = None
+        if self._closed or await self.async_connect():
+            return
+        self.attempts += 1
+        if self.attempts >= RECONNECT_OFFLINE_AFTER:
+            self._async_set_state(ConnectionState.OFFLINE)
+        if not self._closed:
+            self._async_schedule_retry(self.retry_delay())
+
+    @callback
+    def async_close(self) -> None:
+        """Stop reconnecting, used when the entry is unloaded."""
+        self._closed = True
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "attempts": self.attempts,
+            "reconnects": self.reconnects,
+            "reconnect_time": self.reconnect_time,
+            "last_error": self.last_error,
+        }
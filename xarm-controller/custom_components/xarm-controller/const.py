@@ -29,6 +29,144 @@ YAW = "yaw"
 
 MOVE_ARM_EVENT = "xarm_move_arm"
 
+SERVICE_MOVE_TRAJECTORY = "move_trajectory"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_POSES = "poses"
+ATTR_SPEED = "speed"
+ATTR_ACCELERATION = "acceleration"
+ATTR_RADIUS = "radius"
+# Linear speed (mm/s) and acceleration (mm/s²) of a trajectory, the SDK's own
+# defaults, and the limits the controller accepts.
+DEFAULT_TRAJECTORY_SPEED = 100.0
+DEFAULT_TRAJECTORY_ACCELERATION = 2000.0
+MAX_TRAJECTORY_SPEED = 1000.0
+MAX_TRAJECTORY_ACCELERATION = 50000.0
+# Poses streamed in one call, kept well below the controller's command cache.
+MAX_TRAJECTORY_POSES = 256
+
+SERVICE_MOVE_GRIPPER = "move_gripper"
+ATTR_POSITION = "position"
+# Seconds a service call may wait for a motion to finish.
+ATTR_TIMEOUT = "timeout"
+MAX_MOTION_TIMEOUT = 600.0
+GRIPPER_OPEN_POSITION = 1000
+GRIPPER_CLOSED_POSITION = 0
+# Motions are sent with wait=False. An arm motion that hasn't shown up as moving this many
+# seconds after the command counts as done, the gripper is polled every GRIPPER_POLL_INTERVAL
+# seconds until it is within GRIPPER_TOLERANCE of its target or stops.
+MOTION_START_GRACE = 0.5
+GRIPPER_POLL_INTERVAL = 0.2
+GRIPPER_TOLERANCE = 2
+
+SERVICE_GET_TELEMETRY = "get_telemetry"
+ATTR_WINDOW = "window"
+ATTR_DURATION = "duration"
+ATTR_CHANNELS = "channels"
+# Samples kept per arm, 10 minutes at 10 location reports per second (about 0.6 MB).
+TELEMETRY_CAPACITY = 6000
+# Bucket size of the telemetry history included in diagnostics, in seconds.
+DIAGNOSTICS_TELEMETRY_WINDOW = 10.0
+# Errors kept per arm for diagnostics.
+ERROR_HISTORY = 20
+# The event loop is checked every LOOP_MONITOR_INTERVAL seconds, a tick arriving more
+# than LOOP_BLOCK_THRESHOLD seconds late is kept as a blocking incident.
+LOOP_MONITOR_INTERVAL = 0.5
+LOOP_BLOCK_THRESHOLD = 0.1
+LOOP_INCIDENT_HISTORY = 20
+
+CONF_MAX_UPDATE_RATE = "max_update_rate"
+DEFAULT_MAX_UPDATE_RATE = 10.0  # Hz
+# Instrument SDK calls and reports, exposed as diagnostic sensors and at /api/xarm-controller/metrics.
+CONF_METRICS = "metrics"
+DEFAULT_METRICS = False
+METRICS_REFRESH_INTERVAL = 10  # seconds between diagnostic sensor updates
+# Position, angle and current changes within these deadbands aren't written, to keep
+# jitter out of the recorder. Each class has an absolute deadband and one in percent
+# of the last written value, the larger of the two applies.
+CONF_POSITION_DEADBAND = "position_deadband"
+DEFAULT_POSITION_DEADBAND = 0.1  # mm
+CONF_POSITION_RELATIVE_DEADBAND = "position_relative_deadband"
+DEFAULT_POSITION_RELATIVE_DEADBAND = 0.0  # %
+CONF_ANGLE_DEADBAND = "angle_deadband"
+DEFAULT_ANGLE_DEADBAND = 0.1  # degrees
+CONF_ANGLE_RELATIVE_DEADBAND = "angle_relative_deadband"
+DEFAULT_ANGLE_RELATIVE_DEADBAND = 0.0  # %
+CONF_CURRENT_DEADBAND = "current_deadband"
+DEFAULT_CURRENT_DEADBAND = 0.0  # A
+CONF_CURRENT_RELATIVE_DEADBAND = "current_relative_deadband"
+# Currents flicker by a few percent even when the arm holds still.
+DEFAULT_CURRENT_RELATIVE_DEADBAND = 5.0  # %
+# Seconds between state writes of a filtered sensor, 0 writes every change beyond the deadband.
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+DEFAULT_MIN_PUBLISH_INTERVAL = 0.0
+
+GROUP_GRIPPER = "gripper"
+GROUP_POSITION = "position"
+GROUP_STATE = "state"
+GROUP_INFO = "info"
+GROUP_JOINTS = "joints"
+# Pseudo group for values computed by the coordinator itself (poll rate, counters...).
+GROUP_DIAGNOSTICS = "diagnostics"
+
+# Seconds between polls of each model group. None means the group is only polled
+# on request: info at connect and reconnect, the gripper after gripper commands.
+POLL_INTERVALS = {
+    GROUP_INFO: None,
+    GROUP_STATE: 1.0,
+    GROUP_POSITION: 0.2,
+    GROUP_GRIPPER: None,
+    GROUP_JOINTS: 1.0,
+}
+# While the arm is idle the position and state polls back off exponentially up to these.
+IDLE_POLL_INTERVALS = {
+    GROUP_STATE: 30.0,
+    GROUP_JOINTS: 30.0,
+    GROUP_POSITION: 30.0,
+}
+POLL_BACKOFF = 2.0
+
+# Key of the XArmConnectionManager in hass.data[DOMAIN], next to the coordinators.
+DATA_CONNECTION_MANAGER = "connection_manager"
+# Threads shared by all arms for SDK calls. Each arm still runs one call at a time.
+WORKER_POOL_SIZE = 16
+# First polls of the arms are spread over this many seconds so they don't poll in lockstep.
+POLL_STAGGER_WINDOW = POLL_INTERVALS[GROUP_POSITION]
+
+# Seconds a connect (and the re-initialization after a reconnect) may take.
+CONNECT_TIMEOUT = 10.0
+# A dropped link is retried at once, then after RECONNECT_MIN_DELAY seconds,
+# multiplied by RECONNECT_BACKOFF after every failure up to RECONNECT_MAX_DELAY.
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+RECONNECT_BACKOFF = 2.0
+# Failed reconnect attempts before the arm is reported offline, retries go on.
+RECONNECT_OFFLINE_AFTER = 5
+# Consecutive failed polls before a connected arm is reported degraded.
+DEGRADED_AFTER = 3
+
+# TCP port of the controller's command socket.
+XARM_PORT = 502
+# Seconds the config flow waits for a controller to answer, handshake included.
+PROBE_TIMEOUT = 5.0
+# Probe results are kept in hass.data[DOMAIN][DATA_PROBE_CACHE] this many seconds.
+DATA_PROBE_CACHE = "probe_cache"
+PROBE_CACHE_TTL = 300
+# Subnet sweeps of the discovery step: parallel connects, seconds each may take, largest sweep.
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_CONNECT_TIMEOUT = 0.5
+DISCOVERY_MAX_HOSTS = 1024
+DEFAULT_DISCOVERY_SUBNET = "192.168.1.0/24"
+CONF_SUBNET = "subnet"
+# Entry data key of the arm's capability profile (axis count, Lite 6, gripper).
+CONF_CAPABILITIES = "capabilities"
+
+# Product name by the device type a controller reports.
+MODEL_NAMES = {5: "xArm 5", 6: "xArm 6", 7: "xArm 7", 9: "Lite 6", 12: "850"}
+# xArm 5/6/7 report their axis count as device type, the Lite 6 reports 9.
+LITE6_DEVICE_TYPE = 9
+# API code the SDK returns instead of a (code, value) tuple when the gripper has a fault.
+END_EFFECTOR_HAS_FAULT = 102
+
 LOGGER = logging.getLogger(__package__)
 LOGGERFORHA = logging.getLogger(f"{__package__}_HA")
 
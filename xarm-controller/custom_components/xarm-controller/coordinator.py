@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from time import monotonic, perf_counter, time
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_SERIAL_NUMBER,
@@ -11,26 +18,84 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant, Event, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from .models import XArmData
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from xarm.wrapper import XArmAPI
+from .models import Capabilities, XArmData
 
 from .const import (
+    CONF_CAPABILITIES,
+    CONF_MAX_UPDATE_RATE,
+    CONF_METRICS,
+    DEFAULT_MAX_UPDATE_RATE,
+    DEFAULT_METRICS,
     DOMAIN,
+    ERROR_HISTORY,
+    GROUP_DIAGNOSTICS,
+    GROUP_GRIPPER,
+    GROUP_INFO,
+    GROUP_JOINTS,
+    GROUP_POSITION,
+    GROUP_STATE,
     LOGGER,
     LOGGERFORHA,
+    IDLE_POLL_INTERVALS,
+    METRICS_REFRESH_INTERVAL,
+    POLL_BACKOFF,
+    POLL_INTERVALS,
     API_ERRORS,
     GRIPPER_ERROR_CODES,
     WARN_CODES,
     MODES,
     STATES,
-    MOVE_ARM_EVENT
+    MOVE_ARM_EVENT,
+    TELEMETRY_CAPACITY,
+)
+from .coalescer import ReportCoalescer
+from .connection import ConnectionState, XArmConnection
+from .deadband import PublishFilter
+from .motion import MotionTracker, async_wait
+from .metrics import InstrumentedClient, XArmMetrics
+from .scheduler import PollScheduler
+from .simulator import SIMULATOR_HOST, SimulatedXArmAPI
+from .telemetry import TelemetryBuffer
+
+if TYPE_CHECKING:
+    from .manager import XArmConnectionManager
+
+# SDK report callbacks the coordinator subscribes to (XArmAPI.register_<name>_callback).
+REPORT_CALLBACKS = (
+    "report_location",
+    "connect_changed",
+    "state_changed",
+    "mode_changed",
+    "mtable_mtbrake_changed",
+    "error_warn_changed",
+    "temperature_changed",
+    "count_changed",
 )
-from .dummy import XArmDummyAPI
+
+
+# Every model entity's availability follows this field, a change to it wakes them all.
+AVAILABILITY_FIELD = f"{GROUP_STATE}.connected"
+
+
+def listener_groups(fields: tuple[str, ...]) -> frozenset[str] | None:
+    """Return the model groups of qualified fields, used as an entity's listener context.
+
+    None, for entities that don't declare their fields, wakes the entity on every update.
+    """
+    return frozenset(field.partition(".")[0] for field in fields) or None
+
+
+def reload_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry's data and options, leaving out the stored capability profile."""
+    data = {key: value for key, value in entry.data.items() if key != CONF_CAPABILITIES}
+    return {**data, "options": dict(entry.options)}
 
 
 class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
@@ -41,7 +106,7 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
     _updatedDevice: bool
 
     def __init__(
-        self, hass: HomeAssistant, *, entry: ConfigEntry
+        self, hass: HomeAssistant, *, entry: ConfigEntry, manager: XArmConnectionManager
     ) -> None:
         """Initialize the XArmControllerUpdateCoordinator."""
 
@@ -52,14 +117,94 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
 
         self._updatedDevice = False
         self._shutdown = False
+        # Qualified names ("position.x") of the fields changed by the latest update.
+        self.dirty: set[str] = set()
+        # Groups of the changes being notified, None wakes every listener.
+        self._wake_groups: set[str] | None = None
+        # Entity wake-ups made and skipped because the entity's groups didn't change.
+        self.wakeups = 0
+        self.suppressed_wakeups = 0
+        # Futures of the arm and gripper motions in progress.
+        self.motion = MotionTracker(
+            hass, lambda: self.xarm_data_model.state.is_moving, self._async_read_gripper
+        )
+        # Deadband filters of the sensors by key, filled in as the sensors are added.
+        self.publish_filters: dict[str, PublishFilter] = {}
         # self.data = self.get_xarm_model()
         # Pass LOGGERFORHA logger into HA as otherwise it generates a debug output line every single time we tell it we have an update
         # which fills the logs and makes the useful logging data less accessible.
         super().__init__(hass=hass, config_entry=entry, logger=LOGGERFORHA, name=DOMAIN)
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
-        self.xarm_client = XArmDummyAPI(self)
-        self.xarm_data_model = XArmData(xarm_client=self.xarm_client, callback=self.event_handler)
+        host = entry.data.get(CONF_HOST, SIMULATOR_HOST)
+        # The client is connected later by the connection state machine, off the event loop.
+        if host == SIMULATOR_HOST:
+            client = SimulatedXArmAPI(host, do_not_open=True)
+        else:
+            # Already imported in the executor by async_setup_entry, this is a lookup.
+            from xarm.wrapper import XArmAPI
+
+            client = XArmAPI(host, do_not_open=True)
+        # Metrics are opt-in, without them the SDK client is used as is.
+        self.metrics = XArmMetrics() if entry.options.get(CONF_METRICS, DEFAULT_METRICS) else None
+        self.xarm_client = client if self.metrics is None else InstrumentedClient(client, self.metrics)
+        self.xarm_data_model = XArmData(
+            xarm_client=self.xarm_client,
+            callback=self.event_handler,
+            serial=entry.data.get(ATTR_SERIAL_NUMBER),
+        )
+        # Every XArmAPI call goes through the dispatcher so calls for this arm run one at a
+        # time, on the worker pool the manager shares between all arms.
+        self.manager = manager
+        self.dispatcher = manager.create_dispatcher(entry.data.get(CONF_HOST, entry.entry_id))
+        self._report_handlers = self._build_report_handlers()
+        self.connection = XArmConnection(
+            hass,
+            self.dispatcher,
+            self.xarm_client,
+            self.xarm_data_model.initialize,
+            self._async_connection_changed,
+        )
+        self.scheduler = PollScheduler(POLL_INTERVALS, IDLE_POLL_INTERVALS, POLL_BACKOFF)
+        self._unsub_poll: Callable[[], None] | None = None
+        self._commands_in_flight = 0
+        # Latest command, poll and controller errors, oldest first.
+        self.errors: deque[dict[str, str]] = deque(maxlen=ERROR_HISTORY)
+        # Effective position poll rate in Hz, exposed as a diagnostic sensor.
+        self.poll_rate = self.scheduler.rate(GROUP_POSITION)
+        # Milliseconds the latest stop command took from the press to the controller's reply.
+        self.stop_latency: float | None = None
+        # Every report is kept at full rate here, before the coalescer merges them.
+        self.telemetry = TelemetryBuffer(TELEMETRY_CAPACITY)
+        # Bursts of position reports are merged and written at most max_update_rate times a second.
+        self.coalescer = ReportCoalescer(
+            hass.loop,
+            self.event_handler_internal,
+            max_rate=entry.options.get(CONF_MAX_UPDATE_RATE, DEFAULT_MAX_UPDATE_RATE),
+        )
+        # Average SDK call latency (ms) and reports per second, refreshed while metrics are on.
+        self.sdk_call_latency: float | None = None
+        self.report_rate: float | None = None
+        self._call_totals = (0, 0.0)
+        self._unsub_metrics: Callable[[], None] | None = None
+        if self.metrics is not None:
+            self._unsub_metrics = async_track_time_interval(
+                hass, self._async_refresh_metrics, timedelta(seconds=METRICS_REFRESH_INTERVAL)
+            )
+        # Set once the arm's identity was read after the first connect.
+        self.info_loaded = False
+        # What the arm is fitted with, as stored with the entry. None until the arm was reached once.
+        stored = entry.data.get(CONF_CAPABILITIES)
+        self.capabilities: Capabilities | None = Capabilities(**stored) if stored else None
+        self._capability_listeners: list[Callable[[Capabilities], None]] = []
+        # Entry settings the coordinator was built from, a change to them needs a reload.
+        self.settings = reload_settings(entry)
+        # Seconds each startup stage took, logged once the first poll is in.
+        self.startup_timings: dict[str, float] = {}
+        self._started_at = 0.0
+        # Seconds the polls of this arm are shifted by, relative to the other arms.
+        self.poll_offset = manager.async_register(entry.entry_id, self)
+        self.register_callbacks()
 
     def get_xarm_model(self) -> XArmData:
         """Return the XArm device."""
@@ -79,12 +224,145 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
     def _async_shutdown(self, event: Event) -> None:
         """Call when Home Assistant is stopping."""
         LOGGER.debug(f"HOME ASSISTANT IS SHUTTING DOWN")
-        self.shutdown()
+        self.hass.async_create_task(self.async_shutdown())
 
-    def shutdown(self) -> None:
-        """Halt the MQTT listener thread"""
+    async def async_shutdown(self) -> None:
+        """Disconnect from the xArm and stop the command worker."""
+        await super().async_shutdown()
+        if self._shutdown:
+            return
         self._shutdown = True
-        self.xarm_client.disconnect()
+        self.manager.async_unregister(self._entry.entry_id)
+        self._capability_listeners.clear()
+        self.motion.async_fail("The xArm was unloaded")
+        self.connection.async_close()
+        self.release_callbacks()
+        self.coalescer.async_cancel()
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        if self._unsub_metrics is not None:
+            self._unsub_metrics()
+            self._unsub_metrics = None
+        try:
+            await self.dispatcher.async_call("disconnect", self.xarm_client.disconnect)
+        finally:
+            self.dispatcher.shutdown()
+
+    async def async_run_command(self, name: str, action_fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking xArm action on the arm's worker thread and wait for it."""
+        LOGGER.debug(f"Dispatching command: {name}")
+        self._commands_in_flight += 1
+        self.async_notify_changes(self._async_update_activity())
+        try:
+            return await self.dispatcher.async_call(name, action_fn, *args)
+        except Exception as error:
+            self._record_error(name, error)
+            raise
+        finally:
+            self._commands_in_flight -= 1
+            self.async_notify_changes(self._async_update_activity())
+
+    async def async_run_priority_command(
+        self, name: str, action_fn: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a stop command ahead of everything queued for the arm, flushing the queue."""
+        LOGGER.debug(f"Dispatching priority command: {name}")
+        timings = self.dispatcher.priority_timings
+        try:
+            return await self.dispatcher.async_call_priority(name, action_fn, *args)
+        except Exception as error:
+            self._record_error(name, error)
+            raise
+        finally:
+            if timings:
+                timing = timings[-1]
+                self.stop_latency = (timing.queue_wait + timing.execution) * 1000
+                self.async_notify_changes({f"{GROUP_DIAGNOSTICS}.stop_latency"})
+
+    async def async_move_trajectory(
+        self,
+        poses: list[dict],
+        speed: float,
+        acceleration: float,
+        radius: float,
+        timeout: float | None = None,
+    ) -> None:
+        """Stream a validated list of poses to the arm's motion queue in one command.
+
+        With a timeout, also wait for the arm to stop, from its state reports.
+        """
+        state = self.get_xarm_model().state
+        if not state.connected:
+            raise ServiceValidationError("The xArm is not connected")
+        if state.has_error:
+            raise ServiceValidationError(f"Clear the xArm error first: {state.error_msg}")
+        # Created before sending, the arm may report moving before the command returns.
+        done = self.motion.async_arm_motion()
+        try:
+            code, index = await self.async_run_command(
+                "move_trajectory",
+                self.get_xarm_model().position.move_trajectory,
+                poses,
+                speed,
+                acceleration,
+                radius,
+            )
+        except Exception as error:
+            self.motion.async_abort(done, error)
+            raise
+        self.async_request_poll(GROUP_STATE, GROUP_POSITION)
+        if code != 0:
+            error = HomeAssistantError(
+                f"xArm rejected pose {index + 1} of {len(poses)}: {API_ERRORS.get(code, code)}"
+            )
+            self._record_error("move_trajectory", error)
+            self.motion.async_abort(done, error)
+            raise error
+        self.motion.async_arm_motion_sent()
+        if timeout is not None:
+            await async_wait(done, timeout, "xArm motion")
+
+    async def async_move_gripper(self, position: float, timeout: float | None = None) -> float | None:
+        """Move the gripper and, with a timeout, wait for it and return where it stopped."""
+        device = self.get_xarm_model()
+        if not device.state.connected:
+            raise ServiceValidationError("The xArm is not connected")
+        if not device.gripper.present:
+            raise ServiceValidationError("The xArm has no gripper with position feedback")
+        # Created before sending, like the arm motions.
+        done = self.motion.async_gripper_motion(position)
+        try:
+            code = await self.async_run_command(
+                "move_gripper", device.gripper.set_position, position
+            )
+        except Exception as error:
+            self.motion.async_abort(done, error)
+            raise
+        if code != 0:
+            error = HomeAssistantError(f"xArm rejected the gripper position: {API_ERRORS.get(code, code)}")
+            self._record_error("move_gripper", error)
+            self.motion.async_abort(done, error)
+            raise error
+        self.motion.async_gripper_motion_sent()
+        if timeout is None:
+            return None
+        return await async_wait(done, timeout, "gripper motion")
+
+    async def _async_read_gripper(self) -> float:
+        """Poll the gripper group for the MotionTracker, returning the position."""
+        dirty = await self.dispatcher.async_call(
+            "gripper", self.xarm_data_model.update_groups, [GROUP_GRIPPER]
+        )
+        self.async_notify_changes(dirty)
+        return self.xarm_data_model.gripper.position
+
+    @callback
+    def _record_error(self, source: str, error: Exception | str) -> None:
+        """Keep an error for diagnostics."""
+        self.errors.append(
+            {"time": dt_util.utcnow().isoformat(), "source": source, "message": str(error)}
+        )
 
     def _service_call_is_for_me(self, data: dict) -> bool:
         """Check if the service call is for this device."""
@@ -104,9 +382,34 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
             # Handle race conditions when the integration is being deleted by re-registering and existing device.
             return
 
-        # The callback comes in on the XArm thread. Need to jump to the HA main thread to guarantee thread safety.
-        self._eventloop.call_soon_threadsafe(self.event_handler_internal, event)
+        # The callback comes in on the XArm thread. The coalescer merges it with any other
+        # pending reports and jumps to the HA main thread to guarantee thread safety.
+        started = perf_counter()
+        self.telemetry.push(event, time())
+        self.coalescer.push(event)
+        if self.metrics is not None:
+            self.metrics.record_report(event, perf_counter() - started)
+
+    def _build_report_handlers(self) -> dict[str, tuple[str, Callable[[dict], set[str]]]]:
+        """Map every report key to the model group and method that consumes it."""
+        device = self.get_xarm_model()
+        error_warn = (GROUP_STATE, device.state.apply_error_warn)
+        motor_states = (GROUP_JOINTS, device.joints.apply_motor_states)
+        return {
+            "cartesian": (GROUP_POSITION, device.position.apply_location),
+            "joints": (GROUP_JOINTS, device.joints.apply_angles),
+            "connected": (GROUP_STATE, device.state.apply_connect),
+            "state": (GROUP_STATE, device.state.apply_state),
+            "mode": (GROUP_STATE, device.state.apply_mode),
+            "mtable": motor_states,
+            "mtbrake": motor_states,
+            "error_code": error_warn,
+            "warn_code": error_warn,
+            "temperatures": (GROUP_JOINTS, device.joints.apply_temperatures),
+            "count": (GROUP_STATE, device.state.apply_count),
+        }
 
+    @callback
     def event_handler_internal(self, event: dict) -> None:
         """Handle state change events of xArm."""
 
@@ -115,24 +418,213 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
             # Handle race conditions when the integration is being deleted by re-registering and existing device.
             return
 
-        if "cartesian" in event or "joints" in event:
-            self._update_position_data()
+        # Reports carry the values themselves, so each one is applied straight to its
+        # model group without a round trip to the controller.
+        dirty = set()
+        applied = set()
+        for key in event:
+            handler = self._report_handlers.get(key)
+            if handler is None or handler in applied:
+                continue
+            applied.add(handler)
+            group, apply_report = handler
+            dirty.update(f"{group}.{name}" for name in apply_report(event))
+        if "state.connected" in dirty and not self.get_xarm_model().state.connected:
+            self.motion.async_fail("The connection to the xArm was lost")
+            self.connection.async_link_lost()
+        if "state.is_moving" in dirty:
+            dirty |= self._async_update_activity()
+        self.async_notify_changes(dirty)
+
+    async def async_start(self) -> None:
+        """Connect in the background, entities stay unavailable until the arm is live."""
+        self._started_at = monotonic()
+        if not await self.connection.async_connect():
+            LOGGER.warning(
+                f"Unable to connect to {self.dispatcher.name} ({self.connection.last_error}), retrying"
+            )
+            self.connection.async_retry_later()
+
+    @callback
+    def async_on_capabilities(self, listener: Callable[[Capabilities], None]) -> None:
+        """Call listener with the capability profile once known, right away if it already is."""
+        if self.capabilities is not None:
+            listener(self.capabilities)
+        else:
+            self._capability_listeners.append(listener)
+
+    @callback
+    def _async_capabilities_read(self, capabilities: Capabilities) -> None:
+        """Store the profile read from the arm, reloading the entry if the arm changed."""
+        known = self.capabilities
+        if capabilities == known:
+            return
+        self.hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, CONF_CAPABILITIES: asdict(capabilities)}
+        )
+        if known is not None:
+            LOGGER.info(f"{self.dispatcher.name} is now {capabilities}, was {known}, reloading")
+            self.hass.config_entries.async_schedule_reload(self._entry.entry_id)
+            return
+        self.capabilities = capabilities
+        for listener in self._capability_listeners:
+            listener(capabilities)
+        self._capability_listeners.clear()
+
+    async def _async_go_live(self) -> None:
+        """Read the arm's identity after the first connect and start polling."""
+        connected = monotonic()
+        self.startup_timings["connect"] = connected - self._started_at
+        try:
+            await self.async_load_info()
+        except Exception as error:  # noqa: BLE001
+            # Retried after the next (re)connect.
+            self._record_error("info", error)
+            return
+        self.startup_timings["info"] = monotonic() - connected
+        self.info_loaded = True
+        self._async_capabilities_read(self.xarm_data_model.capabilities())
+        self.async_start_polling()
+
+    @callback
+    def _async_connection_changed(self, state: ConnectionState, reconnected: bool) -> None:
+        """Stop polling while the link is down and resume once the arm is ready again."""
+        if state == ConnectionState.READY and not self.info_loaded:
+            self._entry.async_create_background_task(
+                self.hass, self._async_go_live(), f"{DOMAIN} {self.dispatcher.name} go live"
+            )
+        elif reconnected:
+            # Static fields may belong to a different controller now.
+            self.get_xarm_model().invalidate_static()
+            self.async_start_polling()
+        elif not self.connection.is_up and self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        self.async_notify_changes({f"{GROUP_DIAGNOSTICS}.connection"})
+
+    @callback
+    def _async_update_activity(self) -> set[str]:
+        """Poll fast while the arm moves or a command is in flight, back off when idle.
+
+        Returns the diagnostics fields that changed as a result.
+        """
+        active = self.get_xarm_model().state.is_moving or self._commands_in_flight > 0
+        if self.scheduler.set_active(active, monotonic()):
+            LOGGER.debug(f"Arm is {'active' if active else 'idle'}, adjusting poll rate")
+            self._async_schedule_poll()
+        return self._poll_rate_changed()
+
+    @callback
+    def _async_refresh_metrics(self, _now: datetime | None = None) -> None:
+        """Update the metrics diagnostic sensors."""
+        calls, seconds = self.metrics.call_totals()
+        last_calls, last_seconds = self._call_totals
+        self._call_totals = (calls, seconds)
+        self.sdk_call_latency = (
+            (seconds - last_seconds) / (calls - last_calls) * 1000 if calls > last_calls else None
+        )
+        self.report_rate = sum(self.metrics.report_rates().values())
+        self.async_notify_changes(
+            {f"{GROUP_DIAGNOSTICS}.sdk_call_latency", f"{GROUP_DIAGNOSTICS}.report_rate"}
+        )
+
+    def _poll_rate_changed(self) -> set[str]:
+        rate = self.scheduler.rate(GROUP_POSITION)
+        if rate == self.poll_rate:
+            return set()
+        self.poll_rate = rate
+        return {f"{GROUP_DIAGNOSTICS}.poll_rate"}
+
+    async def async_load_info(self) -> None:
+        """Read the arm's identity and gripper, so the platforms know what it is fitted with."""
+        await self.dispatcher.async_call(
+            "info", self.xarm_data_model.update_groups, [GROUP_INFO, GROUP_GRIPPER, GROUP_JOINTS]
+        )
+
+    @callback
+    def async_start_polling(self) -> None:
+        """Poll every model group now, then keep each one on its own interval."""
+        self.scheduler.start(monotonic(), self.poll_offset)
+        self._async_schedule_poll()
+
+    @callback
+    def async_request_poll(self, *groups: str) -> None:
+        """Poll the given model groups as soon as possible."""
+        if self._shutdown:
+            return
+        self.scheduler.request(monotonic(), *groups)
+        self._async_schedule_poll()
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Arm the timer for the next due model group."""
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        delay = self.scheduler.next_delay(monotonic())
+        if delay is None or self._shutdown or not self.connection.is_up:
+            return
+        self._unsub_poll = async_call_later(self.hass, delay, self._async_poll)
+
+    async def _async_poll(self, _now: datetime | None = None) -> None:
+        """Refresh the model groups that are due on the worker thread."""
+        self._unsub_poll = None
+        groups = self.scheduler.due(monotonic())
+        if groups:
+            try:
+                dirty = await self.dispatcher.async_call(
+                    "poll", self.xarm_data_model.update_groups, groups
+                )
+            except Exception as error:  # noqa: BLE001
+                LOGGER.debug(f"Polling {groups} failed: {error}")
+                self._record_error("poll", error)
+                self.connection.async_poll_failed()
+                dirty = set()
+            else:
+                self.connection.async_poll_succeeded()
+                if "first_poll" not in self.startup_timings:
+                    self._async_log_startup()
+            self.async_notify_changes(dirty | self._async_update_activity())
+        if self._unsub_poll is None:
+            self._async_schedule_poll()
 
-        elif "error_code" in event or "warn_code" in event:
-            self._update_error_data()
+    @callback
+    def _async_log_startup(self) -> None:
+        timings = self.startup_timings
+        timings["first_poll"] = monotonic() - self._started_at - timings["connect"] - timings["info"]
+        LOGGER.info(
+            f"{self.dispatcher.name} is live, "
+            + ", ".join(f"{stage} {seconds:.2f} s" for stage, seconds in timings.items())
+        )
 
-        elif "state" in event or "temperatures" in event or "mode" in event:
-            self._update_state_data()
+    def fields_changed(self, fields: tuple[str, ...]) -> bool:
+        """Return True if any of the given qualified fields changed in the last update.
 
-        elif "gripper_position" in event or "gripper_err_code" in event:
-            self._update_gripper_data()
+        Entities that don't declare their fields are always considered changed.
+        """
+        return not fields or AVAILABILITY_FIELD in self.dirty or not self.dirty.isdisjoint(fields)
 
-        elif "collision_sensitivity" in event:
-            self._update_state_data()
+    async def _async_update_data(self) -> XArmData:
+        """Refresh every model group on the worker thread."""
+        try:
+            self.dirty = await self.dispatcher.async_call("update", self.xarm_data_model.update)
+        except Exception as error:
+            raise UpdateFailed(f"Error communicating with xArm: {error}") from error
+        return self.xarm_data_model
 
-    def update_method(self) -> None:
-        """Update the device data of the xArm."""
+    @callback
+    def async_notify_changes(self, dirty: set[str]) -> None:
+        """Notify entities about the fields in dirty, skipping the update if nothing changed."""
+        if not dirty:
+            return
+        self.dirty = dirty
         device = self.get_xarm_model()
+        if "state.is_moving" in dirty and not device.state.is_moving:
+            self.motion.async_arm_stopped()
+        if "state.error_code" in dirty and device.state.error_code:
+            self._record_error("controller", f"{device.state.error_code}: {device.state.error_msg}")
+        if AVAILABILITY_FIELD not in dirty:
+            self._wake_groups = {field.partition(".")[0] for field in dirty}
         try:
             # use parent class method to update data
             self.async_set_updated_data(device)
@@ -140,17 +632,31 @@ class XArmControllerUpdateCoordinator(DataUpdateCoordinator[XArmData]):
             LOGGER.error("An exception occurred calling async_set_updated_data():")
             LOGGER.error(f"Exception type: {type(e)}")
             LOGGER.error(f"Exception data: {e}")
+        finally:
+            self._wake_groups = None
 
-    def _update_position_data(self) -> None:
-        """Update the position data of the xArm."""
-        self.get_model().position.update()
-        self.update_method()
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake only the listeners registered for a model group that changed.
 
-    def _update_state_data(self) -> None:
-        """Update the position data of the xArm."""
-        self.get_model().position.update()
-        self.update_method()
+        Entities register with the groups of their fields as context, see
+        listener_groups(). A position report then only reaches the position
+        entities, instead of every entity checking fields_changed().
+        """
+        groups = self._wake_groups
+        for update_callback, context in list(self._listeners.values()):
+            if groups is None or context is None or not groups.isdisjoint(context):
+                self.wakeups += 1
+                update_callback()
+            else:
+                self.suppressed_wakeups += 1
 
     def register_callbacks(self) -> None:
-        """Register the callbacks for the xArm."""
-        self.xarm.register_event_callback(self.event_handler)
+        """Register the report callbacks for the xArm."""
+        for name in REPORT_CALLBACKS:
+            getattr(self.xarm_client, f"register_{name}_callback")(self.event_handler)
+
+    def release_callbacks(self) -> None:
+        """Release the report callbacks registered with the xArm."""
+        for name in REPORT_CALLBACKS:
+            getattr(self.xarm_client, f"release_{name}_callback")(self.event_handler)
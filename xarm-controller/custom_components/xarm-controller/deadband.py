@@ -0,0 +1,78 @@
+"""Deadband and minimum interval filtering of sensor state writes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class DeadbandConfig:
+    """When a new sensor value is worth a state write, and a recorder row."""
+
+    # Changes up to this much from the last written value are dropped.
+    absolute: float = 0.0
+    # Same, as a fraction of the last written value. The larger of the two applies.
+    relative: float = 0.0
+    # Seconds between writes, a change arriving sooner is written once they have passed.
+    min_interval: float = 0.0
+
+
+class PublishFilter:
+    """Decide which values of a sensor are written, counting the ones held back.
+
+    Only numeric values are filtered, anything else (unknown, a string
+    state) is always written. Called on the event loop only.
+
+    Every offered value counts once: a change held back by min_interval is
+    counted when its delayed write is recorded, later changes folded into
+    that same write count as suppressed.
+    """
+
+    def __init__(self, config: DeadbandConfig) -> None:
+        self.config = config
+        self.published = 0
+        self.suppressed = 0
+        self._value: float | None = None
+        self._time = -math.inf
+        # A held back write is waiting for record().
+        self._deferred = False
+
+    def check(self, value: Any, now: float) -> float | None:
+        """Return 0 to write value now, seconds to hold the write back, or None to drop it."""
+        if not isinstance(value, (int, float)):
+            return 0.0
+        last = self._value
+        if last is not None:
+            threshold = max(self.config.absolute, self.config.relative * abs(last))
+            if abs(value - last) <= threshold:
+                self.suppressed += 1
+                return None
+        wait = self._time + self.config.min_interval - now
+        if wait > 0:
+            if self._deferred:
+                self.suppressed += 1
+            self._deferred = True
+            return wait
+        return 0.0
+
+    def record(self, value: Any, now: float) -> None:
+        """Remember a value that was written."""
+        self._value = value if isinstance(value, (int, float)) else None
+        self._time = now
+        self._deferred = False
+        self.published += 1
+
+    @property
+    def ratio(self) -> float:
+        """Return the share of the updates that were held back."""
+        total = self.published + self.suppressed
+        return self.suppressed / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "published": self.published,
+            "suppressed": self.suppressed,
+            "ratio": round(self.ratio, 3),
+        }
@@ -0,0 +1,105 @@
+"""Diagnostics support for the xArm controller."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from time import monotonic
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CONNECTION_MANAGER, DIAGNOSTICS_TELEMETRY_WINDOW, DOMAIN
+from .coordinator import XArmControllerUpdateCoordinator
+
+TO_REDACT = {CONF_HOST, ATTR_SERIAL_NUMBER, "serial"}
+
+
+def _performance(coordinator: XArmControllerUpdateCoordinator) -> dict[str, Any]:
+    """Return the command, polling and report timings kept in memory for an arm."""
+    dispatcher = coordinator.dispatcher
+    scheduler = coordinator.scheduler
+    coalescer = coordinator.coalescer
+    now = monotonic()
+    filters = coordinator.publish_filters
+    published = sum(publish_filter.published for publish_filter in filters.values())
+    suppressed = sum(publish_filter.suppressed for publish_filter in filters.values())
+    return {
+        "commands": {
+            "queue_depth": dispatcher.queue_depth,
+            "in_flight": dispatcher.in_flight.name if dispatcher.in_flight else None,
+            "recent": [asdict(timing) for timing in dispatcher.timings],
+            "priority": [asdict(timing) for timing in dispatcher.priority_timings],
+            "stats": {name: stats.as_dict() for name, stats in dispatcher.stats.items()},
+        },
+        "polling": {
+            "active": scheduler.active,
+            "offset": coordinator.poll_offset,
+            "groups": {
+                group: {
+                    "interval": schedule.interval,
+                    "active_interval": schedule.active_interval,
+                    "idle_interval": schedule.idle_interval,
+                    "polls": schedule.polls,
+                    "next_due_in": (
+                        round(schedule.next_due - now, 3) if schedule.next_due is not None else None
+                    ),
+                }
+                for group, schedule in scheduler.groups.items()
+            },
+        },
+        "listeners": {
+            "registered": len(coordinator._listeners),
+            "wakeups": coordinator.wakeups,
+            "suppressed": coordinator.suppressed_wakeups,
+        },
+        "state_writes": {
+            "published": published,
+            "suppressed": suppressed,
+            "ratio": round(suppressed / (published + suppressed), 3) if published + suppressed else 0.0,
+            "sensors": {key: publish_filter.as_dict() for key, publish_filter in filters.items()},
+        },
+        "motions": coordinator.motion.pending,
+        "reports": {
+            "max_rate": coalescer.max_rate,
+            "received": coalescer.received,
+            "flushed": coalescer.flushed,
+            "reduction": coalescer.reduction,
+            "flush_time": coalescer.flush_time,
+        },
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Everything comes from what the integration already keeps in memory, the
+    controller is not queried.
+    """
+    coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    manager = hass.data[DOMAIN][DATA_CONNECTION_MANAGER]
+    telemetry = coordinator.telemetry
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "model": async_redact_data(coordinator.get_xarm_model().snapshot(), TO_REDACT),
+        "connection": coordinator.connection.as_dict(),
+        "startup": coordinator.startup_timings,
+        "performance": _performance(coordinator),
+        "errors": list(coordinator.errors),
+        "event_loop": manager.loop_monitor.as_dict(),
+        "pool": manager.metrics(),
+        "telemetry": {
+            **telemetry.summary(),
+            "window": DIAGNOSTICS_TELEMETRY_WINDOW,
+            "history": await hass.async_add_executor_job(
+                telemetry.downsample, DIAGNOSTICS_TELEMETRY_WINDOW
+            ),
+        },
+    }
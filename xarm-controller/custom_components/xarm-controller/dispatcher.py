@@ -0,0 +1,238 @@
+"""Command dispatcher that keeps xArm SDK calls off the Home Assistant event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from time import monotonic
+from typing import Any
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, LOGGER
+
+DEFAULT_MAX_PENDING = 32
+TIMING_HISTORY = 50
+
+
+class CommandQueueFull(HomeAssistantError):
+    """Raised when too many commands are already waiting for an arm."""
+
+
+class CommandPreempted(HomeAssistantError):
+    """Raised for queued commands flushed by a priority command such as an emergency stop."""
+
+
+@dataclass
+class CommandTiming:
+    """Timing of a single command executed by the dispatcher."""
+
+    name: str
+    queue_wait: float
+    execution: float
+    success: bool
+
+
+@dataclass
+class CommandStats:
+    """Aggregated timings for all commands sharing a name."""
+
+    count: int = 0
+    failures: int = 0
+    total_queue_wait: float = 0.0
+    total_execution: float = 0.0
+    max_queue_wait: float = 0.0
+    max_execution: float = 0.0
+
+    def add(self, timing: CommandTiming) -> None:
+        self.count += 1
+        self.failures += 0 if timing.success else 1
+        self.total_queue_wait += timing.queue_wait
+        self.total_execution += timing.execution
+        self.max_queue_wait = max(self.max_queue_wait, timing.queue_wait)
+        self.max_execution = max(self.max_execution, timing.execution)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "avg_queue_wait": self.total_queue_wait / self.count if self.count else 0.0,
+            "avg_execution": self.total_execution / self.count if self.count else 0.0,
+            "max_queue_wait": self.max_queue_wait,
+            "max_execution": self.max_execution,
+        }
+
+
+@dataclass
+class _Command:
+    name: str
+    job: Callable[[], Any]
+    future: asyncio.Future | None = None
+    enqueued: float = field(default_factory=monotonic)
+    started: float = 0.0
+
+
+class XArmCommandDispatcher:
+    """Run xArm SDK calls one at a time on a worker thread owned by the arm.
+
+    Commands are queued on the event loop side and handed to the worker one by
+    one, so queued commands never overlap and callers simply await the result.
+    Stop commands take the priority lane instead: their own thread, which never
+    waits for the queue or the worker pool. A priority command therefore runs
+    concurrently with the command in flight, if any. That is on purpose, a stop
+    must not wait for a blocking move to finish, and safe: the SDK takes a lock
+    around every request on the controller socket, so the two calls only
+    interleave between requests, and stopping just makes the running move end
+    early with an error code.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        name: str,
+        executor: Executor | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._loop = loop
+        self.name = name
+        self.max_pending = max_pending
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{DOMAIN}-{name}"
+        )
+        # The thread is only started by the first priority command.
+        self._priority_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{DOMAIN}-{name}-priority"
+        )
+        self._pending: deque[_Command] = deque()
+        self._runner: asyncio.Task | None = None
+        self._closed = False
+        self.in_flight: _Command | None = None
+        self.timings: deque[CommandTiming] = deque(maxlen=TIMING_HISTORY)
+        self.stats: dict[str, CommandStats] = {}
+        self.priority_timings: deque[CommandTiming] = deque(maxlen=TIMING_HISTORY)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting to run."""
+        return len(self._pending)
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a command is queued or running."""
+        return self.in_flight is not None or bool(self._pending)
+
+    async def async_call(
+        self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Queue fn(*args, **kwargs) for the worker and wait for its result."""
+        if self._closed:
+            raise HomeAssistantError(f"Command dispatcher for {self.name} is closed")
+        if len(self._pending) >= self.max_pending:
+            raise CommandQueueFull(
+                f"Too many pending commands for {self.name} ({self.max_pending})"
+            )
+
+        command = _Command(
+            name=name, job=partial(fn, *args, **kwargs), future=self._loop.create_future()
+        )
+        self._pending.append(command)
+        if self._runner is None or self._runner.done():
+            self._runner = self._loop.create_task(self._async_run())
+        return await command.future
+
+    async def async_call_priority(
+        self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run fn(*args, **kwargs) right away on the priority lane, flushing the queue.
+
+        Queued commands fail with CommandPreempted. The command already running
+        can't be interrupted, but stopping the arm ends a blocking move early.
+        """
+        if self._closed:
+            raise HomeAssistantError(f"Command dispatcher for {self.name} is closed")
+        flushed = self._flush(CommandPreempted(f"Preempted by {name} on {self.name}"))
+        if flushed:
+            LOGGER.debug(f"{self.name}: {name} flushed {flushed} queued commands")
+
+        command = _Command(name=name, job=partial(fn, *args, **kwargs))
+        success = False
+        try:
+            result = await self._loop.run_in_executor(
+                self._priority_executor, self._execute, command
+            )
+            success = True
+        finally:
+            self.priority_timings.append(self._record(command, success=success))
+        return result
+
+    def _flush(self, error: Exception) -> int:
+        """Fail every queued command with error, returning how many were waiting."""
+        flushed = 0
+        while self._pending:
+            command = self._pending.popleft()
+            if not command.future.done():
+                command.future.set_exception(error)
+                flushed += 1
+        return flushed
+
+    async def _async_run(self) -> None:
+        """Feed queued commands to the worker in order."""
+        while self._pending:
+            command = self._pending.popleft()
+            if command.future.done():
+                # The caller gave up while the command was queued.
+                continue
+            self.in_flight = command
+            try:
+                result = await self._loop.run_in_executor(
+                    self._executor, self._execute, command
+                )
+            except Exception as error:  # noqa: BLE001
+                self._record(command, success=False)
+                if not command.future.done():
+                    command.future.set_exception(error)
+            else:
+                self._record(command, success=True)
+                if not command.future.done():
+                    command.future.set_result(result)
+            finally:
+                self.in_flight = None
+
+    @staticmethod
+    def _execute(command: _Command) -> Any:
+        """Run on the worker thread."""
+        command.started = monotonic()
+        return command.job()
+
+    def _record(self, command: _Command, success: bool) -> CommandTiming:
+        finished = monotonic()
+        started = command.started or finished
+        timing = CommandTiming(
+            name=command.name,
+            queue_wait=started - command.enqueued,
+            execution=finished - started,
+            success=success,
+        )
+        self.timings.append(timing)
+        self.stats.setdefault(command.name, CommandStats()).add(timing)
+        LOGGER.debug(
+            f"{self.name}: {command.name} waited {timing.queue_wait * 1000:.1f} ms, "
+            f"ran {timing.execution * 1000:.1f} ms"
+        )
+        return timing
+
+    def shutdown(self) -> None:
+        """Fail queued commands and release the worker threads."""
+        self._closed = True
+        while self._pending:
+            command = self._pending.popleft()
+            if not command.future.done():
+                command.future.cancel()
+        self._priority_executor.shutdown(wait=False)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
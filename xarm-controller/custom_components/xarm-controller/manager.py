@@ -0,0 +1,151 @@
+"""Resources shared by every xArm handled by the integration."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_CONNECTION_MANAGER,
+    DOMAIN,
+    LOGGER,
+    LOOP_BLOCK_THRESHOLD,
+    LOOP_INCIDENT_HISTORY,
+    LOOP_MONITOR_INTERVAL,
+    POLL_STAGGER_WINDOW,
+    WORKER_POOL_SIZE,
+)
+from .dispatcher import XArmCommandDispatcher
+
+if TYPE_CHECKING:
+    from .coordinator import XArmControllerUpdateCoordinator
+
+# Fractional part of the golden ratio, spreads poll offsets evenly for any number of arms.
+_GOLDEN_RATIO = 0.6180339887498949
+
+
+class EventLoopMonitor:
+    """Spot event loop blocking by checking how late a periodic timer fires.
+
+    A tick arriving more than threshold seconds after it was due means
+    something held the loop for that long, which also delays every report
+    flush and poll of every arm.
+    """
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        threshold: float = LOOP_BLOCK_THRESHOLD,
+    ) -> None:
+        self._loop = loop
+        self.interval = interval
+        self.threshold = threshold
+        self.incidents: deque[dict[str, Any]] = deque(maxlen=LOOP_INCIDENT_HISTORY)
+        self.max_lag = 0.0
+        self._due = 0.0
+        self._timer: TimerHandle | None = None
+
+    @callback
+    def async_start(self) -> None:
+        self._due = self._loop.time() + self.interval
+        self._timer = self._loop.call_at(self._due, self._async_tick)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    @callback
+    def _async_tick(self) -> None:
+        now = self._loop.time()
+        lag = now - self._due
+        self.max_lag = max(self.max_lag, lag)
+        if lag > self.threshold:
+            self.incidents.append({"time": dt_util.utcnow().isoformat(), "lag": round(lag, 3)})
+        self._due = now + self.interval
+        self._timer = self._loop.call_at(self._due, self._async_tick)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "threshold": self.threshold,
+            "max_lag": round(self.max_lag, 3),
+            "incidents": list(self.incidents),
+        }
+
+
+class XArmConnectionManager:
+    """Own the worker pool shared by all arms and spread their polls over time.
+
+    Every arm still gets its own dispatcher, so commands for one arm run one
+    at a time and in order, but the threads running them come from a single
+    bounded pool instead of one thread per arm.
+    """
+
+    def __init__(self, hass: HomeAssistant, pool_size: int = WORKER_POOL_SIZE) -> None:
+        self.hass = hass
+        self.pool_size = pool_size
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix=DOMAIN)
+        self.coordinators: dict[str, XArmControllerUpdateCoordinator] = {}
+        self._slots = 0
+        self.loop_monitor = EventLoopMonitor(hass.loop)
+        hass.loop.call_soon_threadsafe(self.loop_monitor.async_start)
+
+    def create_dispatcher(self, name: str) -> XArmCommandDispatcher:
+        """Return a dispatcher for one arm that runs on the shared pool."""
+        return XArmCommandDispatcher(self.hass.loop, name, executor=self.executor)
+
+    @callback
+    def async_register(self, entry_id: str, coordinator: XArmControllerUpdateCoordinator) -> float:
+        """Track an arm and return the offset in seconds of its first poll."""
+        self.coordinators[entry_id] = coordinator
+        offset = (self._slots * _GOLDEN_RATIO) % 1 * POLL_STAGGER_WINDOW
+        self._slots += 1
+        return offset
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Stop tracking an arm, returning True once no arm is left."""
+        self.coordinators.pop(entry_id, None)
+        return not self.coordinators
+
+    def shutdown(self) -> None:
+        """Release the worker threads."""
+        LOGGER.debug("Shutting down the shared xArm worker pool")
+        self.hass.loop.call_soon_threadsafe(self.loop_monitor.async_stop)
+        self.executor.shutdown(wait=False)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the aggregate load of every arm on the shared pool."""
+        coordinators = self.coordinators.values()
+        dispatchers = [coordinator.dispatcher for coordinator in coordinators]
+        busy = sum(dispatcher.in_flight is not None for dispatcher in dispatchers)
+        return {
+            "arms": len(self.coordinators),
+            "connected": sum(c.get_xarm_model().state.connected for c in coordinators),
+            "pool_size": self.pool_size,
+            "busy_workers": busy,
+            "utilization": busy / self.pool_size,
+            "queued_commands": sum(dispatcher.queue_depth for dispatcher in dispatchers),
+            "reports_received": sum(c.coalescer.received for c in coordinators),
+            "updates_flushed": sum(c.coalescer.flushed for c in coordinators),
+            "polls": sum(
+                schedule.polls for c in coordinators for schedule in c.scheduler.groups.values()
+            ),
+        }
+
+
+@callback
+def async_get_manager(hass: HomeAssistant) -> XArmConnectionManager:
+    """Return the integration's connection manager, creating it for the first arm."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_CONNECTION_MANAGER not in data:
+        data[DATA_CONNECTION_MANAGER] = XArmConnectionManager(hass)
+    return data[DATA_CONNECTION_MANAGER]
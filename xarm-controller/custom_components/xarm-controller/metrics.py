@@ -0,0 +1,261 @@
+"""Counters and latency histograms for the xArm SDK calls and reports of one arm."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from functools import wraps
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from homeassistant.helpers.http import KEY_HASS, HomeAssistantView
+
+from .const import DATA_CONNECTION_MANAGER, DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import XArmControllerUpdateCoordinator
+
+# Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds of history behind the report rates.
+RATE_WINDOW = 10
+
+# Report type of each report key, named after the SDK callback delivering it.
+REPORT_TYPES = {
+    "cartesian": "report_location",
+    "joints": "report_location",
+    "connected": "connect_changed",
+    "state": "state_changed",
+    "mode": "mode_changed",
+    "mtable": "mtable_mtbrake_changed",
+    "mtbrake": "mtable_mtbrake_changed",
+    "error_code": "error_warn_changed",
+    "warn_code": "error_warn_changed",
+    "temperatures": "temperature_changed",
+    "count": "count_changed",
+    "cmdnum": "cmdnum_changed",
+}
+# Client attributes that are passed through without timing.
+_UNTIMED_PREFIXES = ("register_", "release_")
+
+
+class Histogram:
+    """Latency histogram with fixed bucket bounds."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        # One count per bound plus the overflow (+Inf) bucket, not cumulative.
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (le, count) pairs as exposed in the text format."""
+        total = 0
+        buckets = []
+        for bound, count in zip((*map(str, self.bounds), "+Inf"), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class RateCounter:
+    """Count events in one-second slots to report the rate over the last window seconds."""
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        self.window = window
+        self.total = 0
+        self._slots = [0] * window
+        self._second = int(monotonic())
+
+    def _advance(self, second: int) -> None:
+        for slot in range(self._second + 1, min(second, self._second + self.window) + 1):
+            self._slots[slot % self.window] = 0
+        self._second = max(second, self._second)
+
+    def add(self) -> None:
+        second = int(monotonic())
+        if second != self._second:
+            self._advance(second)
+        self._slots[second % self.window] += 1
+        self.total += 1
+
+    def rate(self) -> float:
+        """Return the events per second over the last complete window."""
+        second = int(monotonic())
+        self._advance(second)
+        # The current second is still filling up, leave it out.
+        return (sum(self._slots) - self._slots[second % self.window]) / (self.window - 1)
+
+
+class XArmMetrics:
+    """Metrics of one arm, updated from the worker, report and event loop threads."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.calls: dict[str, Histogram] = {}
+        self.call_errors: dict[str, int] = {}
+        self.reports: dict[str, RateCounter] = {}
+        self.callbacks = Histogram()
+
+    def record_call(self, method: str, duration: float, failed: bool) -> None:
+        with self._lock:
+            histogram = self.calls.get(method)
+            if histogram is None:
+                histogram = self.calls[method] = Histogram()
+            histogram.observe(duration)
+            if failed:
+                self.call_errors[method] = self.call_errors.get(method, 0) + 1
+
+    def record_report(self, report: dict, duration: float) -> None:
+        """Count a report by type and time the callback that handled it."""
+        report_type = REPORT_TYPES.get(next(iter(report), None), "other")
+        with self._lock:
+            counter = self.reports.get(report_type)
+            if counter is None:
+                counter = self.reports[report_type] = RateCounter()
+            counter.add()
+            self.callbacks.observe(duration)
+
+    def call_totals(self) -> tuple[int, float]:
+        """Return the number of SDK calls and the seconds they took, over all methods."""
+        with self._lock:
+            return (
+                sum(histogram.count for histogram in self.calls.values()),
+                sum(histogram.sum for histogram in self.calls.values()),
+            )
+
+    def report_rates(self) -> dict[str, float]:
+        """Return the reports per second of each report type."""
+        with self._lock:
+            return {name: counter.rate() for name, counter in self.reports.items()}
+
+
+def _failed(result: Any) -> bool:
+    """Return True for an SDK result carrying a non-zero API code."""
+    code = result[0] if isinstance(result, tuple) and result else result
+    return isinstance(code, int) and not isinstance(code, bool) and code != 0
+
+
+class InstrumentedClient:
+    """Proxy around an XArmAPI that times every method call.
+
+    Properties are passed through untouched, they are served from values the
+    SDK caches from its report socket. Only used while metrics are enabled,
+    so the plain client pays nothing otherwise.
+    """
+
+    def __init__(self, client: Any, metrics: XArmMetrics) -> None:
+        self._client = client
+        self._metrics = metrics
+        self._wrapped: dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._client, name)
+        if not callable(value) or name.startswith(_UNTIMED_PREFIXES):
+            return value
+        wrapped = self._wrapped.get(name)
+        if wrapped is None:
+            wrapped = self._wrapped[name] = self._instrument(name)
+        return wrapped
+
+    def _instrument(self, name: str) -> Callable[..., Any]:
+        method = getattr(self._client, name)
+        record_call = self._metrics.record_call
+
+        @wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                record_call(name, perf_counter() - started, True)
+                raise
+            record_call(name, perf_counter() - started, _failed(result))
+            return result
+
+        return timed
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_metrics(coordinators: Iterable[XArmControllerUpdateCoordinator]) -> str:
+    """Render the metrics of every arm with metrics enabled in the Prometheus text format."""
+    families: dict[str, tuple[str, str, list[str]]] = {
+        "xarm_sdk_call_seconds": ("histogram", "Latency of xArm SDK calls.", []),
+        "xarm_sdk_call_errors_total": ("counter", "xArm SDK calls that failed or returned an error code.", []),
+        "xarm_callback_seconds": ("histogram", "Time spent in the SDK report callback.", []),
+        "xarm_reports_total": ("counter", "Reports received from the arm.", []),
+        "xarm_report_rate": ("gauge", "Reports per second received from the arm.", []),
+        "xarm_coordinator_flushes_total": ("counter", "Coalesced report snapshots written to the entities.", []),
+        "xarm_polls_total": ("counter", "Model group polls.", []),
+    }
+
+    def histogram(family: str, histogram: Histogram, **labels: str) -> None:
+        lines = families[family][2]
+        for bound, count in histogram.cumulative():
+            lines.append(f"{family}_bucket{_labels(**labels, le=bound)} {count}")
+        lines.append(f"{family}_sum{_labels(**labels)} {histogram.sum}")
+        lines.append(f"{family}_count{_labels(**labels)} {histogram.count}")
+
+    for coordinator in coordinators:
+        metrics = coordinator.metrics
+        if metrics is None:
+            continue
+        arm = coordinator.get_xarm_model().info.serial
+        with metrics._lock:
+            for method, calls in sorted(metrics.calls.items()):
+                histogram("xarm_sdk_call_seconds", calls, arm=arm, method=method)
+            for method, errors in sorted(metrics.call_errors.items()):
+                families["xarm_sdk_call_errors_total"][2].append(
+                    f"xarm_sdk_call_errors_total{_labels(arm=arm, method=method)} {errors}"
+                )
+            histogram("xarm_callback_seconds", metrics.callbacks, arm=arm)
+            for report, counter in sorted(metrics.reports.items()):
+                families["xarm_reports_total"][2].append(
+                    f"xarm_reports_total{_labels(arm=arm, report=report)} {counter.total}"
+                )
+                families["xarm_report_rate"][2].append(
+                    f"xarm_report_rate{_labels(arm=arm, report=report)} {counter.rate()}"
+                )
+        families["xarm_coordinator_flushes_total"][2].append(
+            f"xarm_coordinator_flushes_total{_labels(arm=arm)} {coordinator.coalescer.flushed}"
+        )
+        for group, schedule in coordinator.scheduler.groups.items():
+            families["xarm_polls_total"][2].append(
+                f"xarm_polls_total{_labels(arm=arm, group=group)} {schedule.polls}"
+            )
+
+    lines = []
+    for family, (kind, description, samples) in families.items():
+        lines += [f"# HELP {family} {description}", f"# TYPE {family} {kind}", *samples]
+    return "\n".join(lines) + "\n"
+
+
+class XArmMetricsView(HomeAssistantView):
+    """Serve the metrics of every arm in the Prometheus text format."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        hass = request.app[KEY_HASS]
+        manager = hass.data.get(DOMAIN, {}).get(DATA_CONNECTION_MANAGER)
+        coordinators = manager.coordinators.values() if manager is not None else ()
+        return web.Response(
+            text=render_metrics(coordinators), content_type="text/plain", charset="utf-8"
+        )
@@ -1,13 +1,46 @@
 """Data models that represent an Xarm Controller"""
 
+from __future__ import annotations
+
 # import functools
+from array import array
+from time import monotonic, sleep
 from typing import overload
 from dataclasses import dataclass
-from typing import List, Iterable, Optional
-
-from .const import API_ERRORS, GRIPPER_ERROR_CODES, LOGGER, LOGGERFORHA
-
-from xarm.wrapper import XArmAPI
+from typing import TYPE_CHECKING, List, Iterable, Optional
+
+from .codes import (
+    CONTROLLER_ERRORS,
+    CONTROLLER_WARNINGS,
+    GRIPPER_ERRORS,
+    SERVO_ERRORS,
+    DecodedCode,
+)
+from .const import (
+    ATTR_ACCELERATION,
+    ATTR_RADIUS,
+    ATTR_SPEED,
+    END_EFFECTOR_HAS_FAULT,
+    GRIPPER_CLOSED_POSITION,
+    GRIPPER_OPEN_POSITION,
+    GROUP_GRIPPER,
+    GROUP_INFO,
+    GROUP_JOINTS,
+    GROUP_POSITION,
+    GROUP_STATE,
+    LITE6_DEVICE_TYPE,
+    LOGGER,
+    LOGGERFORHA,
+    PITCH,
+    POS_X,
+    POS_Y,
+    POS_Z,
+    ROLL,
+    YAW,
+)
+
+if TYPE_CHECKING:
+    from xarm.wrapper import XArmAPI
 
 
 # TODO: Add error handling for certain methods
@@ -19,13 +52,14 @@ from xarm.wrapper import XArmAPI
 #     return wrapper
 
 
-def interpret_error_code(model: dataclass) -> None:
-    """Interpret the error code from the Xarm Controller."""
-    if model.error_code in model.error_map:
-        if model.__class__ == "Gripper" and getattr(model, "callback"):
-            model.callback({"gripper_err_code": model.error_code})
-        model.error_msg = model.error_map[model.error_code]
-    return "Unknown error"
+def set_field(model: dataclass, name: str, value: any, changed: set[str]) -> None:
+    """Assign a model field, recording its name in changed if the value differs."""
+    if isinstance(value, list):
+        # The SDK may hand back a list it keeps mutating, keep our own copy.
+        value = list(value)
+    if getattr(model, name, None) != value:
+        setattr(model, name, value)
+        changed.add(name)
 
 
 # TODO: add AttrReader to all attributes in other classes
@@ -46,9 +80,9 @@ class Gripper:
 
     error_code: int
     error_msg: str
-    error_map: dict[int, str]
     speed: int
     position: int
+    present: Optional[bool]
     version: int
     # set_gripper_enable: Callable[..., int]
     # set_gripper_mode: Callable[..., int]
@@ -63,11 +97,15 @@ class Gripper:
         self.callback = callback
 
         self.error_code = 0
-        self.error_map = GRIPPER_ERROR_CODES
-        self.error_msg = interpret_error_code(self)
+        self.error_msg = self.error.message
         self.speed = 0
         self.position = 0
+        self.present = None  # Unknown until the version has been read.
         self.version = 0
+        self.latency = 0.0
+        self._static_loaded = False
+        # The SDK doesn't expose the gripper speed, it is the last one we set.
+        self._requested_speed = 0
         # self._read_version = self.xarm_client.get_gripper_version()
         # self.set_gripper_enable = xarm.set_gripper_enable
         # self.set_gripper_mode = xarm.set_gripper_mode
@@ -77,14 +115,46 @@ class Gripper:
         # self.open_lite6_gripper = xarm.open_lite6_gripper
         # self.stop_lite6_gripper = xarm.stop_lite6_gripper
 
-    def update(self) -> None:
-        """Update the gripper data."""
-
-        self.error_code = self.xarm_client.get_gripper_err_code()
-        self.error_msg = interpret_error_code(self)
-        self.speed = self.xarm_client.get_speed()
-        self.position = self.xarm_client.get_position()
-        self.version = self.xarm_client.get_gripper_version()
+    def update(self) -> set[str]:
+        """Update the gripper data, returning the names of the fields that changed."""
+        changed = set()
+        if not self._static_loaded:
+            # The gripper firmware version can't change while connected, and a failed
+            # read tells us there is no gripper to talk to.
+            code, version = self.xarm_client.get_gripper_version()
+            set_field(self, "present", code == 0, changed)
+            set_field(self, "version", version, changed)
+            self._static_loaded = True
+        if not self.present:
+            return changed
+
+        started = monotonic()
+        result = self.xarm_client.get_gripper_position()
+        if isinstance(result, tuple):
+            code, position = result
+            if code == 0:
+                # The SDK checks the error code along with the position and only
+                # returns a tuple when the gripper has no fault.
+                set_field(self, "error_code", 0, changed)
+                if position is not None:
+                    set_field(self, "position", position, changed)
+        elif result == END_EFFECTOR_HAS_FAULT:
+            code, error_code = self.xarm_client.get_gripper_err_code()
+            if code == 0:
+                set_field(self, "error_code", error_code, changed)
+        self.latency = monotonic() - started
+        set_field(self, "error_msg", self.error.message, changed)
+        set_field(self, "speed", self._requested_speed, changed)
+        LOGGER.debug(f"Gripper snapshot read in {self.latency * 1000:.1f} ms")
+        return changed
+
+    @property
+    def error(self) -> DecodedCode:
+        return GRIPPER_ERRORS.decode(self.error_code)
+
+    def invalidate_static(self) -> None:
+        """Re-read static fields on the next update, e.g. after a reconnect."""
+        self._static_loaded = False
 
     # def set_position(self, position: int):
     #     self.interpret_error_code(self.xarm_client.set_gripper_mode(0))
@@ -93,12 +163,14 @@ class Gripper:
     #         self.xarm_client.set_position(position, wait=True)
     #     )
 
+    # Gripper motions don't wait, the coordinator's MotionTracker follows them to the end.
+
     def open(self, is_lite6: bool):
         # TODO: find out open position for non lite6 gripper
         if is_lite6:
             self.xarm_client.open_lite6_gripper()
         else:
-            self.xarm_client.set_position(1000, wait=True)
+            self.xarm_client.set_gripper_position(GRIPPER_OPEN_POSITION, wait=False)
 
     def stop(self, is_lite6: bool):
         if is_lite6:
@@ -109,15 +181,16 @@ class Gripper:
         if is_lite6:
             self.xarm_client.close_lite6_gripper()
         else:
-            self.xarm_client.set_position(0, wait=True)
+            self.xarm_client.set_gripper_position(GRIPPER_CLOSED_POSITION, wait=False)
 
-    def set_position(self, position: int):
-        self.xarm_client.set_position(position, wait=True)
+    def set_position(self, position: int) -> int:
+        return self.xarm_client.set_gripper_position(position, wait=False)
 
     def initialize(self):
         self.xarm_client.set_gripper_mode(0)
         self.xarm_client.set_gripper_enable(True)
-        self.xarm_client.set_speed(5000)  # TODO: Determine good gripper speed
+        if self.xarm_client.set_gripper_speed(5000) == 0:  # TODO: Determine good gripper speed
+            self._requested_speed = 5000
         self.xarm_client.clean_gripper_error()
 
 
@@ -149,16 +222,27 @@ class ArmPosition:
         self.pitch = self.position[4]
         self.yaw = self.position[5]
 
-    def update(self):
-        """Update the arm position data."""
-
-        self.position = self.xarm_client.position
-        self.x = self.position[0]
-        self.y = self.position[1]
-        self.z = self.position[2]
-        self.roll = self.position[3]
-        self.pitch = self.position[4]
-        self.yaw = self.position[5]
+    def update(self) -> set[str]:
+        """Update the arm position data, returning the names of the fields that changed."""
+        changed = set()
+        self._set_cartesian(self.xarm_client.position, changed)
+        return changed
+
+    def apply_location(self, report: dict) -> set[str]:
+        """Apply the cartesian part of a location report ({"cartesian": [...]}) pushed by the SDK."""
+        changed = set()
+        self._set_cartesian(report["cartesian"], changed)
+        return changed
+
+    def _set_cartesian(self, position: List[float], changed: set[str]) -> None:
+        set_field(self, "position", position, changed)
+        if "position" in changed:
+            set_field(self, "x", self.position[0], changed)
+            set_field(self, "y", self.position[1], changed)
+            set_field(self, "z", self.position[2], changed)
+            set_field(self, "roll", self.position[3], changed)
+            set_field(self, "pitch", self.position[4], changed)
+            set_field(self, "yaw", self.position[5], changed)
 
     def set_target_position(
         self, target_x: int = None, target_y: int = None, target_z: int = None
@@ -173,6 +257,41 @@ class ArmPosition:
     def set_position_to_targets(self):
         self.xarm_client.set_position(x=self.target_x, y=self.target_y, z=self.target_z)
 
+    def move_trajectory(
+        self, poses: List[dict], speed: float, acceleration: float, radius: float
+    ) -> tuple[int, int]:
+        """Queue poses on the controller without waiting between them.
+
+        Every pose but the last is blended into the next one with its radius, so
+        the path runs as one continuous motion. Poses may override speed,
+        acceleration and radius. Returns the API code and the index of the pose
+        it belongs to, (0, len(poses)) once every pose is queued.
+
+        When a pose is rejected the poses before it are already queued, the
+        arm is stopped to flush them rather than run a truncated path, then
+        made ready for the next command.
+        """
+        last = len(poses) - 1
+        for index, pose in enumerate(poses):
+            code = self.xarm_client.set_position(
+                x=pose[POS_X],
+                y=pose[POS_Y],
+                z=pose[POS_Z],
+                roll=pose.get(ROLL),
+                pitch=pose.get(PITCH),
+                yaw=pose.get(YAW),
+                radius=pose.get(ATTR_RADIUS, radius) if index < last else None,
+                speed=pose.get(ATTR_SPEED, speed),
+                mvacc=pose.get(ATTR_ACCELERATION, acceleration),
+                wait=False,
+            )
+            if code != 0:
+                if index > 0:
+                    self.xarm_client.set_state(4)  # Stop, clearing the motion queue.
+                    self.xarm_client.set_state(0)
+                return code, index
+        return 0, len(poses)
+
 
 @dataclass
 class State:
@@ -183,60 +302,105 @@ class State:
     counter: int
     error_code: int
     error_msg: str
-    error_map: dict[int, str]
     has_error: bool
     has_err_warn: bool
     has_warn: bool
     is_moving: int
     mode: int
-    motor_brake_states: list[int]
-    motor_enable_states: List[int]
     self_collision_params: Iterable  # :return: params, params[0]: self collision detection or not, params[1]: self collision tool type, params[2]: self collision model params
-    servo_codes: list[list[int]]
     state: int
-    temperatures: list[int]
     warn_code: int
+    warn_msg: str
 
     def __init__(self, xarm_client: XArmAPI):
         self.xarm_client = xarm_client
         self.collision_sensitivity = 0
-        self.connected = True
+        self.connected = False
         self.counter = 0
         self.error_code = 0
-        self.error_msg = ""
-        self.error_map = API_ERRORS
+        self.error_msg = self.error.message
         self.has_error = False
         self.has_err_warn = False
         self.has_warn = False
         self.is_moving = False
         self.mode = 0
-        self.motor_brake_states = [1, 1, 1, 1, 1, 1]
-        self.motor_enable_states = [1, 1, 1, 1, 1, 1]
         self.self_collision_params = [1, 1, 0]
-        self.servo_codes = [[1, 0], [1, 0], [1, 0], [1, 0], [1, 0], [1, 0]]
         self.state = 1
         self.warn_code = 0
-        self.warn_msg = "warn"
-
-    def update(self):
-        """Update the state data."""
-
-        self.collision_sensitivity = self.xarm_client.collision_sensitivity
-        self.connected = self.xarm_client.connected
-        self.error_code = self.xarm_client.error_code
-        self.error_msg = interpret_error_code(self)
-        self.has_error = self.xarm_client.has_error
-        self.has_err_warn = self.xarm_client.has_err_warn
-        self.has_warn = self.xarm_client.has_warn
-        self.is_moving = self.xarm_client.get_is_moving()
-        self.mode = self.xarm_client.mode
-        self.motor_brake_states = self.xarm_client.motor_brake_states
-        self.motor_enable_states = self.xarm_client.motor_enable_states
-        self.self_collision_params = self.xarm_client.self_collision_params
-        self.servo_codes = self.xarm_client.servo_codes
-        self.state = self.xarm_client.state
-        self.warn_code = self.xarm_client.warn_code
-        # self.warn_msg = self.xarm_client.warn_msg
+        self.warn_msg = self.warn.message
+        self._static_loaded = False
+
+    def update(self) -> set[str]:
+        """Update the state data, returning the names of the fields that changed."""
+        changed = set()
+        client = self.xarm_client
+        set_field(self, "collision_sensitivity", client.collision_sensitivity, changed)
+        set_field(self, "connected", client.connected, changed)
+        set_field(self, "error_code", client.error_code, changed)
+        set_field(self, "error_msg", self.error.message, changed)
+        set_field(self, "has_error", client.has_error, changed)
+        set_field(self, "has_err_warn", client.has_err_warn, changed)
+        set_field(self, "has_warn", client.has_warn, changed)
+        set_field(self, "mode", client.mode, changed)
+        if not self._static_loaded:
+            set_field(self, "self_collision_params", client.self_collision_params, changed)
+            self._static_loaded = True
+        set_field(self, "state", client.state, changed)
+        # get_is_moving() costs another get_state round trip, STATES 1 is "in motion".
+        set_field(self, "is_moving", self.state == 1, changed)
+        set_field(self, "warn_code", client.warn_code, changed)
+        set_field(self, "warn_msg", self.warn.message, changed)
+        return changed
+
+    @property
+    def error(self) -> DecodedCode:
+        return CONTROLLER_ERRORS.decode(self.error_code)
+
+    @property
+    def warn(self) -> DecodedCode:
+        return CONTROLLER_WARNINGS.decode(self.warn_code)
+
+    def invalidate_static(self) -> None:
+        """Re-read static fields on the next update, e.g. after a reconnect."""
+        self._static_loaded = False
+
+    def apply_state(self, report: dict) -> set[str]:
+        """Apply a state report ({"state": int}) pushed by the SDK."""
+        changed = set()
+        set_field(self, "state", report["state"], changed)
+        # STATES 1 is "in motion", no need to ask the controller.
+        set_field(self, "is_moving", report["state"] == 1, changed)
+        return changed
+
+    def apply_mode(self, report: dict) -> set[str]:
+        """Apply a mode report ({"mode": int}) pushed by the SDK."""
+        changed = set()
+        set_field(self, "mode", report["mode"], changed)
+        return changed
+
+    def apply_error_warn(self, report: dict) -> set[str]:
+        """Apply an error/warn report ({"error_code": int, "warn_code": int}) pushed by the SDK."""
+        changed = set()
+        set_field(self, "error_code", report["error_code"], changed)
+        set_field(self, "error_msg", self.error.message, changed)
+        set_field(self, "warn_code", report["warn_code"], changed)
+        set_field(self, "warn_msg", self.warn.message, changed)
+        set_field(self, "has_error", self.error_code != 0, changed)
+        set_field(self, "has_warn", self.warn_code != 0, changed)
+        set_field(self, "has_err_warn", self.has_error or self.has_warn, changed)
+        return changed
+
+    def apply_count(self, report: dict) -> set[str]:
+        """Apply a count report ({"count": int}) pushed by the SDK."""
+        changed = set()
+        set_field(self, "counter", report["count"], changed)
+        return changed
+
+    def apply_connect(self, report: dict) -> set[str]:
+        """Apply a connection report ({"connected": bool, "reported": bool}) pushed by the SDK."""
+        changed = set()
+        set_field(self, "connected", bool(report["connected"]), changed)
+        return changed
 
     def set_collision_sensitivity(self, sensitivity: int):
         if sensitivity < 1 or sensitivity > 5:
@@ -244,6 +408,91 @@ class State:
         err, _ = self.xarm_client.set_collision_sensitivity(sensitivity)
 
 
+class Joints:
+    """Per-joint snapshot of the arm, one compact array per quantity.
+
+    Arrays hold one value per joint and are sized by Info.axis (5, 6 or 7).
+    Changed values are reported per joint, e.g. "angle3" or "temperature1".
+    """
+
+    # Quantity name and array typecode. The SDK reports a [status, code] pair per
+    # servo, split into servo_status and servo_code.
+    QUANTITIES = {
+        "angle": "f",
+        "temperature": "f",
+        "current": "f",
+        "brake": "b",
+        "enabled": "b",
+        "servo_status": "i",
+        "servo_code": "i",
+    }
+
+    def __init__(self, xarm_client: XArmAPI, axis: int = 7):
+        self.xarm_client = xarm_client
+        self.resize(axis)
+
+    def resize(self, axis: int) -> None:
+        """Allocate zeroed arrays for axis joints."""
+        self.axis = axis
+        for quantity, typecode in self.QUANTITIES.items():
+            setattr(self, quantity, array(typecode, [0] * axis))
+
+    def _set(self, quantity: str, values: Iterable, changed: set[str]) -> None:
+        """Store values for the first axis joints, recording "<quantity><joint>" for changes."""
+        current = getattr(self, quantity)
+        new = array(current.typecode, list(values)[: self.axis])
+        new.extend(current[len(new) :])
+        for joint, (old, value) in enumerate(zip(current, new), start=1):
+            if old != value:
+                changed.add(f"{quantity}{joint}")
+        if new != current:
+            setattr(self, quantity, new)
+
+    def update(self) -> set[str]:
+        """Read every per-joint value the SDK caches from its report socket, without a request."""
+        changed = set()
+        client = self.xarm_client
+        self._set("angle", client.angles, changed)
+        self._set("temperature", client.temperatures, changed)
+        self._set("current", client.currents, changed)
+        self._set("brake", client.motor_brake_states, changed)
+        self._set("enabled", client.motor_enable_states, changed)
+        servo_codes = client.servo_codes
+        self._set("servo_status", (status for status, _ in servo_codes), changed)
+        self._set("servo_code", (code for _, code in servo_codes), changed)
+        return changed
+
+    def servo_faults(self) -> dict[int, DecodedCode]:
+        """Return the decoded servo error of the joints that have one.
+
+        The status is kept as reported, the SDK has no table to decode it.
+        """
+        return {
+            joint: SERVO_ERRORS.decode(code)
+            for joint, code in enumerate(self.servo_code, start=1)
+            if code
+        }
+
+    def apply_angles(self, report: dict) -> set[str]:
+        """Apply the joint part of a location report ({"joints": [...]}) pushed by the SDK."""
+        changed = set()
+        self._set("angle", report["joints"], changed)
+        return changed
+
+    def apply_temperatures(self, report: dict) -> set[str]:
+        """Apply a temperature report ({"temperatures": [...]}) pushed by the SDK."""
+        changed = set()
+        self._set("temperature", report["temperatures"], changed)
+        return changed
+
+    def apply_motor_states(self, report: dict) -> set[str]:
+        """Apply a motor enable/brake report ({"mtable": [...], "mtbrake": [...]}) pushed by the SDK."""
+        changed = set()
+        self._set("enabled", report["mtable"], changed)
+        self._set("brake", report["mtbrake"], changed)
+        return changed
+
+
 @dataclass
 class Info:
     """Data model for the Xarm Controller info."""
@@ -255,12 +504,15 @@ class Info:
     version: int
     version_number: tuple[int]
 
-    def __init__(self, xarm_client: XArmAPI):
+    def __init__(self, xarm_client: XArmAPI, serial: str | None = None):
         self.xarm_client = xarm_client
         self.axis = 0
         self.device_type = 1
         self.is_lite6 = True
-        self.serial = xarm_client.sn
+        # Known from the config entry before the first connect, so entity ids don't wait for
+        # it. The configured serial is kept afterwards, unique ids must not change.
+        self._configured_serial = serial
+        self.serial = serial if serial is not None else xarm_client.sn
         self.version = 1
         self.version_number = (1, 0, 0)
         # self.device_type = self.xarm_client.device_type or 1
@@ -268,45 +520,119 @@ class Info:
         # self.version = self.xarm_client.version or 1
         # self.version_number = self.xarm_client.version_number or (1, 0, 0)
 
-    def update(self):
-        old_data = f"{self.__dict__}"
+    def update(self) -> set[str]:
+        """Update the info data, returning the names of the fields that changed."""
+        changed = set()
+        set_field(self, "axis", self.xarm_client.axis, changed)
+        set_field(self, "device_type", self.xarm_client.device_type, changed)
+        set_field(self, "is_lite6", is_lite6(self.xarm_client), changed)
+        if self._configured_serial is None:
+            set_field(self, "serial", self.xarm_client.sn, changed)
+        set_field(self, "version", self.xarm_client.version, changed)
+        set_field(self, "version_number", self.xarm_client.version_number, changed)
+        return changed
+
+
+def is_lite6(client: XArmAPI) -> bool:
+    """Return True for a Lite 6, from its public axis and device type properties."""
+    return client.axis == 6 and client.device_type == LITE6_DEVICE_TYPE
 
-        self.axis = self.xarm_client.axis
-        self.device_type = self.xarm_client.device_type
-        self.is_lite6 = self.xarm_client.is_lite6
-        self.serial = self.xarm_client.sn
-        self.version = self.xarm_client.version
-        self.version_number = self.xarm_client.version_number
 
-        new_data = f"{self.__dict__}"
+@dataclass(frozen=True)
+class Capabilities:
+    """What an arm is fitted with, deciding which entities it gets.
+
+    Stored with the config entry, so the entities are known at startup
+    before the arm has been reached.
+    """
+
+    axis: int
+    is_lite6: bool
+    # An xArm gripper answered. The Lite 6 gripper is driven through IO and can't be detected.
+    gripper: bool
 
-        return old_data != new_data
+    @property
+    def can_grip(self) -> bool:
+        """Return True if the gripper commands are worth offering."""
+        return self.gripper or self.is_lite6
+
+
+# Attributes that are plumbing or constant tables rather than arm state.
+_SNAPSHOT_EXCLUDED = {"xarm_client", "callback"}
 
 
 @dataclass
 class XArmData:
     """Data model for the Xarm Controller."""
 
-    def __init__(self, xarm_client: XArmAPI, callback: callable):
+    def __init__(self, xarm_client: XArmAPI, callback: callable, serial: str | None = None):
         self.xarm_client = xarm_client
         self.callback = callback
         self.gripper = Gripper(xarm_client, callback)
         self.position = ArmPosition(xarm_client)
         self.state = State(xarm_client)
-        self.info = Info(xarm_client)
-
-    def update(self, data):
-        send_event = False
-        send_event = send_event | self.gripper.update()
-        send_event = send_event | self.position.update()
-        send_event = send_event | self.state.update()
-        send_event = send_event | self.info.update()
-
-    def _interpret_error_code(self, error_code):
-        pass
+        self.info = Info(xarm_client, serial)
+        self.joints = Joints(xarm_client)
+
+    def groups(self) -> dict[str, object]:
+        """Return the model groups keyed by name."""
+        # Info comes first, the other groups depend on what it says about the arm.
+        return {
+            GROUP_INFO: self.info,
+            GROUP_GRIPPER: self.gripper,
+            GROUP_POSITION: self.position,
+            GROUP_STATE: self.state,
+            GROUP_JOINTS: self.joints,
+        }
+
+    def update_group(self, group: str) -> set[str]:
+        """Refresh a single model group, returning its qualified dirty fields."""
+        if group == GROUP_GRIPPER and self.info.is_lite6:
+            # The Lite 6 gripper is driven through IO and has no feedback to read.
+            return set()
+        dirty = {f"{group}.{name}" for name in self.groups()[group].update()}
+        if group == GROUP_INFO and self.info.axis and self.info.axis != self.joints.axis:
+            self.joints.resize(self.info.axis)
+        return dirty
+
+    def update_groups(self, groups: Iterable[str]) -> set[str]:
+        """Refresh the given model groups, returning their qualified dirty fields."""
+        dirty = set()
+        for group in groups:
+            dirty |= self.update_group(group)
+        return dirty
+
+    def update(self) -> set[str]:
+        """Refresh every model group.
+
+        Returns the dirty-set of fields that changed, qualified by their group,
+        e.g. {"position.x", "state.state"}. An empty set means nothing changed.
+        """
+        return self.update_groups(self.groups())
+
+    def capabilities(self) -> Capabilities:
+        """Return the capability profile, once the info and gripper groups have been read."""
+        return Capabilities(self.info.axis, self.info.is_lite6, bool(self.gripper.present))
+
+    def invalidate_static(self) -> None:
+        """Re-read fields that never change while connected, used after a reconnect."""
+        self.gripper.invalidate_static()
+        self.state.invalidate_static()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Return the cached values of every group, without reading from the arm."""
+        return {
+            group: {
+                name: list(value) if isinstance(value, (array, tuple)) else value
+                for name, value in vars(model).items()
+                if not name.startswith("_") and name not in _SNAPSHOT_EXCLUDED
+            }
+            for group, model in self.groups().items()
+        }
 
     def clear_errors(self):
-        self.xarm_client.clear_errors()
+        self.xarm_client.clean_error()
+        self.xarm_client.clean_warn()
 
     def emergency_stop(self):
         self.xarm_client.emergency_stop()
@@ -321,8 +647,11 @@ class XArmData:
     def open_gripper(self):
         self.gripper.open(self.info.is_lite6)
 
-    def close_gripper(self, position: Optional[int] = None):
-        self.gripper.close(position if position is not None else 0, self.info.is_lite6)
+    def close_gripper(self):
+        self.gripper.close(self.info.is_lite6)
+
+    def stop_gripper(self):
+        self.gripper.stop(self.info.is_lite6)
 
     def initialize(self):
         """callback to re-initialize the xArm"""
@@ -330,4 +659,4 @@ class XArmData:
         self.xarm_client.clean_error()
         self.xarm_client.set_mode(0)
         self.xarm_client.set_state(0)
-        self.xarm_client.sleep(1)
+        sleep(1)
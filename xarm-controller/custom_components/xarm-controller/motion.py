@@ -0,0 +1,176 @@
+"""Completion of arm and gripper motions, detected without blocking SDK waits."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from time import monotonic
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import GRIPPER_POLL_INTERVAL, GRIPPER_TOLERANCE, LOGGER, MOTION_START_GRACE
+
+
+def _retrieve(future: asyncio.Future) -> None:
+    # Nobody may be waiting, e.g. after a button press, don't log the failure as unhandled.
+    if not future.cancelled():
+        future.exception()
+
+
+class MotionTracker:
+    """Futures completing once the arm or its gripper has stopped.
+
+    Motions are sent with wait=False, so no worker thread is held while the
+    arm moves. Arm motions complete from the state reports, on the first
+    report of the arm no longer moving, or when the arm is still not moving
+    MOTION_START_GRACE seconds after the command (a move too short to show
+    up in a report). The gripper doesn't report, it is polled every
+    GRIPPER_POLL_INTERVAL seconds until its position is within
+    GRIPPER_TOLERANCE of the target or stops changing, e.g. when it closed
+    on an object. Gripper futures resolve to the final position. Only
+    grippers with position feedback can be followed, not the Lite 6 one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        is_moving_fn: Callable[[], bool],
+        read_gripper_fn: Callable[[], Awaitable[float]],
+    ) -> None:
+        self.hass = hass
+        self._is_moving_fn = is_moving_fn
+        self._read_gripper_fn = read_gripper_fn
+        self._arm_waiters: list[asyncio.Future[None]] = []
+        self._gripper_waiters: list[asyncio.Future[float]] = []
+        self._gripper_target: float | None = None
+        # When the latest gripper motion was sent.
+        self._gripper_sent = 0.0
+        self._gripper_task: asyncio.Task[None] | None = None
+        self._unsub_grace: Callable[[], None] | None = None
+
+    @callback
+    def async_arm_motion(self) -> asyncio.Future[None]:
+        """Return a future for the motion being sent, create it before sending the command."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        future.add_done_callback(_retrieve)
+        self._arm_waiters.append(future)
+        return future
+
+    @callback
+    def async_arm_motion_sent(self) -> None:
+        """Start the grace period, for motions that end before a state report is seen."""
+        if self._unsub_grace is not None:
+            self._unsub_grace()
+        self._unsub_grace = async_call_later(self.hass, MOTION_START_GRACE, self._async_grace_over)
+
+    @callback
+    def _async_grace_over(self, _now: datetime | None = None) -> None:
+        self._unsub_grace = None
+        if not self._is_moving_fn():
+            self.async_arm_stopped()
+
+    @callback
+    def async_arm_stopped(self) -> None:
+        """Complete the arm motions, called when a report shows the arm no longer moving."""
+        if self._unsub_grace is not None:
+            self._unsub_grace()
+            self._unsub_grace = None
+        waiters, self._arm_waiters = self._arm_waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    @callback
+    def async_gripper_motion(self, target: float | None = None) -> asyncio.Future[float]:
+        """Return a future for a gripper motion, create it before sending the command.
+
+        target is None if unknown. A newer motion takes over the target,
+        earlier futures complete with it.
+        """
+        future: asyncio.Future[float] = self.hass.loop.create_future()
+        future.add_done_callback(_retrieve)
+        self._gripper_waiters.append(future)
+        self._gripper_target = target
+        # Holds back a watch already running until this motion had time to start.
+        self._gripper_sent = monotonic()
+        return future
+
+    @callback
+    def async_gripper_motion_sent(self) -> None:
+        """Follow the gripper now that the command of the latest motion was sent."""
+        self._gripper_sent = monotonic()
+        if self._gripper_task is None or self._gripper_task.done():
+            self._gripper_task = self.hass.async_create_background_task(
+                self._async_watch_gripper(), "xarm gripper motion"
+            )
+
+    async def _async_watch_gripper(self) -> None:
+        position = last = None
+        sent = None
+        while self._gripper_waiters:
+            await asyncio.sleep(GRIPPER_POLL_INTERVAL)
+            try:
+                position = await self._read_gripper_fn()
+            except Exception as error:  # noqa: BLE001
+                self._async_fail(self._gripper_waiters, error)
+                return
+            if sent != self._gripper_sent:
+                # A newer motion took over, give it the grace period to get going.
+                sent = self._gripper_sent
+                last = None
+            target = self._gripper_target
+            if target is not None and abs(position - target) <= GRIPPER_TOLERANCE:
+                break
+            if position == last and monotonic() - sent >= MOTION_START_GRACE:
+                break
+            last = position
+        LOGGER.debug(f"Gripper stopped at {position}")
+        waiters, self._gripper_waiters = self._gripper_waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(position)
+
+    @callback
+    def async_abort(self, future: asyncio.Future, error: Exception) -> None:
+        """Fail one motion whose command raised or was rejected."""
+        for waiters in (self._arm_waiters, self._gripper_waiters):
+            if future in waiters:
+                waiters.remove(future)
+        if not future.done():
+            future.set_exception(error)
+
+    @callback
+    def async_fail(self, reason: str) -> None:
+        """Fail every pending motion, used when the link drops or the entry unloads."""
+        error = HomeAssistantError(reason)
+        self._async_fail(self._arm_waiters, error)
+        self._async_fail(self._gripper_waiters, error)
+        if self._unsub_grace is not None:
+            self._unsub_grace()
+            self._unsub_grace = None
+        if self._gripper_task is not None:
+            self._gripper_task.cancel()
+            self._gripper_task = None
+
+    @staticmethod
+    def _async_fail(waiters: list[asyncio.Future], error: Exception) -> None:
+        for future in waiters:
+            if not future.done():
+                future.set_exception(error)
+        waiters.clear()
+
+    @property
+    def pending(self) -> dict[str, int]:
+        return {"arm": len(self._arm_waiters), "gripper": len(self._gripper_waiters)}
+
+
+async def async_wait(future: asyncio.Future, timeout: float, what: str):
+    """Wait for a motion future, raising HomeAssistantError once timeout seconds have passed."""
+    try:
+        async with asyncio.timeout(timeout):
+            return await future
+    except TimeoutError as error:
+        raise HomeAssistantError(f"The {what} did not finish within {timeout} seconds") from error
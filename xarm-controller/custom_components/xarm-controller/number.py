@@ -10,12 +10,13 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfSpeed, UnitOfLength
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.const import CONF_HOST, CONF_MODEL
 
 
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 
 from .const import (
@@ -31,7 +32,8 @@ from .const import (
     TARGET_Z,
     COLLISION_SENSITIVITY,
 )
-from .coordinator import XArmControllerUpdateCoordinator
+from .coordinator import XArmControllerUpdateCoordinator, listener_groups
+from .models import Capabilities
 # from .entity import XArmControllerEntity
 
 
@@ -49,6 +51,8 @@ class XArmControllerNumberEntityDescription(
     """Editable (number) position entity description for XArm Controller."""
 
     set_value_fn: Callable[..., None] | None = None
+    # Qualified model fields ("position.target_x") the value depends on, used to skip unchanged writes.
+    fields: tuple[str, ...] = ()
 
 
 NUMBERS: tuple[XArmControllerNumberEntityDescription, ...] = (
@@ -62,6 +66,7 @@ NUMBERS: tuple[XArmControllerNumberEntityDescription, ...] = (
         native_min_value=0,
         native_max_value=1000,  # TODO: Determine actual limit
         value_fn=lambda device: device.position.target_x,
+        fields=("position.target_x",),
         set_value_fn=lambda device, value: device.position.set_target_position(target_x=value),
     ),
     XArmControllerNumberEntityDescription(
@@ -74,6 +79,7 @@ NUMBERS: tuple[XArmControllerNumberEntityDescription, ...] = (
         native_min_value=0,
         native_max_value=1000,  # TODO: Determine actual limit
         value_fn=lambda device: device.position.target_y,
+        fields=("position.target_y",),
         set_value_fn=lambda device, value: device.position.set_target_position(target_y=value),
     ),
     XArmControllerNumberEntityDescription(
@@ -86,6 +92,7 @@ NUMBERS: tuple[XArmControllerNumberEntityDescription, ...] = (
         native_min_value=0,
         native_max_value=1000,  # TODO: Determine actual limit
         value_fn=lambda device: device.position.target_z,
+        fields=("position.target_z",),
         set_value_fn=lambda device, value: device.position.set_target_position(target_z=value),
     ),
     # XArmControllerNumberEntityDescription(
@@ -133,13 +140,19 @@ async def async_setup_entry(
     LOGGER.debug("NUMBER::async_setup_entry")
     coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for description in NUMBERS:
-        async_add_entities([XArmControllerNumber(coordinator, description, entry)])
+    @callback
+    def async_add_numbers(capabilities: Capabilities) -> None:
+        # The targets apply to every arm, they are added with the rest of the device.
+        async_add_entities(
+            XArmControllerNumber(coordinator, description, entry) for description in NUMBERS
+        )
+
+    coordinator.async_on_capabilities(async_add_numbers)
 
     LOGGER.debug("NUMBER::async_setup_entry DONE")
 
 
-class XArmControllerNumber(NumberEntity):
+class XArmControllerNumber(CoordinatorEntity[XArmControllerUpdateCoordinator], NumberEntity):
     """Define the Number."""
 
     entity_description: XArmControllerNumberEntityDescription
@@ -151,12 +164,17 @@ class XArmControllerNumber(NumberEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the number."""
-        self.coordinator = coordinator
+        super().__init__(coordinator, listener_groups(description.fields))
         self.entity_description = description
         xarm_info = self.coordinator.get_xarm_model().info
         self._attr_unique_id = f"{xarm_info.serial}_{description.key}"
         self._attr_native_value = description.value_fn(coordinator.get_xarm_model())
-        # super().__init__(coordinator=coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the fields backing this number changed."""
+        if self.coordinator.fields_changed(self.entity_description.fields):
+            self.async_write_ha_state()
 
     @property
     def name(self):
@@ -178,7 +196,8 @@ class XArmControllerNumber(NumberEntity):
         """Return the value reported by the number."""
         return self.entity_description.value_fn(self.coordinator.get_xarm_model())
 
-    # @native_value.setter
-    def set_native_value(self, value: float) -> None:
+    async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
+        # Targets are only stored locally until a move is requested, no SDK call is made here.
         self.entity_description.set_value_fn and self.entity_description.set_value_fn(self.coordinator.get_xarm_model(), value)
+        self.async_write_ha_state()
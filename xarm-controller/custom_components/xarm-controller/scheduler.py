@@ -0,0 +1,111 @@
+"""Tiered polling schedule for the xArm model groups."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class GroupSchedule:
+    """Polling state of a single model group."""
+
+    # Seconds between polls, None if the group is only polled on request.
+    interval: float | None
+    # Longest interval the group backs off to while the arm is idle, None to never back off.
+    idle_interval: float | None = None
+    next_due: float | None = None
+    polls: int = 0
+
+    def __post_init__(self) -> None:
+        self.active_interval = self.interval
+
+
+class PollScheduler:
+    """Decide which model groups are due for a poll.
+
+    Every group has its own interval. Groups without an interval (info,
+    gripper) are only polled when requested, e.g. at connect or after a
+    gripper command. Groups with an idle interval poll at their normal rate
+    while the arm is active and back off exponentially towards the idle
+    interval once it is not.
+    """
+
+    def __init__(
+        self,
+        intervals: dict[str, float | None],
+        idle_intervals: dict[str, float] | None = None,
+        backoff: float = 2.0,
+    ) -> None:
+        idle_intervals = idle_intervals or {}
+        self.groups = {
+            group: GroupSchedule(interval=interval, idle_interval=idle_intervals.get(group))
+            for group, interval in intervals.items()
+        }
+        self.backoff = backoff
+        self.active = True
+        self.started: float | None = None
+
+    def start(self, now: float, offset: float = 0.0) -> None:
+        """Make every group due after offset seconds, used at connect and on reconnect."""
+        self.started = now
+        for schedule in self.groups.values():
+            schedule.next_due = now + offset
+
+    def request(self, now: float, *groups: str) -> None:
+        """Poll the given groups as soon as possible."""
+        for group in groups:
+            self.groups[group].next_due = now
+
+    def set_interval(self, group: str, interval: float | None, now: float) -> None:
+        """Change the interval of a group, pulling its next poll in if needed."""
+        schedule = self.groups[group]
+        schedule.interval = interval
+        if interval is not None and (schedule.next_due is None or schedule.next_due > now + interval):
+            schedule.next_due = now + interval
+
+    def set_active(self, active: bool, now: float) -> bool:
+        """Switch between the active rate and idle back-off, returning True on a change."""
+        if active == self.active:
+            return False
+        self.active = active
+        if active:
+            for group, schedule in self.groups.items():
+                if schedule.idle_interval is not None:
+                    self.set_interval(group, schedule.active_interval, now)
+        return True
+
+    def due(self, now: float) -> list[str]:
+        """Return the groups due for a poll and schedule their next one."""
+        due = []
+        for group, schedule in self.groups.items():
+            if schedule.next_due is None or schedule.next_due > now:
+                continue
+            due.append(group)
+            schedule.polls += 1
+            if schedule.interval is None:
+                schedule.next_due = None
+                continue
+            if not self.active and schedule.idle_interval is not None:
+                schedule.interval = min(schedule.interval * self.backoff, schedule.idle_interval)
+            schedule.next_due = now + schedule.interval
+        return due
+
+    def rate(self, group: str) -> float:
+        """Return the current polling rate of a group in Hz."""
+        interval = self.groups[group].interval
+        return 1 / interval if interval else 0.0
+
+    def next_delay(self, now: float) -> float | None:
+        """Return the seconds until the next group is due, None if nothing is scheduled."""
+        pending = [s.next_due for s in self.groups.values() if s.next_due is not None]
+        if not pending:
+            return None
+        return max(0.0, min(pending) - now)
+
+    def polls_per_minute(self, now: float) -> dict[str, float]:
+        """Return the average number of polls per minute for every group."""
+        elapsed = max(now - self.started, 1.0) if self.started is not None else 0.0
+        return {
+            group: schedule.polls * 60 / elapsed if elapsed else 0.0
+            for group, schedule in self.groups.items()
+        }
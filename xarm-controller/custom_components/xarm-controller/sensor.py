@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from collections.abc import Callable
 from datetime import datetime
+from time import monotonic
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -11,13 +12,40 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorDeviceClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory, UnitOfLength, DEGREE
+from homeassistant.const import (
+    DEGREE,
+    EntityCategory,
+    UnitOfElectricCurrent,
+    UnitOfFrequency,
+    UnitOfLength,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import XArmControllerUpdateCoordinator
+from .connection import ConnectionState
+from .coordinator import AVAILABILITY_FIELD, XArmControllerUpdateCoordinator, listener_groups
+from .deadband import DeadbandConfig, PublishFilter
+from .models import Capabilities
 from .const import (
+    CONF_ANGLE_DEADBAND,
+    CONF_ANGLE_RELATIVE_DEADBAND,
+    CONF_CURRENT_DEADBAND,
+    CONF_CURRENT_RELATIVE_DEADBAND,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_POSITION_DEADBAND,
+    CONF_POSITION_RELATIVE_DEADBAND,
+    DEFAULT_ANGLE_DEADBAND,
+    DEFAULT_ANGLE_RELATIVE_DEADBAND,
+    DEFAULT_CURRENT_DEADBAND,
+    DEFAULT_CURRENT_RELATIVE_DEADBAND,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_POSITION_DEADBAND,
+    DEFAULT_POSITION_RELATIVE_DEADBAND,
     DOMAIN, 
     POS_X, 
     POS_Y, 
@@ -51,6 +79,23 @@ class XArmControllerSensorEntityDescription(
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
     icon_fn: Callable[..., str] = lambda _: None
+    # Qualified model fields ("position.x") the value depends on, used to skip unchanged writes.
+    fields: tuple[str, ...] = ()
+    # Options holding the absolute deadband of the value and the one in percent of the
+    # value. Sensors with a deadband are also held to the minimum publish interval.
+    deadband_option: str | None = None
+    relative_deadband_option: str | None = None
+
+
+# Default of each deadband option.
+DEADBAND_DEFAULTS = {
+    CONF_POSITION_DEADBAND: DEFAULT_POSITION_DEADBAND,
+    CONF_POSITION_RELATIVE_DEADBAND: DEFAULT_POSITION_RELATIVE_DEADBAND,
+    CONF_ANGLE_DEADBAND: DEFAULT_ANGLE_DEADBAND,
+    CONF_ANGLE_RELATIVE_DEADBAND: DEFAULT_ANGLE_RELATIVE_DEADBAND,
+    CONF_CURRENT_DEADBAND: DEFAULT_CURRENT_DEADBAND,
+    CONF_CURRENT_RELATIVE_DEADBAND: DEFAULT_CURRENT_RELATIVE_DEADBAND,
+}
 
 
 SENSORS: list[XArmControllerSensorEntityDescription] = [
@@ -61,6 +106,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.roll,
+        fields=("position.roll",),
+        deadband_option=CONF_ANGLE_DEADBAND,
+        relative_deadband_option=CONF_ANGLE_RELATIVE_DEADBAND,
         icon="mdi:axis-x-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -70,6 +118,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.pitch,
+        fields=("position.pitch",),
+        deadband_option=CONF_ANGLE_DEADBAND,
+        relative_deadband_option=CONF_ANGLE_RELATIVE_DEADBAND,
         icon="mdi:axis-y-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -79,6 +130,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.yaw,
+        fields=("position.yaw",),
+        deadband_option=CONF_ANGLE_DEADBAND,
+        relative_deadband_option=CONF_ANGLE_RELATIVE_DEADBAND,
         icon="mdi:axis-z-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -88,6 +142,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.x,
+        fields=("position.x",),
+        deadband_option=CONF_POSITION_DEADBAND,
+        relative_deadband_option=CONF_POSITION_RELATIVE_DEADBAND,
         icon="mdi:axis-x-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -97,6 +154,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.y,
+        fields=("position.y",),
+        deadband_option=CONF_POSITION_DEADBAND,
+        relative_deadband_option=CONF_POSITION_RELATIVE_DEADBAND,
         icon="mdi:axis-y-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -106,6 +166,9 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.position.z,
+        fields=("position.z",),
+        deadband_option=CONF_POSITION_DEADBAND,
+        relative_deadband_option=CONF_POSITION_RELATIVE_DEADBAND,
         icon="mdi:axis-z-rotate-counterclockwise",
     ),
     XArmControllerSensorEntityDescription(
@@ -114,23 +177,152 @@ SENSORS: list[XArmControllerSensorEntityDescription] = [
         # state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.state.state,
+        fields=("state.state",),
         icon="mdi:state-machine",
     ),
     XArmControllerSensorEntityDescription(
         key=GRIPPER_SPEED,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.gripper.speed,
+        fields=("gripper.speed",),
+        exists_fn=lambda coordinator: coordinator.capabilities.gripper,
         icon="mdi:robot-industrial"
     ),
     XArmControllerSensorEntityDescription(
         key=GRIPPER_POSITION,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.gripper.position,
+        fields=("gripper.position",),
+        exists_fn=lambda coordinator: coordinator.capabilities.gripper,
+        extra_attributes=lambda device: {
+            "read_latency_ms": round(device.gripper.latency * 1000, 1),
+        },
         icon="mdi:alert-circle-outline"
     ),
 ]
 
 
+
+def joint_sensor_descriptions(axis: int) -> list[XArmControllerSensorEntityDescription]:
+    """Return the angle, temperature and current sensors of each of the arm's joints."""
+    descriptions = []
+    for index in range(axis):
+        joint = index + 1
+        descriptions += [
+            XArmControllerSensorEntityDescription(
+                key=f"joint{joint}_angle",
+                native_unit_of_measurement=DEGREE,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                suggested_display_precision=2,
+                value_fn=lambda device, index=index: round(device.joints.angle[index], 3),
+                fields=(f"joints.angle{joint}",),
+                deadband_option=CONF_ANGLE_DEADBAND,
+                relative_deadband_option=CONF_ANGLE_RELATIVE_DEADBAND,
+                icon="mdi:angle-acute",
+            ),
+            XArmControllerSensorEntityDescription(
+                key=f"joint{joint}_temperature",
+                device_class=SensorDeviceClass.TEMPERATURE,
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                suggested_display_precision=1,
+                value_fn=lambda device, index=index: round(device.joints.temperature[index], 1),
+                fields=(f"joints.temperature{joint}",),
+            ),
+            XArmControllerSensorEntityDescription(
+                key=f"joint{joint}_current",
+                device_class=SensorDeviceClass.CURRENT,
+                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                suggested_display_precision=2,
+                value_fn=lambda device, index=index: round(device.joints.current[index], 3),
+                fields=(f"joints.current{joint}",),
+                deadband_option=CONF_CURRENT_DEADBAND,
+                relative_deadband_option=CONF_CURRENT_RELATIVE_DEADBAND,
+            ),
+        ]
+    return descriptions
+
+
+# Sensors about the integration itself, their value_fn receives the coordinator.
+DIAGNOSTIC_SENSORS: list[XArmControllerSensorEntityDescription] = [
+    XArmControllerSensorEntityDescription(
+        key="poll_rate",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.poll_rate,
+        fields=("diagnostics.poll_rate",),
+        icon="mdi:timer-sync-outline",
+    ),
+    XArmControllerSensorEntityDescription(
+        key="stop_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.stop_latency,
+        fields=("diagnostics.stop_latency",),
+        icon="mdi:timer-alert-outline",
+    ),
+    XArmControllerSensorEntityDescription(
+        key="connection_state",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in ConnectionState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.connection.state,
+        extra_attributes=lambda coordinator: {
+            "attempts": coordinator.connection.attempts,
+            "reconnects": coordinator.connection.reconnects,
+            "last_error": coordinator.connection.last_error,
+        },
+        fields=("diagnostics.connection",),
+        icon="mdi:lan-connect",
+    ),
+    XArmControllerSensorEntityDescription(
+        key="reconnect_time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.connection.reconnect_time,
+        fields=("diagnostics.connection",),
+        icon="mdi:lan-pending",
+    ),
+    XArmControllerSensorEntityDescription(
+        key="sdk_call_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        exists_fn=lambda coordinator: coordinator.metrics is not None,
+        value_fn=lambda coordinator: coordinator.sdk_call_latency,
+        fields=("diagnostics.sdk_call_latency",),
+        icon="mdi:timer-outline",
+    ),
+    XArmControllerSensorEntityDescription(
+        key="report_rate",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        exists_fn=lambda coordinator: coordinator.metrics is not None,
+        value_fn=lambda coordinator: coordinator.report_rate,
+        extra_attributes=lambda coordinator: {
+            report: round(rate, 2) for report, rate in coordinator.metrics.report_rates().items()
+        },
+        fields=("diagnostics.report_rate",),
+        icon="mdi:chart-line",
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: XArmControllerUpdateCoordinator,
@@ -140,18 +332,54 @@ async def async_setup_entry(
 
     coordinator: XArmControllerUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for sensor in SENSORS:
-        LOGGER.debug(f"Adding sensor: {sensor.key}")
-        async_add_entities(
-            [
-                XArmControllerSensor(
-                    coordinator=coordinator, description=sensor, config_entry=entry
-                )
-            ]
-        )
+    @callback
+    def async_add_sensors(capabilities: Capabilities) -> None:
+        entities: list[SensorEntity] = [
+            XArmControllerSensor(
+                coordinator=coordinator,
+                description=sensor,
+                config_entry=entry,
+                publish_filter=_publish_filter(coordinator, sensor, entry.options),
+            )
+            for sensor in [*SENSORS, *joint_sensor_descriptions(capabilities.axis)]
+            if sensor.exists_fn(coordinator)
+        ]
+        entities += [
+            XArmControllerDiagnosticSensor(
+                coordinator=coordinator, description=sensor, config_entry=entry
+            )
+            for sensor in DIAGNOSTIC_SENSORS
+            if sensor.exists_fn(coordinator)
+        ]
+        LOGGER.debug(f"Adding {len(entities)} sensors for {capabilities}")
+        async_add_entities(entities)
+
+    # Known from the entry, or once the arm was reached for the first time.
+    coordinator.async_on_capabilities(async_add_sensors)
 
 
-class XArmControllerSensor(SensorEntity):
+def _publish_filter(
+    coordinator: XArmControllerUpdateCoordinator,
+    description: XArmControllerSensorEntityDescription,
+    options: dict,
+) -> PublishFilter | None:
+    """Return the write filter of a sensor with a deadband, kept on the coordinator for diagnostics."""
+    if description.deadband_option is None and description.relative_deadband_option is None:
+        return None
+
+    def option(key: str | None) -> float:
+        return options.get(key, DEADBAND_DEFAULTS[key]) if key else 0.0
+
+    config = DeadbandConfig(
+        absolute=option(description.deadband_option),
+        relative=option(description.relative_deadband_option) / 100,
+        min_interval=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+    )
+    publish_filter = coordinator.publish_filters[description.key] = PublishFilter(config)
+    return publish_filter
+
+
+class XArmControllerSensor(CoordinatorEntity[XArmControllerUpdateCoordinator], SensorEntity):
     """Representation of a XArm sensor."""
 
     def __init__(
@@ -159,13 +387,45 @@ class XArmControllerSensor(SensorEntity):
         coordinator: XArmControllerUpdateCoordinator,
         description: XArmControllerSensorEntityDescription,
         config_entry: ConfigEntry,
+        publish_filter: PublishFilter | None = None,
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator, listener_groups(description.fields))
         self.entity_description = description
         arm_info = coordinator.get_xarm_model().info
         self._attr_unique_id = f"{arm_info.serial}_{description.key}"
-        # super().__init__(coordinator=coordinator)
+        self._publish_filter = publish_filter
+        self._unsub_publish: Callable[[], None] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the fields backing this sensor changed beyond the deadband."""
+        if not self.coordinator.fields_changed(self.entity_description.fields):
+            return
+        if self._publish_filter is None or AVAILABILITY_FIELD in self.coordinator.dirty:
+            self._async_publish()
+            return
+        wait = self._publish_filter.check(self.native_value, monotonic())
+        if wait == 0:
+            self._async_publish()
+        elif wait is not None and self._unsub_publish is None:
+            # Written once the interval has passed, with whatever the value is by then.
+            self._unsub_publish = async_call_later(self.hass, wait, self._async_publish)
+
+    @callback
+    def _async_publish(self, _now: datetime | None = None) -> None:
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+        if self._publish_filter is not None:
+            self._publish_filter.record(self.native_value, monotonic())
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+        await super().async_will_remove_from_hass()
 
     @property
     def name(self):
@@ -198,3 +458,22 @@ class XArmControllerSensor(SensorEntity):
     def icon(self) -> str | None:
         """Return a dynamic icon if needed"""
         return self.entity_description.icon
+
+
+class XArmControllerDiagnosticSensor(XArmControllerSensor):
+    """Representation of a sensor about the integration's own behaviour."""
+
+    @property
+    def available(self) -> bool:
+        """The coordinator is always there to ask."""
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the state attributes."""
+        return self.entity_description.extra_attributes(self.coordinator)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
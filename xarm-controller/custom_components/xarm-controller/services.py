@@ -0,0 +1,168 @@
+"""Services of the xArm controller integration."""
+
+from __future__ import annotations
+
+from time import time
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_ACCELERATION,
+    ATTR_CHANNELS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_POSES,
+    ATTR_POSITION,
+    ATTR_RADIUS,
+    ATTR_SPEED,
+    ATTR_TIMEOUT,
+    ATTR_WINDOW,
+    DATA_CONNECTION_MANAGER,
+    DEFAULT_TRAJECTORY_ACCELERATION,
+    DEFAULT_TRAJECTORY_SPEED,
+    DOMAIN,
+    GRIPPER_CLOSED_POSITION,
+    GRIPPER_OPEN_POSITION,
+    MAX_MOTION_TIMEOUT,
+    MAX_TRAJECTORY_ACCELERATION,
+    MAX_TRAJECTORY_POSES,
+    MAX_TRAJECTORY_SPEED,
+    PITCH,
+    POS_X,
+    POS_Y,
+    POS_Z,
+    ROLL,
+    SERVICE_GET_TELEMETRY,
+    SERVICE_MOVE_GRIPPER,
+    SERVICE_MOVE_TRAJECTORY,
+    YAW,
+)
+from .coordinator import XArmControllerUpdateCoordinator
+from .telemetry import CHANNELS
+
+_COORDINATE = vol.Coerce(float)
+_ANGLE = vol.All(vol.Coerce(float), vol.Range(min=-180, max=180))
+_SPEED = vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_TRAJECTORY_SPEED, min_included=False))
+_ACCELERATION = vol.All(
+    vol.Coerce(float), vol.Range(min=0, max=MAX_TRAJECTORY_ACCELERATION, min_included=False)
+)
+_RADIUS = vol.All(vol.Coerce(float), vol.Range(min=0))
+# Seconds to wait for the motion to finish. Without it the service returns once the command is sent.
+_TIMEOUT = vol.All(
+    vol.Coerce(float), vol.Range(min=0, max=MAX_MOTION_TIMEOUT, min_included=False)
+)
+
+# Position in mm and orientation in degrees. Orientation left out keeps the previous one.
+POSE_SCHEMA = vol.Schema(
+    {
+        vol.Required(POS_X): _COORDINATE,
+        vol.Required(POS_Y): _COORDINATE,
+        vol.Required(POS_Z): _COORDINATE,
+        vol.Optional(ROLL): _ANGLE,
+        vol.Optional(PITCH): _ANGLE,
+        vol.Optional(YAW): _ANGLE,
+        vol.Optional(ATTR_SPEED): _SPEED,
+        vol.Optional(ATTR_ACCELERATION): _ACCELERATION,
+        vol.Optional(ATTR_RADIUS): _RADIUS,
+    }
+)
+
+MOVE_TRAJECTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_POSES): vol.All(
+            cv.ensure_list, vol.Length(min=1, max=MAX_TRAJECTORY_POSES), [POSE_SCHEMA]
+        ),
+        vol.Optional(ATTR_SPEED, default=DEFAULT_TRAJECTORY_SPEED): _SPEED,
+        vol.Optional(ATTR_ACCELERATION, default=DEFAULT_TRAJECTORY_ACCELERATION): _ACCELERATION,
+        vol.Optional(ATTR_RADIUS, default=0.0): _RADIUS,
+        vol.Optional(ATTR_TIMEOUT): _TIMEOUT,
+    }
+)
+
+MOVE_GRIPPER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_POSITION): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=GRIPPER_CLOSED_POSITION, max=GRIPPER_OPEN_POSITION),
+        ),
+        vol.Optional(ATTR_TIMEOUT): _TIMEOUT,
+    }
+)
+
+GET_TELEMETRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        # Bucket size and how far back to look, in seconds. No duration means all history.
+        vol.Required(ATTR_WINDOW): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+        vol.Optional(ATTR_DURATION): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+        vol.Optional(ATTR_CHANNELS): vol.All(cv.ensure_list, [vol.In(CHANNELS)]),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> XArmControllerUpdateCoordinator:
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    manager = hass.data.get(DOMAIN, {}).get(DATA_CONNECTION_MANAGER)
+    if manager is None or entry_id not in manager.coordinators:
+        raise ServiceValidationError(f"No loaded xArm with config entry {entry_id}")
+    return manager.coordinators[entry_id]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_move_trajectory(call: ServiceCall) -> None:
+        """Move through a list of poses as one continuous motion."""
+        await _get_coordinator(hass, call).async_move_trajectory(
+            call.data[ATTR_POSES],
+            call.data[ATTR_SPEED],
+            call.data[ATTR_ACCELERATION],
+            call.data[ATTR_RADIUS],
+            call.data.get(ATTR_TIMEOUT),
+        )
+
+    async def async_move_gripper(call: ServiceCall) -> ServiceResponse:
+        """Move the gripper, returning where it stopped when waiting for it."""
+        position = await _get_coordinator(hass, call).async_move_gripper(
+            call.data[ATTR_POSITION], call.data.get(ATTR_TIMEOUT)
+        )
+        if not call.return_response:
+            return None
+        return {ATTR_POSITION: position}
+
+    async def async_get_telemetry(call: ServiceCall) -> ServiceResponse:
+        """Return the arm's recent history downsampled to min/max/mean buckets."""
+        telemetry = _get_coordinator(hass, call).telemetry
+        duration = call.data.get(ATTR_DURATION)
+        buckets = await hass.async_add_executor_job(
+            telemetry.downsample,
+            call.data[ATTR_WINDOW],
+            time() - duration if duration is not None else None,
+            call.data.get(ATTR_CHANNELS),
+        )
+        return {ATTR_WINDOW: call.data[ATTR_WINDOW], "buckets": buckets}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_MOVE_TRAJECTORY, async_move_trajectory, schema=MOVE_TRAJECTORY_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MOVE_GRIPPER,
+        async_move_gripper,
+        schema=MOVE_GRIPPER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TELEMETRY,
+        async_get_telemetry,
+        schema=GET_TELEMETRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,562 @@
+"""Simulated xArm implementing the parts of the xArm SDK used by the integration.
+
+The simulator moves toward its targets over time at the commanded speed,
+delivers report callbacks from its own thread like the SDK does and can add
+latency, jitter and errors to every request, so the integration can be
+exercised and benchmarked without hardware.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+import math
+import random
+import threading
+import time
+import zlib
+
+from .const import END_EFFECTOR_HAS_FAULT, LITE6_DEVICE_TYPE, LOGGER
+
+SIMULATOR_HOST = "simulator"
+
+HOME_POSITION = [201.5, 0.0, 140.5, -180.0, 0.0, 0.0]
+# Seconds between simulation steps while reports are switched off.
+IDLE_STEP = 1 / 30
+
+STATE_MOVING = 1
+STATE_READY = 2
+STATE_STOPPED = 4
+
+# API return codes, see API_ERRORS in const.
+CODE_OK = 0
+CODE_NOT_CONNECTED = -1
+CODE_NOT_READY = 9
+CODE_TIMEOUT = 3
+# A gripper request without a gripper times out on the tool bus, the controller raises
+# error 19 and the SDK returns "controller has an error". The simulator skips the error.
+CODE_NO_GRIPPER = 1
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of a simulated arm."""
+
+    axis: int = 6
+    is_lite6: bool = False
+    has_gripper: bool = True
+    # Seconds added to every request to the controller, plus random +/- jitter.
+    latency: float = 0.002
+    jitter: float = 0.001
+    # Probability of a request failing with a response timeout.
+    error_rate: float = 0.0
+    # Location reports per second while connected, may be changed while running.
+    # At 0 the arm still moves, only reports sent with simulate_report() arrive.
+    report_rate: float = 30.0
+    # Default linear speed (mm/s) and gripper speed (units/s).
+    speed: float = 100.0
+    gripper_speed: float = 1500.0
+    seed: int | None = None
+
+
+class _SimulatedArm:
+    """Attribute holder mirroring XArmAPI.arm for values the SDK caches."""
+
+    def __init__(self) -> None:
+        self.gripper_error_code = 0
+        self.gripper_speed = 0
+
+
+class SimulatedXArmAPI:
+    """Drop-in stand-in for xarm.wrapper.XArmAPI backed by a kinematic simulation."""
+
+    def __init__(
+        self,
+        port: str = SIMULATOR_HOST,
+        config: SimulatorConfig | None = None,
+        do_not_open: bool = False,
+    ) -> None:
+        self.port = port
+        self.config = config or SimulatorConfig()
+        self.arm = _SimulatedArm()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._callbacks: dict[str, list[Callable[[dict], None]]] = {}
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        self._connected = False
+        self._position = list(HOME_POSITION)
+        self._queue: deque[tuple[list[float], float]] = deque()
+        self._state = STATE_READY
+        self._mode = 0
+        self._error_code = 0
+        self._warn_code = 0
+        self._count = 0
+        self._motor_enable = True
+        self._collision_sensitivity = 3
+        self._temperatures = [30.0] * 7
+        self._gripper_position = 0.0
+        self._gripper_target = 0.0
+        self.requests = 0
+        # Cleared to make connects fail, as if the controller could not be reached.
+        self.reachable = True
+
+        if not do_not_open:
+            self.connect()
+
+    # Connection
+
+    def connect(self, port: str | None = None, **kwargs) -> None:
+        """Connect to the simulated controller and start reporting."""
+        if port is not None:
+            self.port = port
+        if not self.reachable:
+            raise ConnectionRefusedError(f"connect to {self.port} failed")
+        with self._lock:
+            if self._connected:
+                return
+            self._connected = True
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"xarm-simulator-{self.port}", daemon=True
+            )
+            self._thread.start()
+        self._report("connect_changed", {"connected": True, "reported": True})
+
+    def disconnect(self) -> None:
+        """Stop reporting and drop the connection."""
+        with self._lock:
+            if not self._connected:
+                return
+            self._connected = False
+            self._stop.set()
+            self._idle.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._report("connect_changed", {"connected": False, "reported": False})
+
+    def simulate_disconnect(self) -> None:
+        """Drop the link as if the network went away."""
+        self.disconnect()
+
+    def simulate_report(self, report: str, data: dict) -> None:
+        """Deliver a report to the registered callbacks on the calling thread."""
+        self._report(report, data)
+
+    # Report callbacks
+
+    def __getattr__(self, name: str):
+        # register_<name>_callback / release_<name>_callback like the SDK.
+        if name.startswith("register_") and name.endswith("_callback"):
+            report = name[len("register_") : -len("_callback")]
+            return lambda callback=None, **kwargs: self._register(report, callback)
+        if name.startswith("release_") and name.endswith("_callback"):
+            report = name[len("release_") : -len("_callback")]
+            return lambda callback=None: self._release(report, callback)
+        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{name}'")
+
+    def _register(self, report: str, callback: Callable[[dict], None]) -> bool:
+        self._callbacks.setdefault(report, []).append(callback)
+        return True
+
+    def _release(self, report: str, callback: Callable[[dict], None] | None) -> None:
+        callbacks = self._callbacks.get(report, [])
+        if callback is None:
+            callbacks.clear()
+        elif callback in callbacks:
+            callbacks.remove(callback)
+
+    def _report(self, report: str, data: dict) -> None:
+        for callback in list(self._callbacks.get(report, ())):
+            try:
+                callback(data)
+            except Exception as error:  # noqa: BLE001
+                LOGGER.error(f"Simulator {report} callback failed: {error}")
+
+    # Simulation
+
+    def _request(self) -> int:
+        """Account for one round trip to the controller, returning its API code."""
+        self.requests += 1
+        if not self._connected:
+            return CODE_NOT_CONNECTED
+        delay = self.config.latency + self._random.uniform(-1, 1) * self.config.jitter
+        if delay > 0:
+            time.sleep(delay)
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return CODE_TIMEOUT
+        return CODE_OK
+
+    def _step_interval(self) -> float:
+        rate = self.config.report_rate
+        return 1 / rate if rate else IDLE_STEP
+
+    def _run(self) -> None:
+        last = time.monotonic()
+        next_temperatures = last
+        while not self._stop.wait(self._step_interval()):
+            now = time.monotonic()
+            self._step(now - last)
+            last = now
+            if not self.config.report_rate:
+                continue
+            with self._lock:
+                location = {"cartesian": list(self._position), "joints": self.angles}
+            self._report("report_location", location)
+            if now >= next_temperatures:
+                next_temperatures = now + 1.0
+                self._report("temperature_changed", {"temperatures": self.temperatures})
+
+    def _step(self, elapsed: float) -> None:
+        """Advance the motion queue and the gripper by elapsed seconds."""
+        with self._lock:
+            if self._state == STATE_STOPPED:
+                return
+            if self._queue:
+                target, speed = self._queue[0]
+                self._position = _move_toward(self._position, target, speed * elapsed)
+                heat = 0.05
+                if self._position == target:
+                    self._queue.popleft()
+                    self._count += 1
+                    self._report("count_changed", {"count": self._count})
+                    self._report("cmdnum_changed", {"cmdnum": len(self._queue)})
+            else:
+                heat = -0.02
+            self._temperatures = [max(25.0, min(60.0, t + heat)) for t in self._temperatures]
+            step = self.config.gripper_speed * elapsed
+            delta = self._gripper_target - self._gripper_position
+            self._gripper_position += max(-step, min(step, delta))
+            moving = bool(self._queue)
+        self._set_state(STATE_MOVING if moving else STATE_READY)
+
+    def _set_state(self, state: int) -> None:
+        with self._lock:
+            if self._state == state:
+                return
+            self._state = state
+            if state != STATE_MOVING:
+                self._idle.notify_all()
+        self._report("state_changed", {"state": state})
+
+    def _set_error(self, error_code: int, warn_code: int | None = None) -> None:
+        with self._lock:
+            warn_code = self._warn_code if warn_code is None else warn_code
+            if (self._error_code, self._warn_code) == (error_code, warn_code):
+                return
+            self._error_code, self._warn_code = error_code, warn_code
+        self._report("error_warn_changed", {"error_code": error_code, "warn_code": warn_code})
+
+    def _wait_idle(self, timeout: float | None) -> int:
+        with self._idle:
+            finished = self._idle.wait_for(
+                lambda: not self._queue or self._state != STATE_MOVING or not self._connected,
+                timeout,
+            )
+        return CODE_OK if finished else 100  # "wait finish timeout"
+
+    def inject_gripper_error(self, error_code: int) -> None:
+        """Put the gripper in a fault, cleared with clean_gripper_error()."""
+        self.arm.gripper_error_code = error_code
+
+    def inject_error(self, error_code: int, warn_code: int = 0) -> None:
+        """Raise a controller error (or warning) as the real arm would."""
+        self._set_error(error_code, warn_code)
+        if error_code:
+            with self._lock:
+                self._queue.clear()
+            self._set_state(STATE_STOPPED)
+
+    # Read-only SDK properties, served from the reported values without a round trip.
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def sn(self) -> str:
+        return f"XS{zlib.crc32(self.port.encode()) % 10**8:08d}"
+
+    @property
+    def device_type(self) -> int:
+        return LITE6_DEVICE_TYPE if self.config.is_lite6 else self.config.axis
+
+    @property
+    def axis(self) -> int:
+        return self.config.axis
+
+    @property
+    def version(self) -> str:
+        return "v2.5.0"
+
+    @property
+    def version_number(self) -> tuple[int, int, int]:
+        return (2, 5, 0)
+
+    @property
+    def position(self) -> list[float]:
+        with self._lock:
+            return list(self._position)
+
+    @property
+    def angles(self) -> list[float]:
+        """Joint angles derived from the pose, not real inverse kinematics."""
+        with self._lock:
+            x, y, z, roll, pitch, yaw = self._position
+        base = math.degrees(math.atan2(y, x))
+        reach = math.hypot(x, y, z)
+        joints = [base, reach / 10 - 20, z / 10 - 14, roll + 180, pitch, yaw - base, 0.0]
+        return [round(j, 3) for j in joints[: self.config.axis]] + [0.0] * (7 - self.config.axis)
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    @property
+    def mode(self) -> int:
+        return self._mode
+
+    @property
+    def error_code(self) -> int:
+        return self._error_code
+
+    @property
+    def warn_code(self) -> int:
+        return self._warn_code
+
+    @property
+    def has_error(self) -> bool:
+        return self._error_code != 0
+
+    @property
+    def has_warn(self) -> bool:
+        return self._warn_code != 0
+
+    @property
+    def has_err_warn(self) -> bool:
+        return self.has_error or self.has_warn
+
+    @property
+    def cmd_num(self) -> int:
+        return len(self._queue)
+
+    @property
+    def collision_sensitivity(self) -> int:
+        return self._collision_sensitivity
+
+    @property
+    def motor_brake_states(self) -> list[int]:
+        return [int(self._motor_enable)] * self.config.axis + [0] * (8 - self.config.axis)
+
+    @property
+    def motor_enable_states(self) -> list[int]:
+        return [int(self._motor_enable)] * self.config.axis + [0] * (8 - self.config.axis)
+
+    @property
+    def self_collision_params(self) -> list:
+        return [True, 0, []]
+
+    @property
+    def servo_codes(self) -> list[list[int]]:
+        return [[0, 0] for _ in range(self.config.axis + 1)]
+
+    @property
+    def temperatures(self) -> list[float]:
+        with self._lock:
+            return [round(t, 1) for t in self._temperatures]
+
+    @property
+    def currents(self) -> list[float]:
+        moving = self._state == STATE_MOVING
+        return [0.8 if moving else 0.1] * self.config.axis + [0.0] * (7 - self.config.axis)
+
+    # Requests
+
+    def get_state(self) -> tuple[int, int]:
+        return self._request(), self._state
+
+    def get_is_moving(self) -> bool:
+        self._request()
+        return self._state == STATE_MOVING
+
+    def get_position(self, is_radian: bool | None = None) -> tuple[int, list[float]]:
+        return self._request(), self.position
+
+    def get_servo_angle(self, servo_id: int | None = None, is_radian: bool | None = None, **kwargs):
+        return self._request(), self.angles
+
+    def get_err_warn_code(self, show: bool = False, lang: str = "en") -> tuple[int, list[int]]:
+        return self._request(), [self._error_code, self._warn_code]
+
+    def get_cmdnum(self) -> tuple[int, int]:
+        return self._request(), self.cmd_num
+
+    def set_position(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        roll: float | None = None,
+        pitch: float | None = None,
+        yaw: float | None = None,
+        radius: float | None = None,
+        speed: float | None = None,
+        mvacc: float | None = None,
+        relative: bool = False,
+        wait: bool = False,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> int:
+        code = self._request()
+        if code != CODE_OK:
+            return code
+        with self._lock:
+            if self._error_code or not self._motor_enable or self._state == STATE_STOPPED:
+                return CODE_NOT_READY
+            # Like the SDK, unspecified axes keep the last queued (or current) target.
+            last = list(self._queue[-1][0]) if self._queue else list(self._position)
+            for index, value in enumerate((x, y, z, roll, pitch, yaw)):
+                if value is not None:
+                    last[index] = last[index] + value if relative else float(value)
+            self._queue.append((last, float(speed or self.config.speed)))
+        self._set_state(STATE_MOVING)
+        return self._wait_idle(timeout) if wait else CODE_OK
+
+    def move_gohome(self, speed: float | None = None, wait: bool = False, timeout: float | None = None, **kwargs) -> int:
+        return self.set_position(*HOME_POSITION, speed=speed, wait=wait, timeout=timeout)
+
+    def emergency_stop(self) -> int:
+        code = self._request()
+        with self._lock:
+            self._queue.clear()
+        self._set_state(STATE_STOPPED)
+        return code
+
+    def clean_error(self) -> int:
+        code = self._request()
+        if code == CODE_OK:
+            self._set_error(0)
+        return code
+
+    def clean_warn(self) -> int:
+        code = self._request()
+        if code == CODE_OK:
+            self._set_error(self._error_code, 0)
+        return code
+
+    def motion_enable(self, enable: bool = True, servo_id: int | None = None) -> int:
+        code = self._request()
+        if code == CODE_OK:
+            self._motor_enable = enable
+            states = [bool(enable)] * self.config.axis
+            self._report("mtable_mtbrake_changed", {"mtable": states, "mtbrake": states})
+        return code
+
+    def set_mode(self, mode: int = 0, **kwargs) -> int:
+        code = self._request()
+        if code == CODE_OK and mode != self._mode:
+            self._mode = mode
+            self._report("mode_changed", {"mode": mode})
+        return code
+
+    def set_state(self, state: int = 0) -> int:
+        code = self._request()
+        if code != CODE_OK:
+            return code
+        if state == 0:
+            self._set_state(STATE_MOVING if self._queue else STATE_READY)
+        elif state == STATE_STOPPED:
+            with self._lock:
+                self._queue.clear()
+            self._set_state(STATE_STOPPED)
+        else:
+            self._set_state(state)
+        return code
+
+    def set_collision_sensitivity(self, value: int, wait: bool = True) -> int:
+        code = self._request()
+        if code == CODE_OK:
+            self._collision_sensitivity = value
+        return code
+
+    # Gripper
+
+    def _gripper_request(self) -> int:
+        code = self._request()
+        if code == CODE_OK and (not self.config.has_gripper or self.config.is_lite6):
+            return CODE_NO_GRIPPER
+        return code
+
+    def get_gripper_version(self) -> tuple[int, str]:
+        code = self._gripper_request()
+        return (code, "3.4.3") if code == CODE_OK else (code, "*.*.*")
+
+    def get_gripper_position(self, **kwargs) -> tuple[int, float | None] | int:
+        code = self._gripper_request()
+        if code == CODE_OK and self.arm.gripper_error_code:
+            # Like the SDK, a gripper fault returns a bare code instead of a tuple.
+            return END_EFFECTOR_HAS_FAULT
+        return (code, round(self._gripper_position)) if code == CODE_OK else (code, None)
+
+    def get_gripper_err_code(self, **kwargs) -> tuple[int, int]:
+        return self._gripper_request(), self.arm.gripper_error_code
+
+    def set_gripper_position(self, pos: float, wait: bool = False, speed: float | None = None, timeout: float | None = None, **kwargs) -> int:
+        code = self._gripper_request()
+        if code != CODE_OK:
+            return code
+        if speed is not None:
+            self.arm.gripper_speed = speed
+        self._gripper_target = float(pos)
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while abs(self._gripper_position - self._gripper_target) > 1 and self._connected:
+                if deadline is not None and time.monotonic() > deadline:
+                    return 100  # "wait finish timeout"
+                time.sleep(self._step_interval())
+        return CODE_OK
+
+    def set_gripper_speed(self, speed: float, **kwargs) -> int:
+        code = self._gripper_request()
+        if code == CODE_OK:
+            self.arm.gripper_speed = speed
+        return code
+
+    def set_gripper_mode(self, mode: int, **kwargs) -> int:
+        return self._gripper_request()
+
+    def set_gripper_enable(self, enable: bool, **kwargs) -> int:
+        return self._gripper_request()
+
+    def clean_gripper_error(self, **kwargs) -> int:
+        code = self._gripper_request()
+        if code == CODE_OK:
+            self.arm.gripper_error_code = 0
+        return code
+
+    def open_lite6_gripper(self, sync: bool = True) -> int:
+        return self._request()
+
+    def close_lite6_gripper(self, sync: bool = True) -> int:
+        return self._request()
+
+    def stop_lite6_gripper(self, sync: bool = True) -> int:
+        return self._request()
+
+
+def _move_toward(position: list[float], target: list[float], distance: float) -> list[float]:
+    """Move a pose along a straight line toward target by at most distance (mm).
+
+    The orientation is interpolated over the same fraction of the path.
+    """
+    remaining = math.dist(position[:3], target[:3])
+    rotation = max(abs(t - p) for p, t in zip(position[3:], target[3:]))
+    # Rotations are treated as 1 mm per degree so pure re-orientations still move.
+    span = max(remaining, rotation)
+    if span <= distance or span == 0:
+        return list(target)
+    fraction = distance / span
+    return [p + (t - p) * fraction for p, t in zip(position, target)]
@@ -0,0 +1,176 @@
+"""Fixed-memory history of the reports pushed by an xArm."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+import math
+from threading import Lock
+
+# Channels of a sample, in storage order. Joints and temperatures are reported for 7 axes.
+POSE_CHANNELS = ("x", "y", "z", "roll", "pitch", "yaw")
+JOINT_CHANNELS = tuple(f"joint{i}" for i in range(1, 8))
+TEMPERATURE_CHANNELS = tuple(f"temperature{i}" for i in range(1, 8))
+CHANNELS = POSE_CHANNELS + JOINT_CHANNELS + TEMPERATURE_CHANNELS
+
+# Report keys feeding each block of channels.
+_REPORT_CHANNELS = {
+    "cartesian": POSE_CHANNELS,
+    "joints": JOINT_CHANNELS,
+    "temperatures": TEMPERATURE_CHANNELS,
+}
+# Location reports arrive at the full report rate and each one stores a sample.
+# Temperatures only update the values carried into the next sample.
+_SAMPLED_KEYS = ("cartesian", "joints")
+
+
+class TelemetryBuffer:
+    """Ring buffer of timestamped samples backed by preallocated arrays.
+
+    Memory is allocated once for capacity samples, so the history costs the
+    same after a minute or a month of uptime. Values are stored as 32-bit
+    floats, plenty for 0.01 mm and 0.01 degree resolution. push() is called on
+    the SDK report thread, reads can come from any thread.
+    """
+
+    def __init__(self, capacity: int, channels: Sequence[str] = CHANNELS) -> None:
+        self.capacity = capacity
+        self.channels = tuple(channels)
+        self._width = len(self.channels)
+        self._offsets = {
+            key: self.channels.index(names[0])
+            for key, names in _REPORT_CHANNELS.items()
+            if names[0] in self.channels
+        }
+        self._lock = Lock()
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("f", bytes(4 * capacity * self._width))
+        self._current = array("f", [math.nan] * self._width)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the sample arrays."""
+        return (
+            self._times.itemsize * len(self._times)
+            + self._values.itemsize * len(self._values)
+        )
+
+    def push(self, report: dict, timestamp: float) -> None:
+        """Record an SDK report, storing a sample for location reports."""
+        sampled = False
+        with self._lock:
+            for key, offset in self._offsets.items():
+                values = report.get(key)
+                if values is None:
+                    continue
+                count = min(len(values), len(_REPORT_CHANNELS[key]))
+                self._current[offset : offset + count] = array("f", values[:count])
+                sampled = sampled or key in _SAMPLED_KEYS
+            if not sampled:
+                return
+            index = self._next
+            self._times[index] = timestamp
+            start = index * self._width
+            self._values[start : start + self._width] = self._current
+            self._next = (index + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def _snapshot(self) -> tuple[array, array]:
+        """Return copies of the stored times and values in chronological order."""
+        with self._lock:
+            first = (self._next - self._size) % self.capacity
+            if first + self._size <= self.capacity:
+                times = self._times[first : first + self._size]
+                values = self._values[first * self._width : (first + self._size) * self._width]
+            else:
+                times = self._times[first:] + self._times[: self._next]
+                values = (
+                    self._values[first * self._width :]
+                    + self._values[: self._next * self._width]
+                )
+        return times, values
+
+    def samples(self) -> Iterator[tuple[float, dict[str, float]]]:
+        """Yield (timestamp, {channel: value}) from the oldest sample to the newest."""
+        times, values = self._snapshot()
+        for index, timestamp in enumerate(times):
+            row = values[index * self._width : (index + 1) * self._width]
+            yield timestamp, dict(zip(self.channels, row))
+
+    def downsample(
+        self,
+        window: float,
+        since: float | None = None,
+        channels: Iterable[str] | None = None,
+    ) -> list[dict]:
+        """Aggregate samples newer than since into min/max/mean buckets of window seconds.
+
+        Buckets are aligned to multiples of window and empty ones are left out.
+        Channels without any value in a bucket (e.g. temperatures before the
+        first temperature report) have None statistics.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        wanted = [
+            (name, self.channels.index(name))
+            for name in (channels if channels is not None else self.channels)
+        ]
+        times, values = self._snapshot()
+        buckets: list[dict] = []
+        bucket_start = None
+        stats: list[list[float]] = []
+        count = 0
+
+        def close_bucket() -> None:
+            bucket = {
+                "start": datetime.fromtimestamp(bucket_start, UTC).isoformat(),
+                "count": count,
+            }
+            for (name, _), (low, high, total, seen) in zip(wanted, stats):
+                bucket[name] = (
+                    {"min": round(low, 3), "max": round(high, 3), "mean": round(total / seen, 3)}
+                    if seen
+                    else None
+                )
+            buckets.append(bucket)
+
+        for index, timestamp in enumerate(times):
+            if since is not None and timestamp < since:
+                continue
+            start = math.floor(timestamp / window) * window
+            if start != bucket_start:
+                if bucket_start is not None:
+                    close_bucket()
+                bucket_start = start
+                stats = [[math.inf, -math.inf, 0.0, 0] for _ in wanted]
+                count = 0
+            count += 1
+            row = index * self._width
+            for stat, (_, offset) in zip(stats, wanted):
+                value = values[row + offset]
+                if math.isnan(value):
+                    continue
+                stat[0] = min(stat[0], value)
+                stat[1] = max(stat[1], value)
+                stat[2] += value
+                stat[3] += 1
+        if bucket_start is not None:
+            close_bucket()
+        return buckets
+
+    def summary(self) -> dict:
+        """Return the size and time span of the stored history."""
+        times, _ = self._snapshot()
+        return {
+            "capacity": self.capacity,
+            "samples": len(times),
+            "memory_bytes": self.nbytes,
+            "oldest": datetime.fromtimestamp(times[0], UTC).isoformat() if times else None,
+            "newest": datetime.fromtimestamp(times[-1], UTC).isoformat() if times else None,
+        }
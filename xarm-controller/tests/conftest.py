@@ -1,9 +1,27 @@
 """Fixtures for testing."""
 
+import os
+
+import custom_components
+from homeassistant.loader import DATA_CUSTOM_COMPONENTS
 import pytest
 
+CUSTOM_COMPONENTS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components")
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations."""
     return
+
+
+@pytest.fixture
+def xarm_integration(hass):
+    """Make this repository's integration loadable in hass.
+
+    pytest-homeassistant-custom-component ships its own custom_components
+    package, which shadows ours when Home Assistant scans for integrations.
+    """
+    if CUSTOM_COMPONENTS not in custom_components.__path__:
+        custom_components.__path__.insert(0, CUSTOM_COMPONENTS)
+    hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
@@ -0,0 +1,259 @@
+"""Benchmark the coordinator against a simulated arm.
+
+Location reports are fed into the simulator at increasing rates and the
+time from SDK callback to Home Assistant state change is measured, along
+with the reports handled per second, event loop time spent per entity
+update and the memory held by one arm. A second benchmark runs a cell of
+50 simulated arms on the shared worker pool and measures the aggregate
+load and the event loop lag.
+
+The results are compared to tests/benchmark_baseline.json. Run with
+XARM_BENCHMARK_UPDATE=1 to store the current results as the new baseline.
+The benchmarks depend on wall-clock time and are deselected by default, run
+them with `pytest -m benchmark` on an otherwise idle machine.
+"""
+import asyncio
+from collections.abc import Callable
+from importlib import import_module
+import json
+import os
+from pathlib import Path
+import statistics
+import threading
+import time
+import tracemalloc
+
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+DOMAIN = "xarm-controller"
+DATA_CONNECTION_MANAGER = "connection_manager"
+SIMULATOR_HOST = "simulator"
+BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+UPDATE_BASELINE = os.environ.get("XARM_BENCHMARK_UPDATE") == "1"
+# Reports per second fed into the simulator.
+RATES = (50, 200, 1000)
+DURATION = 1.0
+# Size of the simulated cell and how long it runs, with the loop lag sampled every tick.
+ARMS = 50
+MANY_ARMS_DURATION = 2.0
+LOOP_TICK = 0.01
+# Allowed drift from the baseline before a run counts as a regression. Latency
+# and loop time are noisy on shared machines, so only large regressions fail.
+THROUGHPUT_TOLERANCE = 0.8
+LATENCY_TOLERANCE = 3.0
+MEMORY_TOLERANCE = 1.5
+# Scheduling noise added on top of the latency tolerances, in milliseconds.
+LATENCY_SLACK_MS = 25.0
+LOOP_SLACK_MS = 1.0
+# Sequence numbers are sent as the x coordinate, offset to stay clear of the home pose.
+X_OFFSET = 10000
+
+pytestmark = pytest.mark.benchmark
+
+
+def _feed(client, rate: float, count: int, sent: dict[float, float]) -> None:
+    """Send count location reports at rate per second from a thread, like the SDK."""
+    interval = 1 / rate
+    next_send = time.perf_counter()
+    for seq in range(count):
+        x = float(X_OFFSET + seq)
+        sent[x] = time.perf_counter()
+        client.simulate_report(
+            "report_location", {"cartesian": [x, 0.0, 140.5, -180.0, 0.0, 0.0], "joints": [0.0] * 7}
+        )
+        next_send += interval
+        delay = next_send - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1] if len(values) > 1 else values[0]
+
+
+def _traced_memory() -> tracemalloc.Snapshot:
+    # The sequence numbers and latencies kept by the benchmark itself don't count.
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__)])
+
+
+async def _setup(hass: HomeAssistant, name: str) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: SIMULATOR_HOST, CONF_NAME: name, ATTR_SERIAL_NUMBER: name},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # The arm is connected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
+    return entry
+
+
+async def _run(hass: HomeAssistant, rate: int) -> dict[str, float]:
+    # Load the platforms once so module imports aren't counted as memory per arm.
+    warmup = await _setup(hass, "warmup")
+    assert await hass.config_entries.async_unload(warmup.entry_id)
+    await hass.async_block_till_done()
+
+    tracemalloc.start()
+    memory_before = _traced_memory()
+    entry = await _setup(hass, "bench")
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.xarm_client
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.data[ATTR_SERIAL_NUMBER]}_x"
+    )
+    assert entity_id is not None
+
+    sent: dict[float, float] = {}
+    latencies: list[float] = []
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if event.data["entity_id"] != entity_id or event.data["new_state"] is None:
+            return
+        try:
+            started = sent.get(float(event.data["new_state"].state))
+        except ValueError:
+            return
+        if started is not None:
+            latencies.append(time.perf_counter() - started)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    # Only the reports fed in count, silence the simulator's own location reports.
+    report_rate, client.config.report_rate = client.config.report_rate, 0
+    received, flushed, flush_time = (
+        coordinator.coalescer.received,
+        coordinator.coalescer.flushed,
+        coordinator.coalescer.flush_time,
+    )
+    feeder = threading.Thread(target=_feed, args=(client, rate, int(rate * DURATION), sent))
+    started = time.perf_counter()
+    feeder.start()
+    while feeder.is_alive():
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    # Let the last coalesced snapshot reach the entities.
+    await asyncio.sleep(2 / coordinator.coalescer.max_rate)
+    await hass.async_block_till_done()
+    unsub()
+    client.config.report_rate = report_rate
+
+    memory = sum(stat.size_diff for stat in _traced_memory().compare_to(memory_before, "filename"))
+    tracemalloc.stop()
+    updates = coordinator.coalescer.flushed - flushed
+    result = {
+        "events_per_s": (coordinator.coalescer.received - received) / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "loop_ms_per_update": (coordinator.coalescer.flush_time - flush_time) / updates * 1000,
+        "memory_kb": memory / 1024,
+    }
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    return result
+
+
+def _baseline(
+    key: str, result: dict[str, float], record_property: Callable[[str, object], None]
+) -> dict[str, float] | None:
+    """Return the stored baseline for key, or store result when updating the baseline.
+
+    The result is recorded as a test property, e.g. for the junit XML report.
+    """
+    for name, value in result.items():
+        record_property(f"{key}_{name}", round(value, 3))
+    baselines = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    if UPDATE_BASELINE:
+        baselines[key] = {name: round(value, 3) for name, value in result.items()}
+        BASELINE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return None
+    if key not in baselines:
+        pytest.skip(f"No baseline for {key}, run with XARM_BENCHMARK_UPDATE=1")
+    return baselines[key]
+
+
+@pytest.mark.parametrize("rate", RATES)
+async def test_report_throughput_and_latency(
+    hass: HomeAssistant, xarm_integration, record_property, rate: int
+) -> None:
+    """Test the coordinator keeps up with the report rate without regressing."""
+    result = await _run(hass, rate)
+
+    # Every report fed in has to be handled, whatever the baseline says.
+    assert result["events_per_s"] >= rate * THROUGHPUT_TOLERANCE
+    baseline = _baseline(str(rate), result, record_property)
+    if baseline is None:
+        return
+    assert result["events_per_s"] >= baseline["events_per_s"] * THROUGHPUT_TOLERANCE
+    assert result["p99_ms"] <= baseline["p99_ms"] * LATENCY_TOLERANCE + LATENCY_SLACK_MS
+    assert result["loop_ms_per_update"] <= baseline["loop_ms_per_update"] * LATENCY_TOLERANCE + LOOP_SLACK_MS
+    assert result["memory_kb"] <= baseline["memory_kb"] * MEMORY_TOLERANCE
+
+
+async def test_many_arms(hass: HomeAssistant, xarm_integration, record_property) -> None:
+    """Test one Home Assistant instance handles a cell of simulated arms."""
+    manager_module = import_module("custom_components.xarm-controller.manager")
+    warmup = await _setup(hass, "warmup")
+    assert await hass.config_entries.async_unload(warmup.entry_id)
+    await hass.async_block_till_done()
+
+    tracemalloc.start()
+    memory_before = _traced_memory()
+    started = time.perf_counter()
+    entries = [await _setup(hass, f"{SIMULATOR_HOST}-{i}") for i in range(ARMS)]
+    setup_time = time.perf_counter() - started
+    manager = manager_module.async_get_manager(hass)
+    memory = sum(stat.size_diff for stat in _traced_memory().compare_to(memory_before, "filename"))
+    tracemalloc.stop()
+
+    # Keep half of the cell moving so position polls and reports stay at the active rate.
+    for entry in entries[::2]:
+        client = hass.data[DOMAIN][entry.entry_id].xarm_client
+        for x in (250.0, 200.0, 250.0, 200.0):
+            await hass.async_add_executor_job(lambda c=client, x=x: c.set_position(x=x, speed=100))
+
+    metrics_before = manager.metrics()
+    lags: list[float] = []
+    peak_busy = peak_queued = peak_workers = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < MANY_ARMS_DURATION:
+        tick = time.perf_counter()
+        await asyncio.sleep(LOOP_TICK)
+        lags.append(time.perf_counter() - tick - LOOP_TICK)
+        metrics = manager.metrics()
+        peak_busy = max(peak_busy, metrics["busy_workers"])
+        peak_queued = max(peak_queued, metrics["queued_commands"])
+        peak_workers = max(
+            peak_workers,
+            sum(thread.name.startswith(f"{DOMAIN}_") for thread in threading.enumerate()),
+        )
+    elapsed = time.perf_counter() - started
+    metrics = manager.metrics()
+
+    assert metrics["arms"] == metrics["connected"] == ARMS
+    # The shared pool bounds the threads no matter how many arms there are.
+    assert 0 < peak_workers <= manager.pool_size
+    result = {
+        "setup_s": setup_time,
+        "memory_kb_per_arm": memory / 1024 / ARMS,
+        "reports_per_s": (metrics["reports_received"] - metrics_before["reports_received"]) / elapsed,
+        "polls_per_s": (metrics["polls"] - metrics_before["polls"]) / elapsed,
+        "loop_lag_p99_ms": _percentile(lags, 99) * 1000,
+        "peak_busy_workers": peak_busy,
+        "peak_queued_commands": peak_queued,
+    }
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_CONNECTION_MANAGER not in hass.data[DOMAIN]
+
+    baseline = _baseline(f"{ARMS}_arms", result, record_property)
+    if baseline is None:
+        return
+    assert result["reports_per_s"] >= baseline["reports_per_s"] * THROUGHPUT_TOLERANCE
+    assert result["loop_lag_p99_ms"] <= baseline["loop_lag_p99_ms"] * LATENCY_TOLERANCE + LATENCY_SLACK_MS
+    assert result["memory_kb_per_arm"] <= baseline["memory_kb_per_arm"] * MEMORY_TOLERANCE
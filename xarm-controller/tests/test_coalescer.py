@@ -0,0 +1,44 @@
+"""Test coalescing of xArm reports."""
+import asyncio
+from importlib import import_module
+import threading
+
+coalescer = import_module("custom_components.xarm-controller.coalescer")
+
+
+async def test_position_burst_is_merged():
+    """Test a burst of location reports is flushed as one latest-value snapshot."""
+    flushed = []
+    reports = coalescer.ReportCoalescer(
+        asyncio.get_running_loop(), flushed.append, max_rate=10
+    )
+
+    def burst():
+        for i in range(200):
+            reports.push({"cartesian": [i, 0, 0, 0, 0, 0], "joints": [0] * 7})
+
+    thread = threading.Thread(target=burst)
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0.15)
+
+    assert reports.received == 200
+    assert reports.flushed <= 2
+    assert flushed[-1]["cartesian"][0] == 199
+
+
+async def test_state_report_is_not_delayed():
+    """Test non-location reports skip the rate limit."""
+    flushed = []
+    reports = coalescer.ReportCoalescer(
+        asyncio.get_running_loop(), flushed.append, max_rate=0.5
+    )
+
+    reports.push({"cartesian": [0] * 6})
+    await asyncio.sleep(0.01)
+    reports.push({"cartesian": [1] * 6})
+    reports.push({"state": 4})
+    await asyncio.sleep(0.01)
+
+    assert flushed[-1] == {"cartesian": [1] * 6, "state": 4}
+    reports.async_cancel()
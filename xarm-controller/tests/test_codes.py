@@ -0,0 +1,28 @@
+"""Test the decoding of xArm controller codes."""
+from importlib import import_module
+
+codes = import_module("custom_components.xarm-controller.codes")
+
+
+def test_known_codes_are_decoded_once():
+    """Test known codes carry a message and action and decode to the same object."""
+    decoded = codes.CONTROLLER_ERRORS.decode(22)
+    assert decoded.severity == codes.SEVERITY_ERROR
+    assert decoded.message and decoded.action
+    assert codes.CONTROLLER_ERRORS.decode(22) is decoded
+    assert codes.CONTROLLER_ERRORS.decode(0).ok
+
+
+def test_integration_messages_take_precedence():
+    """Test the integration's own tables override the SDK titles."""
+    assert codes.GRIPPER_ERRORS.decode(11).message == "Gripper Current Overlimit"
+    assert codes.CONTROLLER_WARNINGS.decode(11).severity == codes.SEVERITY_WARNING
+
+
+def test_unknown_codes_are_cached():
+    """Test codes missing from every table are decoded on first sight and kept."""
+    size = len(codes.SERVO_ERRORS)
+    decoded = codes.SERVO_ERRORS.decode(9999)
+    assert decoded.message == "Unknown servo error 9999"
+    assert codes.SERVO_ERRORS.decode(9999) is decoded
+    assert len(codes.SERVO_ERRORS) == size + 1
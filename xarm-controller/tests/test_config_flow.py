@@ -0,0 +1,139 @@
+"""Test the xArm controller config flow."""
+import asyncio
+from importlib import import_module
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+DOMAIN = "xarm-controller"
+
+integration = import_module("custom_components.xarm-controller")
+config_flow = import_module("custom_components.xarm-controller.config_flow")
+
+
+async def _submit_host(hass: HomeAssistant, host: str) -> dict:
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "host"}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: host, CONF_NAME: "arm"}
+    )
+
+
+async def test_user_flow_probes_once(hass: HomeAssistant, xarm_integration) -> None:
+    """Test the arm is probed off the loop, confirmed and added without a second probe."""
+    with patch.object(
+        config_flow, "_probe_controller", wraps=config_flow._probe_controller
+    ) as probe:
+        result = await _submit_host(hass, "simulator")
+        assert result["type"] is FlowResultType.FORM
+        assert result["step_id"] == "confirm"
+        assert result["description_placeholders"]["axis"] == "6"
+
+        # Starting over within the cache lifetime reuses the probe.
+        await _submit_host(hass, "simulator")
+        assert probe.call_count == 1
+
+    with patch.object(integration, "async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_HOST] == "simulator"
+    assert result["data"][ATTR_SERIAL_NUMBER] == result["result"].unique_id
+    assert result["data"]["capabilities"] == {"axis": 6, "is_lite6": False, "gripper": True}
+
+
+async def test_user_flow_times_out(hass: HomeAssistant, xarm_integration) -> None:
+    """Test a controller that never answers fails the step after the probe timeout."""
+
+    async def never_answers(*args):
+        await asyncio.Event().wait()
+
+    with patch.object(config_flow, "PROBE_TIMEOUT", 0.01), patch.object(
+        config_flow.asyncio, "open_connection", never_answers
+    ):
+        result = await _submit_host(hass, "192.0.2.1")
+    assert result["errors"] == {"base": "timeout"}
+
+
+async def test_user_flow_reports_refused_connections(
+    hass: HomeAssistant, xarm_integration
+) -> None:
+    """Test an unreachable controller shows an error."""
+    with patch.object(
+        config_flow.asyncio, "open_connection", side_effect=ConnectionRefusedError("refused")
+    ):
+        result = await _submit_host(hass, "192.0.2.1")
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_discovery_offers_new_arms(hass: HomeAssistant, xarm_integration) -> None:
+    """Test a subnet sweep is capped, fingerprints responders and skips configured arms."""
+    MockConfigEntry(domain=DOMAIN, unique_id="XS0001").add_to_hass(hass)
+    arms = {"192.0.2.10": "XS0001", "192.0.2.20": "XS0002"}
+    concurrent = peak = 0
+
+    class Writer:
+        def close(self):
+            pass
+
+        async def wait_closed(self):
+            pass
+
+    async def open_connection(host, port):
+        nonlocal concurrent, peak
+        concurrent += 1
+        peak = max(peak, concurrent)
+        await asyncio.sleep(0)
+        concurrent -= 1
+        if host not in arms:
+            raise ConnectionRefusedError
+        return None, Writer()
+
+    def probe(host):
+        return config_flow.ProbeResult(host, arms[host], 6, 6, "2.3.0")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "discover"}
+    )
+    assert result["step_id"] == "discover"
+    with patch.object(config_flow.asyncio, "open_connection", open_connection), patch.object(
+        config_flow, "_probe_controller", probe
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"subnet": "192.0.2.0/24"}
+        )
+
+    assert 1 < peak <= config_flow.DISCOVERY_CONCURRENCY
+    assert result["step_id"] == "pick"
+    assert result["description_placeholders"] == {"count": "1"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "192.0.2.20", CONF_NAME: "second"}
+    )
+    assert result["step_id"] == "confirm"
+    assert result["description_placeholders"]["model"] == "xArm 6"
+
+
+async def test_discovery_rejects_large_subnets(hass: HomeAssistant, xarm_integration) -> None:
+    """Test sweeps larger than DISCOVERY_MAX_HOSTS are refused."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "discover"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"subnet": "10.0.0.0/16"}
+    )
+    assert result["errors"] == {"subnet": "subnet_too_large"}
@@ -0,0 +1,137 @@
+"""Test the xArm connection lifecycle."""
+from datetime import timedelta
+from importlib import import_module
+from unittest.mock import patch
+
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+DOMAIN = "xarm-controller"
+simulator = import_module("custom_components.xarm-controller.simulator")
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, xarm_integration):
+    """Set up an entry backed by the simulator and return its coordinator."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm"},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # The arm is connected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
+    yield hass.data[DOMAIN][entry.entry_id]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _advance(hass: HomeAssistant, seconds: float) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def _drop_link(hass: HomeAssistant, coordinator) -> None:
+    """Disconnect the simulator and let the coalescer deliver the report."""
+    coordinator.xarm_client.simulate_disconnect()
+    await _advance(hass, 0)
+    await _advance(hass, 0)
+
+
+async def test_reconnects_after_the_link_drops(hass: HomeAssistant, coordinator) -> None:
+    """Test a dropped link is retried right away and the arm re-initialized."""
+    connection = coordinator.connection
+    assert connection.state == "ready"
+    states = []
+    on_change = connection._on_change
+    connection._on_change = lambda state, reconnected: (
+        states.append(state),
+        on_change(state, reconnected),
+    )
+
+    await _drop_link(hass, coordinator)
+    assert states == ["reconnecting"]
+    assert coordinator._unsub_poll is None
+
+    await _advance(hass, 0)
+    assert states == ["reconnecting", "ready"]
+    assert connection.reconnects == 1
+    assert connection.reconnect_time is not None
+    assert coordinator.get_xarm_model().state.connected
+    assert coordinator._unsub_poll is not None
+
+
+async def test_unreachable_arm_goes_offline_with_backoff(hass: HomeAssistant, coordinator) -> None:
+    """Test failed reconnects back off, report the arm offline and recover later."""
+    connection = coordinator.connection
+    client = coordinator.xarm_client
+    client.reachable = False
+    await _drop_link(hass, coordinator)
+
+    await _advance(hass, 0)
+    assert connection.state == "reconnecting"
+    assert connection.attempts == 1
+    assert connection.retry_delay() == 1.0
+    for _ in range(4):
+        await _advance(hass, connection.retry_delay())
+    assert connection.attempts == 5
+    assert connection.state == "offline"
+    assert connection.retry_delay() == 16.0
+
+    client.reachable = True
+    await _advance(hass, connection.retry_delay())
+    assert connection.state == "ready"
+    assert connection.attempts == 0
+
+
+async def test_failing_polls_degrade_the_connection(hass: HomeAssistant, coordinator) -> None:
+    """Test consecutive poll failures mark the arm degraded until a poll succeeds."""
+    connection = coordinator.connection
+    for _ in range(3):
+        connection.async_poll_failed()
+    assert connection.state == "degraded"
+    assert connection.is_up
+
+    connection.async_poll_succeeded()
+    assert connection.state == "ready"
+
+
+async def test_setup_does_not_wait_for_the_arm(hass: HomeAssistant, xarm_integration) -> None:
+    """Test an unreachable arm loads unavailable and goes live once it answers."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: "simulator",
+            CONF_NAME: "arm",
+            ATTR_SERIAL_NUMBER: "arm",
+            "capabilities": {"axis": 6, "is_lite6": False, "gripper": True},
+        },
+    )
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    with patch.object(
+        simulator.SimulatedXArmAPI, "connect", side_effect=ConnectionRefusedError("refused")
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        assert coordinator.connection.state == "reconnecting"
+        x = registry.async_get_entity_id("sensor", DOMAIN, "arm_x")
+        assert hass.states.get(x).state == STATE_UNAVAILABLE
+        # The stored capability profile gives the entities without the arm.
+        assert registry.async_get_entity_id("sensor", DOMAIN, "arm_joint6_angle") is not None
+
+    await _advance(hass, coordinator.connection.retry_delay())
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.connection.state == "ready"
+    assert coordinator.info_loaded
+    assert hass.states.get(x).state != STATE_UNAVAILABLE
+    assert {"sdk_import", "platforms", "connect", "info"} <= coordinator.startup_timings.keys()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
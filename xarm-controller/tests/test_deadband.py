@@ -0,0 +1,43 @@
+"""Test the deadband filtering of sensor state writes."""
+from importlib import import_module
+
+deadband = import_module("custom_components.xarm-controller.deadband")
+
+
+def _publish(publish_filter, values, now=0.0) -> list:
+    """Offer each value at the same time, returning the ones written."""
+    written = []
+    for value in values:
+        if publish_filter.check(value, now) == 0:
+            publish_filter.record(value, now)
+            written.append(value)
+    return written
+
+
+def test_jitter_within_the_deadband_is_dropped():
+    """Test changes are written once they exceed the larger of the two deadbands."""
+    absolute = deadband.PublishFilter(deadband.DeadbandConfig(absolute=0.1))
+    assert _publish(absolute, [200.0, 200.05, 199.92, 200.2, 200.25, None]) == [200.0, 200.2, None]
+    assert (absolute.published, absolute.suppressed) == (3, 3)
+    assert absolute.as_dict()["ratio"] == 0.5
+
+    relative = deadband.PublishFilter(deadband.DeadbandConfig(absolute=0.01, relative=0.05))
+    assert _publish(relative, [2.0, 2.08, 1.9, 0.0]) == [2.0, 1.9, 0.0]
+
+
+def test_min_interval_holds_writes_back():
+    """Test a change arriving too soon is delayed until the interval has passed."""
+    publish_filter = deadband.PublishFilter(deadband.DeadbandConfig(min_interval=1.0))
+    assert publish_filter.check(1.0, 10.0) == 0
+    publish_filter.record(1.0, 10.0)
+
+    assert publish_filter.check(2.0, 10.25) == 0.75
+    # Unchanged values are dropped rather than delayed.
+    assert publish_filter.check(1.0, 10.5) is None
+    # A second change is folded into the write already held back.
+    assert publish_filter.check(2.5, 10.75) == 0.25
+    assert publish_filter.check(3.0, 11.0) == 0
+    publish_filter.record(3.0, 11.0)
+
+    # The held back write is only counted as published, not as suppressed too.
+    assert (publish_filter.published, publish_filter.suppressed) == (2, 2)
@@ -0,0 +1,46 @@
+"""Test the xArm controller diagnostics."""
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+DOMAIN = "xarm-controller"
+
+
+async def test_diagnostics_snapshot(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, xarm_integration
+) -> None:
+    """Test the download carries the model and performance data without redacted values."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm"},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # The arm is connected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_run_command("go_home", coordinator.get_xarm_model().go_home)
+    coordinator._record_error("poll", "timed out")
+
+    diagnostics = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+
+    assert diagnostics["entry"]["data"][CONF_HOST] == "**REDACTED**"
+    assert diagnostics["entry"]["data"][ATTR_SERIAL_NUMBER] == "**REDACTED**"
+    assert diagnostics["model"]["info"]["serial"] == "**REDACTED**"
+    assert diagnostics["model"]["joints"]["axis"] == len(diagnostics["model"]["joints"]["angle"])
+    commands = diagnostics["performance"]["commands"]
+    assert commands["queue_depth"] == 0
+    assert commands["recent"][-1]["name"] == "go_home"
+    assert commands["stats"]["go_home"]["count"] == 1
+    assert diagnostics["performance"]["polling"]["groups"]["position"]["interval"] > 0
+    assert diagnostics["performance"]["listeners"]["registered"] > 0
+    assert "x" in diagnostics["performance"]["state_writes"]["sensors"]
+    assert diagnostics["errors"][-1]["source"] == "poll"
+    assert "incidents" in diagnostics["event_loop"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,111 @@
+"""Test the xArm command dispatcher."""
+import asyncio
+from importlib import import_module
+import threading
+import time
+
+import pytest
+
+dispatcher = import_module("custom_components.xarm-controller.dispatcher")
+
+
+async def test_commands_run_off_loop_in_order():
+    """Test commands run sequentially on the worker thread."""
+    loop = asyncio.get_running_loop()
+    commands = dispatcher.XArmCommandDispatcher(loop, "test")
+    calls = []
+
+    def slow(value):
+        time.sleep(0.05)
+        calls.append((value, threading.current_thread() is threading.main_thread()))
+        return value
+
+    results = await asyncio.gather(
+        commands.async_call("first", slow, 1),
+        commands.async_call("second", slow, 2),
+    )
+
+    assert results == [1, 2]
+    assert calls == [(1, False), (2, False)]
+    assert commands.stats["second"].count == 1
+    # The second command had to wait for the first one to finish.
+    assert commands.timings[-1].queue_wait >= 0.04
+    commands.shutdown()
+
+
+async def test_queue_is_bounded():
+    """Test the dispatcher refuses commands once the queue is full."""
+    loop = asyncio.get_running_loop()
+    commands = dispatcher.XArmCommandDispatcher(loop, "test", max_pending=1)
+    release = threading.Event()
+
+    running = loop.create_task(commands.async_call("block", release.wait))
+    await asyncio.sleep(0.01)
+    queued = loop.create_task(commands.async_call("queued", lambda: None))
+    await asyncio.sleep(0)
+
+    with pytest.raises(dispatcher.CommandQueueFull):
+        await commands.async_call("overflow", lambda: None)
+
+    release.set()
+    await asyncio.gather(running, queued)
+    commands.shutdown()
+
+
+# Upper bound for a stop to reach the arm while the normal queue is saturated.
+STOP_LATENCY_BOUND = 0.05
+
+
+async def test_priority_lane_bypasses_a_saturated_queue():
+    """Test a stop runs right away and flushes the commands waiting behind a busy worker."""
+    loop = asyncio.get_running_loop()
+    commands = dispatcher.XArmCommandDispatcher(loop, "test", max_pending=8)
+    release = threading.Event()
+
+    running = loop.create_task(commands.async_call("move", release.wait, 5))
+    await asyncio.sleep(0.01)
+    queued = [
+        loop.create_task(commands.async_call("move", time.sleep, 0.5)) for _ in range(8)
+    ]
+    await asyncio.sleep(0)
+    with pytest.raises(dispatcher.CommandQueueFull):
+        await commands.async_call("overflow", lambda: None)
+
+    started = time.monotonic()
+    assert await commands.async_call_priority("emergency_stop", release.set) is None
+    assert time.monotonic() - started < STOP_LATENCY_BOUND
+    timing = commands.priority_timings[-1]
+    assert timing.queue_wait + timing.execution < STOP_LATENCY_BOUND
+
+    for task in queued:
+        with pytest.raises(dispatcher.CommandPreempted):
+            await task
+    assert commands.queue_depth == 0
+    assert await running is True
+    commands.shutdown()
+
+
+async def test_emergency_stop_ends_a_blocking_move():
+    """Test a stop on the priority lane releases a move waiting on the simulated arm."""
+    simulator = import_module("custom_components.xarm-controller.simulator")
+    arm = simulator.SimulatedXArmAPI(config=simulator.SimulatorConfig(latency=0.002, jitter=0))
+    loop = asyncio.get_running_loop()
+    commands = dispatcher.XArmCommandDispatcher(loop, "test")
+    x = arm.position[0]
+
+    move = loop.create_task(
+        commands.async_call("move", arm.set_position, x=x + 500, speed=10, wait=True)
+    )
+    queued = loop.create_task(commands.async_call("home", arm.move_gohome, wait=True))
+    await asyncio.sleep(0.05)
+
+    started = time.monotonic()
+    await commands.async_call_priority("emergency_stop", arm.emergency_stop)
+    assert await asyncio.wait_for(move, 1) == 0
+    assert time.monotonic() - started < STOP_LATENCY_BOUND * 2
+    with pytest.raises(dispatcher.CommandPreempted):
+        await queued
+    assert arm.state == simulator.STATE_STOPPED
+    assert arm.cmd_num == 0
+    commands.shutdown()
+    arm.disconnect()
@@ -0,0 +1,57 @@
+"""Test the connection manager shared by all arms."""
+import asyncio
+from importlib import import_module
+import threading
+import time
+
+const = import_module("custom_components.xarm-controller.const")
+manager_module = import_module("custom_components.xarm-controller.manager")
+
+
+async def test_poll_offsets_are_spread(hass):
+    """Test every arm gets its own offset inside the stagger window."""
+    manager = manager_module.XArmConnectionManager(hass, pool_size=2)
+    offsets = [manager.async_register(f"entry{i}", None) for i in range(50)]
+
+    assert offsets[0] == 0.0
+    assert all(0 <= offset < const.POLL_STAGGER_WINDOW for offset in offsets)
+    gaps = [b - a for a, b in zip(sorted(offsets), sorted(offsets)[1:])]
+    assert min(gaps) > const.POLL_STAGGER_WINDOW / 200
+
+    assert not manager.async_unregister("entry0")
+    for i in range(1, 50):
+        manager.async_unregister(f"entry{i}")
+    assert not manager.coordinators
+    manager.shutdown()
+
+
+async def test_arms_share_the_pool_but_run_their_commands_in_order(hass):
+    """Test calls for one arm never overlap while different arms run in parallel."""
+    manager = manager_module.XArmConnectionManager(hass, pool_size=4)
+    running = {"a": 0, "b": 0}
+    overlap = {"a": 0, "b": 0, "both": 0}
+    lock = threading.Lock()
+
+    def command(arm: str) -> str:
+        with lock:
+            running[arm] += 1
+            overlap[arm] = max(overlap[arm], running[arm])
+            overlap["both"] = max(overlap["both"], running["a"] + running["b"])
+        time.sleep(0.02)
+        with lock:
+            running[arm] -= 1
+        return threading.current_thread().name
+
+    arm_a = manager.create_dispatcher("a")
+    arm_b = manager.create_dispatcher("b")
+    threads = await asyncio.gather(
+        *(arm_a.async_call("cmd", command, "a") for _ in range(4)),
+        *(arm_b.async_call("cmd", command, "b") for _ in range(4)),
+    )
+
+    assert overlap["a"] == overlap["b"] == 1
+    assert overlap["both"] == 2
+    assert all(name.startswith(const.DOMAIN) for name in threads)
+    arm_a.shutdown()
+    arm_b.shutdown()
+    manager.shutdown()
@@ -0,0 +1,73 @@
+"""Test the SDK call and report metrics."""
+from importlib import import_module
+
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+metrics = import_module("custom_components.xarm-controller.metrics")
+simulator = import_module("custom_components.xarm-controller.simulator")
+
+DOMAIN = "xarm-controller"
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test observations land in the first bucket bounding them."""
+    histogram = metrics.Histogram(bounds=(0.01, 0.1))
+    for value in (0.005, 0.01, 0.05, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.01", 2), ("0.1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 2.065
+
+
+def test_instrumented_client_times_calls_and_counts_errors():
+    """Test every SDK method call is timed and error codes are counted."""
+    arm = simulator.SimulatedXArmAPI(
+        config=simulator.SimulatorConfig(latency=0.002, jitter=0, error_rate=1.0)
+    )
+    recorded = metrics.XArmMetrics()
+    client = metrics.InstrumentedClient(arm, recorded)
+
+    assert client.get_state()[0] == simulator.CODE_TIMEOUT
+    arm.config.error_rate = 0
+    assert client.get_state() == (0, simulator.STATE_READY)
+    assert client.position == arm.position
+
+    assert recorded.calls["get_state"].count == 2
+    assert recorded.calls["get_state"].sum >= 0.004
+    assert recorded.call_errors == {"get_state": 1}
+    assert "position" not in recorded.calls
+    arm.disconnect()
+
+
+async def test_metrics_endpoint(hass: HomeAssistant, xarm_integration, hass_client) -> None:
+    """Test arms with metrics enabled are exposed in the text format."""
+    assert await async_setup_component(hass, "http", {})
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm"},
+        options={"metrics": True},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # The arm is connected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.xarm_client.simulate_report("state_changed", {"state": 2})
+
+    client = await hass_client()
+    response = await client.get(f"/api/{DOMAIN}/metrics")
+    assert response.status == 200
+    text = await response.text()
+
+    serial = coordinator.get_xarm_model().info.serial
+    assert "# TYPE xarm_sdk_call_seconds histogram" in text
+    assert f'xarm_sdk_call_seconds_count{{arm="{serial}",method="get_gripper_version"}} 1' in text
+    assert f'xarm_reports_total{{arm="{serial}",report="state_changed"}}' in text
+    assert f'xarm_coordinator_flushes_total{{arm="{serial}"}}' in text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,171 @@
+"""Test the xArm data models."""
+from importlib import import_module
+from unittest.mock import MagicMock
+
+models = import_module("custom_components.xarm-controller.models")
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.sn = "XI1234"
+    client.position = [100.0, 0.0, 200.0, 180.0, 0.0, 0.0]
+    client.axis = 6
+    client.angles = [10.0, 20.0, 30.0, 0.0, 0.0, 0.0, 0.0]
+    client.temperatures = [35.0] * 7
+    client.currents = [0.5] * 7
+    client.motor_brake_states = [1] * 8
+    client.motor_enable_states = [1] * 8
+    client.servo_codes = [[0, 0]] * 8
+    client.device_type = 6
+    client.get_gripper_version.return_value = (0, "3.4.3")
+    client.get_gripper_position.return_value = (0, 500)
+    client.get_is_moving.return_value = False
+    return client
+
+
+def test_update_returns_qualified_dirty_fields():
+    """Test only the fields that changed are reported."""
+    client = _client()
+    data = models.XArmData(xarm_client=client, callback=None)
+
+    dirty = data.update()
+    assert {"position.x", "position.z", "position.roll"} <= dirty
+    assert "position.y" not in dirty
+    assert {"joints.angle1", "joints.temperature6", "joints.current1"} <= dirty
+    assert "joints.angle4" not in dirty
+
+    # Nothing moved, so a second refresh reports nothing.
+    assert data.update() == set()
+
+    client.position = [101.0, 0.0, 200.0, 180.0, 0.0, 0.0]
+    assert data.update() == {"position.position", "position.x"}
+
+
+def test_reports_update_only_their_group():
+    """Test pushed reports are applied without reading from the client."""
+    client = _client()
+    data = models.XArmData(xarm_client=client, callback=None)
+
+    assert data.position.apply_location(
+        {"cartesian": [1.0, 2.0, 3.0, 0.0, 0.0, 0.0], "joints": [0.0] * 7}
+    ) == {"position", "x", "y", "z"}
+    assert data.state.apply_state({"state": 1}) == {"is_moving"}
+    assert data.state.apply_error_warn({"error_code": 0, "warn_code": 11}) == {
+        "warn_code",
+        "warn_msg",
+        "has_warn",
+        "has_err_warn",
+    }
+    assert data.state.warn_msg == "uxbux queue is full"
+    client.get_is_moving.assert_not_called()
+
+
+def test_gripper_snapshot_uses_one_read():
+    """Test the gripper is read with a single SDK call and the version is cached."""
+    client = _client()
+    gripper = models.Gripper(client, callback=None)
+
+    assert {"present", "version", "position"} <= gripper.update()
+    gripper.update()
+
+    assert client.get_gripper_version.call_count == 1
+    assert client.get_gripper_position.call_count == 2
+    client.get_gripper_err_code.assert_not_called()
+    client.get_position.assert_not_called()
+
+
+def test_gripper_fault_is_read_from_the_error_code():
+    """Test the bare fault code the SDK returns instead of a position is handled."""
+    client = _client()
+    client.get_gripper_position.return_value = 102
+    client.get_gripper_err_code.return_value = (0, 9)
+    gripper = models.Gripper(client, callback=None)
+
+    assert {"error_code", "error_msg"} <= gripper.update()
+    assert gripper.error_code == 9
+    assert gripper.position == 0
+
+    client.get_gripper_position.return_value = (0, 500)
+    assert {"error_code", "position"} <= gripper.update()
+    assert gripper.error_code == 0
+
+
+def test_missing_gripper_is_not_read():
+    """Test arms without a gripper skip the gripper reads."""
+    client = _client()
+    client.get_gripper_version.return_value = (-1, "*.*.*")
+    gripper = models.Gripper(client, callback=None)
+
+    gripper.update()
+    gripper.update()
+
+    assert gripper.present is False
+    client.get_gripper_position.assert_not_called()
+
+
+def test_trajectory_is_streamed_without_waiting():
+    """Test every pose is queued with wait=False and blended except the last."""
+    client = _client()
+    client.set_position.return_value = 0
+    position = models.ArmPosition(client)
+    poses = [
+        {"x": 300.0, "y": 0.0, "z": 200.0, "roll": 180.0},
+        {"x": 300.0, "y": 100.0, "z": 200.0, "speed": 50.0},
+        {"x": 200.0, "y": 100.0, "z": 200.0},
+    ]
+
+    assert position.move_trajectory(poses, speed=100.0, acceleration=2000.0, radius=5.0) == (0, 3)
+    calls = [call.kwargs for call in client.set_position.call_args_list]
+    assert all(call["wait"] is False for call in calls)
+    assert [call["radius"] for call in calls] == [5.0, 5.0, None]
+    assert [call["speed"] for call in calls] == [100.0, 50.0, 100.0]
+    assert calls[0]["roll"] == 180.0 and calls[1]["roll"] is None
+
+
+def test_trajectory_stops_at_the_first_rejected_pose():
+    """Test nothing is queued after the controller rejects a pose."""
+    client = _client()
+    client.set_position.side_effect = [0, -6, 0]
+    position = models.ArmPosition(client)
+    poses = [{"x": 300.0, "y": 0.0, "z": 200.0}] * 3
+
+    assert position.move_trajectory(poses, 100.0, 2000.0, 0.0) == (-6, 1)
+    assert client.set_position.call_count == 2
+    # The pose already queued is flushed instead of running on its own.
+    assert [call.args for call in client.set_state.call_args_list] == [(4,), (0,)]
+
+
+def test_joint_snapshot_follows_the_axis_count():
+    """Test per-joint arrays are sized by the model and changes are tracked per joint."""
+    client = _client()
+    client.axis = 5
+    data = models.XArmData(xarm_client=client, callback=None)
+    data.update()
+
+    joints = data.joints
+    assert joints.axis == 5
+    assert list(joints.angle) == [10.0, 20.0, 30.0, 0.0, 0.0]
+    assert len(joints.brake) == len(joints.servo_code) == 5
+
+    assert joints.apply_angles({"joints": [10.0, 25.0, 30.0, 0.0, 0.0, 0.0, 0.0]}) == {"angle2"}
+    assert joints.apply_temperatures({"temperatures": [35.0, 35.0, 35.0, 35.0, 41.0, 60.0, 0.0]}) == {
+        "temperature5"
+    }
+    assert joints.apply_motor_states({"mtable": [1] * 8, "mtbrake": [1, 0, 1, 1, 1, 1, 1, 1]}) == {
+        "brake2"
+    }
+
+
+def test_servo_faults_are_decoded_per_joint():
+    """Test only joints with a servo error code are reported, decoded from [status, code]."""
+    client = _client()
+    client.servo_codes = [[0, 0], [1, 11], [0, 0], [0, 0], [1, 15], [2, 0], [0, 0], [0, 0]]
+    data = models.XArmData(xarm_client=client, callback=None)
+    data.update()
+
+    assert list(data.joints.servo_status) == [0, 1, 0, 0, 1, 2]
+    faults = data.joints.servo_faults()
+    assert list(faults) == [2, 5]
+    assert faults[2].message == "Joint Current Overlimit"
+    assert faults[5].message == "Joints Overheat"
+    assert faults[5].severity == "error"
@@ -0,0 +1,36 @@
+"""Test the completion tracking of arm and gripper motions."""
+from importlib import import_module
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+motion = import_module("custom_components.xarm-controller.motion")
+
+
+async def test_newer_gripper_motion_gets_its_own_grace_period(hass: HomeAssistant) -> None:
+    """Test a gripper not yet reversing for a new target isn't taken as stopped."""
+    # Closing for longer than the grace period before the new target arrives.
+    closing = list(range(1000, 299, -50))
+    positions = iter([*closing, 300, 300, 500, 700, 900, 1000])
+    reads = 0
+
+    async def read_gripper() -> float:
+        nonlocal reads
+        reads += 1
+        if reads == len(closing) + 1:
+            # Sent while the gripper is still closing, it hasn't turned around yet.
+            tracker.async_gripper_motion(1000)
+            tracker.async_gripper_motion_sent()
+        return next(positions)
+
+    with (
+        patch.object(motion, "GRIPPER_POLL_INTERVAL", 0.01),
+        patch.object(motion, "MOTION_START_GRACE", 0.1),
+    ):
+        tracker = motion.MotionTracker(hass, lambda: False, read_gripper)
+        done = tracker.async_gripper_motion(0)
+        tracker.async_gripper_motion_sent()
+        assert await motion.async_wait(done, 5, "gripper motion") == 1000
+
+    assert reads == len(closing) + 6
+    assert tracker.pending == {"arm": 0, "gripper": 0}
@@ -0,0 +1,187 @@
+"""Test the entities are picked from the arm's capability profile."""
+from importlib import import_module
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.components.button import SERVICE_PRESS
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_SERIAL_NUMBER,
+    CONF_HOST,
+    CONF_NAME,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+DOMAIN = "xarm-controller"
+simulator = import_module("custom_components.xarm-controller.simulator")
+
+
+def _entry(hass: HomeAssistant, **data) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm", **data},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _unique_ids(hass: HomeAssistant, entry: MockConfigEntry) -> set[str]:
+    return {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    }
+
+
+async def test_profile_is_learned_from_the_arm(hass: HomeAssistant, xarm_integration) -> None:
+    """Test an arm without a gripper gets no gripper entities and its profile is stored."""
+    entry = _entry(hass)
+    with patch.object(
+        simulator.SimulatedXArmAPI, "get_gripper_version", return_value=(-1, "*.*.*")
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.data["capabilities"] == {"axis": 6, "is_lite6": False, "gripper": False}
+    unique_ids = _unique_ids(hass, entry)
+    assert {"arm_x", "arm_joint6_angle", "arm_go_home_button"} <= unique_ids
+    assert "arm_joint7_angle" not in unique_ids
+    assert not {uid for uid in unique_ids if "gripper" in uid}
+    # Storing the profile doesn't reload the entry.
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][entry.entry_id].info_loaded
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_changed_arm_reloads_the_entry(hass: HomeAssistant, xarm_integration) -> None:
+    """Test a profile that no longer matches the arm is replaced and the entry reloaded."""
+    entry = _entry(hass, capabilities={"axis": 5, "is_lite6": False, "gripper": False})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.data["capabilities"] == {"axis": 6, "is_lite6": False, "gripper": True}
+    unique_ids = _unique_ids(hass, entry)
+    assert {"arm_joint6_angle", "arm_gripper_position", "arm_open_gripper_button"} <= unique_ids
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_buttons_follow_a_deferred_connect(hass: HomeAssistant, xarm_integration) -> None:
+    """Test buttons added from a stored profile become usable once the arm connects."""
+    entry = _entry(hass, capabilities={"axis": 6, "is_lite6": False, "gripper": True})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    entity_id = er.async_get(hass).async_get_entity_id("button", DOMAIN, "arm_emergency_stop_button")
+    # Added before the background connect finished.
+    assert entity_id is not None
+
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    await hass.services.async_call(
+        "button", SERVICE_PRESS, {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    assert hass.data[DOMAIN][entry.entry_id].xarm_client.get_state()[1] == simulator.STATE_STOPPED
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_changes_only_wake_their_group(hass: HomeAssistant, xarm_integration) -> None:
+    """Test a position change reaches the position entities only, and a link change all."""
+    entry = _entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    contexts = [context for _, context in coordinator._listeners.values()]
+    woken = sum(context is None or "position" in context for context in contexts)
+    assert 0 < woken < len(contexts)
+
+    wakeups, suppressed = coordinator.wakeups, coordinator.suppressed_wakeups
+    coordinator.async_notify_changes({"position.x"})
+    assert coordinator.wakeups - wakeups == woken
+    assert coordinator.suppressed_wakeups - suppressed == len(contexts) - woken
+
+    wakeups, suppressed = coordinator.wakeups, coordinator.suppressed_wakeups
+    coordinator.async_notify_changes({"state.connected"})
+    assert coordinator.wakeups - wakeups == len(contexts)
+    assert coordinator.suppressed_wakeups == suppressed
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_buttons_wake_on_availability(hass: HomeAssistant, xarm_integration) -> None:
+    """Test buttons subscribe to the state group and follow the link going up and down."""
+    entry = _entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    state = coordinator.get_xarm_model().state
+    entity_id = er.async_get(hass).async_get_entity_id("button", DOMAIN, "arm_go_home_button")
+    assert frozenset({"state"}) in [context for _, context in coordinator._listeners.values()]
+
+    state.connected = False
+    coordinator.async_notify_changes({"state.connected"})
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+    state.connected = True
+    coordinator.async_notify_changes({"state.connected"})
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_deadbands_are_configured_per_class(hass: HomeAssistant, xarm_integration) -> None:
+    """Test each sensor class takes its absolute and relative deadband from the options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm"},
+        options={"position_relative_deadband": 1, "current_deadband": 0.2},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    filters = hass.data[DOMAIN][entry.entry_id].publish_filters
+
+    assert (filters["x"].config.absolute, filters["x"].config.relative) == (0.1, 0.01)
+    assert (filters["joint1_angle"].config.absolute, filters["joint1_angle"].config.relative) == (0.1, 0)
+    assert filters["joint1_current"].config.absolute == 0.2
+    assert filters["joint1_current"].config.relative == 0.05
+    assert "joint1_temperature" not in filters
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_position_jitter_is_not_written(hass: HomeAssistant, xarm_integration) -> None:
+    """Test position changes within the deadband don't reach the state machine."""
+    entry = _entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    position = coordinator.get_xarm_model().position
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, "arm_x")
+
+    position.x = 250.0
+    coordinator.async_notify_changes({"position.x"})
+    assert float(hass.states.get(entity_id).state) == 250.0
+
+    position.x = 250.05
+    coordinator.async_notify_changes({"position.x"})
+    assert float(hass.states.get(entity_id).state) == 250.0
+    assert coordinator.publish_filters["x"].suppressed == 1
+
+    position.x = 251.0
+    coordinator.async_notify_changes({"position.x"})
+    assert float(hass.states.get(entity_id).state) == 251.0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
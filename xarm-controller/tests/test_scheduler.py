@@ -0,0 +1,46 @@
+"""Test the tiered polling schedule."""
+from importlib import import_module
+
+scheduler = import_module("custom_components.xarm-controller.scheduler")
+
+
+def test_groups_follow_their_own_interval():
+    """Test info is polled once, fast groups repeatedly, gripper on request."""
+    polls = scheduler.PollScheduler(
+        {"info": None, "state": 1.0, "position": 0.2, "gripper": None}
+    )
+    polls.start(0.0)
+    assert set(polls.due(0.0)) == {"info", "state", "position", "gripper"}
+
+    counts = {"info": 0, "state": 0, "position": 0, "gripper": 0}
+    now = 0.0
+    while now < 60.0:
+        now += polls.next_delay(now)
+        for group in polls.due(now):
+            counts[group] += 1
+    assert counts["info"] == 0
+    assert counts["gripper"] == 0
+    assert 59 <= counts["state"] <= 60
+    assert 299 <= counts["position"] <= 300
+
+    polls.request(now, "gripper")
+    assert "gripper" in polls.due(now)
+
+
+def test_idle_groups_back_off():
+    """Test polling backs off while idle and snaps back when active."""
+    polls = scheduler.PollScheduler(
+        {"state": 1.0, "position": 0.2}, {"state": 30.0, "position": 30.0}
+    )
+    polls.start(0.0)
+    polls.set_active(False, 0.0)
+
+    now = 0.0
+    for _ in range(20):
+        now += polls.next_delay(now)
+        polls.due(now)
+    assert polls.rate("position") == 1 / 30.0
+
+    assert polls.set_active(True, now)
+    assert polls.rate("position") == 5.0
+    assert polls.next_delay(now) <= 0.2
@@ -0,0 +1,223 @@
+"""Test the xArm controller services."""
+from importlib import import_module
+from unittest.mock import patch
+
+from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+import voluptuous as vol
+
+DOMAIN = "xarm-controller"
+simulator = import_module("custom_components.xarm-controller.simulator")
+
+
+@pytest.fixture
+async def entry(hass: HomeAssistant, xarm_integration) -> MockConfigEntry:
+    """Set up an entry backed by the simulator."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "simulator", CONF_NAME: "arm", ATTR_SERIAL_NUMBER: "arm"},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # The arm is connected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_move_trajectory_queues_every_pose(hass: HomeAssistant, entry) -> None:
+    """Test a trajectory is streamed as one command without waiting for the moves."""
+    client = hass.data[DOMAIN][entry.entry_id].xarm_client
+    poses = [
+        {"x": 250, "y": 0, "z": 150, "roll": -180, "pitch": 0, "yaw": 0},
+        {"x": 250, "y": 50, "z": 150},
+        {"x": 200, "y": 50, "z": 150},
+    ]
+
+    await hass.services.async_call(
+        DOMAIN,
+        "move_trajectory",
+        {"config_entry_id": entry.entry_id, "poses": poses, "speed": 1000, "radius": 10},
+        blocking=True,
+    )
+
+    # The service returns once the poses are queued, before the arm gets there.
+    assert client.get_is_moving()
+    assert client.cmd_num >= 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"poses": []},
+        {"poses": [{"x": 250, "y": 0}]},
+        {"poses": [{"x": 250, "y": 0, "z": 150, "roll": 270}]},
+        {"poses": [{"x": 250, "y": 0, "z": 150}], "speed": 0},
+    ],
+)
+async def test_move_trajectory_rejects_invalid_poses(hass: HomeAssistant, entry, data) -> None:
+    """Test invalid trajectories are refused before anything is sent to the arm."""
+    client = hass.data[DOMAIN][entry.entry_id].xarm_client
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN, "move_trajectory", {"config_entry_id": entry.entry_id, **data}, blocking=True
+        )
+    assert not client.get_is_moving()
+
+
+async def test_move_trajectory_flushes_the_poses_before_a_rejected_one(
+    hass: HomeAssistant, entry
+) -> None:
+    """Test a pose rejected mid-list doesn't leave the arm running a truncated path."""
+    client = hass.data[DOMAIN][entry.entry_id].xarm_client
+    set_position = simulator.SimulatedXArmAPI.set_position
+    calls = 0
+
+    def reject_third(self, **kwargs) -> int:
+        nonlocal calls
+        calls += 1
+        return simulator.CODE_NOT_READY if calls == 3 else set_position(self, **kwargs)
+
+    poses = [{"x": 250, "y": 0, "z": 150}, {"x": 250, "y": 200, "z": 150}, {"x": 200, "y": 0, "z": 150}]
+    with (
+        patch.object(simulator.SimulatedXArmAPI, "set_position", reject_third),
+        pytest.raises(HomeAssistantError, match="rejected pose 3 of 3"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "move_trajectory",
+            {"config_entry_id": entry.entry_id, "poses": poses, "speed": 10},
+            blocking=True,
+        )
+
+    assert not client.get_is_moving()
+    assert client.get_state() == (0, simulator.STATE_READY)
+    assert hass.data[DOMAIN][entry.entry_id].motion.pending["arm"] == 0
+
+
+async def test_move_trajectory_send_failure_drops_the_motion(hass: HomeAssistant, entry) -> None:
+    """Test a trajectory whose command raises leaves no motion pending."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    with (
+        patch.object(
+            simulator.SimulatedXArmAPI, "set_position", side_effect=ConnectionError("socket closed")
+        ),
+        pytest.raises(ConnectionError),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "move_trajectory",
+            {"config_entry_id": entry.entry_id, "poses": [{"x": 250, "y": 0, "z": 150}]},
+            blocking=True,
+        )
+
+    assert coordinator.motion.pending == {"arm": 0, "gripper": 0}
+
+
+async def test_move_trajectory_needs_a_loaded_arm(hass: HomeAssistant, entry) -> None:
+    """Test an unknown config entry is reported to the caller."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "move_trajectory",
+            {"config_entry_id": "unknown", "poses": [{"x": 250, "y": 0, "z": 150}]},
+            blocking=True,
+        )
+
+
+async def test_get_telemetry_returns_downsampled_history(hass: HomeAssistant, entry) -> None:
+    """Test the history recorded from the simulator's reports can be read back."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    for x in (250.0, 260.0):
+        coordinator.xarm_client.simulate_report(
+            "report_location", {"cartesian": [x, 0.0, 150.0, 180.0, 0.0, 0.0], "joints": [0.0] * 7}
+        )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_telemetry",
+        {"config_entry_id": entry.entry_id, "window": 3600, "duration": 60, "channels": ["x"]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["window"] == 3600
+    assert sum(bucket["count"] for bucket in response["buckets"]) >= 2
+    assert response["buckets"][-1]["x"]["max"] >= 260.0
+    assert set(response["buckets"][-1]) == {"start", "count", "x"}
+
+
+async def test_move_trajectory_waits_for_the_arm_with_a_timeout(hass: HomeAssistant, entry) -> None:
+    """Test a timeout makes the service return only once the arm reported it stopped."""
+    client = hass.data[DOMAIN][entry.entry_id].xarm_client
+
+    await hass.services.async_call(
+        DOMAIN,
+        "move_trajectory",
+        {
+            "config_entry_id": entry.entry_id,
+            "poses": [{"x": 250, "y": 0, "z": 150}, {"x": 250, "y": 20, "z": 150}],
+            "speed": 1000,
+            "timeout": 10,
+        },
+        blocking=True,
+    )
+
+    assert not client.get_is_moving()
+    assert hass.data[DOMAIN][entry.entry_id].motion.pending == {"arm": 0, "gripper": 0}
+
+
+async def test_move_trajectory_fails_when_the_timeout_passes(hass: HomeAssistant, entry) -> None:
+    """Test a motion outlasting the timeout fails the service call."""
+    with pytest.raises(HomeAssistantError, match="did not finish"):
+        await hass.services.async_call(
+            DOMAIN,
+            "move_trajectory",
+            {
+                "config_entry_id": entry.entry_id,
+                "poses": [{"x": 250, "y": 0, "z": 150}, {"x": 250, "y": 300, "z": 150}],
+                "speed": 10,
+                "timeout": 0.2,
+            },
+            blocking=True,
+        )
+
+
+async def test_move_gripper_returns_where_the_gripper_stopped(hass: HomeAssistant, entry) -> None:
+    """Test the gripper is followed to its target without an SDK wait."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "move_gripper",
+        {"config_entry_id": entry.entry_id, "position": 400, "timeout": 10},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert abs(response["position"] - 400) <= 2
+    assert coordinator.get_xarm_model().gripper.position == response["position"]
+    assert coordinator.motion.pending["gripper"] == 0
+
+
+async def test_move_gripper_rejection_drops_the_motion(hass: HomeAssistant, entry) -> None:
+    """Test a gripper position the arm rejects fails the call and leaves nothing pending."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    with (
+        patch.object(
+            simulator.SimulatedXArmAPI, "set_gripper_position", return_value=simulator.CODE_TIMEOUT
+        ),
+        pytest.raises(HomeAssistantError, match="rejected the gripper position"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "move_gripper",
+            {"config_entry_id": entry.entry_id, "position": 400, "timeout": 10},
+            blocking=True,
+        )
+
+    assert coordinator.motion.pending["gripper"] == 0
@@ -0,0 +1,62 @@
+"""Test the simulated xArm."""
+from importlib import import_module
+import time
+
+simulator = import_module("custom_components.xarm-controller.simulator")
+
+
+def test_moves_toward_target_over_time():
+    """Test moves take time and are reported through the location callback."""
+    arm = simulator.SimulatedXArmAPI(
+        config=simulator.SimulatorConfig(latency=0, jitter=0, report_rate=100)
+    )
+    reports = []
+    states = []
+    arm.register_report_location_callback(reports.append)
+    arm.register_state_changed_callback(states.append)
+
+    x, y, z = arm.position[:3]
+    assert arm.set_position(x=x + 20, speed=200) == 0
+    assert arm.state == simulator.STATE_MOVING
+    assert arm.position[0] < x + 20
+
+    assert arm.set_position(x=x + 40, speed=200, wait=True, timeout=2) == 0
+    assert arm.position[0] == x + 40
+    assert {"state": simulator.STATE_MOVING} in states
+    assert states[-1] == {"state": simulator.STATE_READY}
+    assert len(reports) > 5
+    arm.disconnect()
+
+
+def test_error_injection_and_latency():
+    """Test requests can fail and errors stop motion."""
+    arm = simulator.SimulatedXArmAPI(
+        config=simulator.SimulatorConfig(latency=0.02, jitter=0, error_rate=1.0)
+    )
+    started = time.monotonic()
+    assert arm.get_state()[0] == simulator.CODE_TIMEOUT
+    assert time.monotonic() - started >= 0.02
+
+    arm.config.error_rate = 0
+    arm.inject_error(31)
+    assert arm.has_error
+    assert arm.set_position(x=0) == simulator.CODE_NOT_READY
+    arm.disconnect()
+
+
+def test_gripper_fault_returns_a_bare_code():
+    """Test a gripper fault is returned the way the SDK does and read back by the model."""
+    models = import_module("custom_components.xarm-controller.models")
+    arm = simulator.SimulatedXArmAPI(config=simulator.SimulatorConfig(latency=0, jitter=0))
+    gripper = models.Gripper(arm, callback=None)
+
+    arm.inject_gripper_error(9)
+    assert arm.get_gripper_position() == 102
+    gripper.update()
+    assert gripper.error_code == 9
+
+    assert arm.clean_gripper_error() == 0
+    assert arm.get_gripper_position()[0] == 0
+    gripper.update()
+    assert gripper.error_code == 0
+    arm.disconnect()
@@ -0,0 +1,57 @@
+"""Test the telemetry ring buffer."""
+from importlib import import_module
+
+import pytest
+
+telemetry = import_module("custom_components.xarm-controller.telemetry")
+
+
+def _location(x: float) -> dict:
+    return {"cartesian": [x, 0.0, 100.0, 180.0, 0.0, 0.0], "joints": [x / 10] * 7}
+
+
+def test_memory_is_constant_and_oldest_samples_are_dropped():
+    """Test the buffer wraps around without growing."""
+    buffer = telemetry.TelemetryBuffer(capacity=10)
+    nbytes = buffer.nbytes
+
+    for second in range(25):
+        buffer.push(_location(float(second)), timestamp=1000.0 + second)
+
+    assert len(buffer) == 10
+    assert buffer.nbytes == nbytes
+    samples = list(buffer.samples())
+    assert [timestamp for timestamp, _ in samples] == [1015.0 + i for i in range(10)]
+    assert samples[-1][1]["x"] == 24.0
+    assert samples[-1][1]["joint1"] == pytest.approx(2.4)
+
+
+def test_temperatures_are_carried_into_the_next_samples():
+    """Test temperature reports don't store a sample on their own."""
+    buffer = telemetry.TelemetryBuffer(capacity=10)
+    buffer.push(_location(1.0), timestamp=1.0)
+    buffer.push({"temperatures": [40.0] * 7}, timestamp=1.5)
+    buffer.push(_location(2.0), timestamp=2.0)
+
+    (_, first), (_, second) = buffer.samples()
+    assert len(buffer) == 2
+    assert first["temperature1"] != first["temperature1"]  # NaN, nothing reported yet
+    assert second["temperature1"] == 40.0
+
+
+def test_downsample_to_windows():
+    """Test min/max/mean are computed per aligned window."""
+    buffer = telemetry.TelemetryBuffer(capacity=100)
+    for tenth in range(30):
+        buffer.push(_location(float(tenth)), timestamp=100.0 + tenth / 10)
+
+    buckets = buffer.downsample(1.0, channels=["x", "temperature1"])
+    assert [bucket["count"] for bucket in buckets] == [10, 10, 10]
+    assert buckets[0]["start"] == "1970-01-01T00:01:40+00:00"
+    assert buckets[1]["x"] == {"min": 10.0, "max": 19.0, "mean": 14.5}
+    assert buckets[1]["temperature1"] is None
+
+    recent = buffer.downsample(10.0, since=102.0, channels=["x"])
+    assert len(recent) == 1
+    assert recent[0]["count"] == 10
+    assert recent[0]["x"]["mean"] == 24.5